@@ -1,21 +1,44 @@
-from .tokenizers import (
-    AbstractTokenizer,
-    BaseTokenizer,
-    MultiwordTokenizer
-)
-
-from .lemmatizer import Lemmatizer
-
-from .pos_tagger import POSTagger
-
-from .dependency_parser import DependencyParser
-
-from .dependency_tree import TreeDrawer
-
-from .morphological_analyzer import MorphologicalAnalyzer
-
-from .morphological_feature import MorphologicalFeature
-
-from .conllu import ConlluData
-
-from .utils.conllu_io import read_conllu, write_conllu
+"""
+Top-level exports are resolved lazily (PEP 562), so ``import aksara`` stays
+cheap and each subsystem (torch, igraph, plotly, matplotlib, nltk, ...)
+is only imported when its class or function is first used.
+"""
+
+from importlib import import_module
+
+_LAZY_IMPORTS = {
+    'AbstractTokenizer': '.tokenizers',
+    'BaseTokenizer': '.tokenizers',
+    'MultiwordTokenizer': '.tokenizers',
+    'Lemmatizer': '.lemmatizer',
+    'POSTagger': '.pos_tagger',
+    'DependencyParser': '.dependency_parser',
+    'TreeDrawer': '.dependency_tree',
+    'MorphologicalAnalyzer': '.morphological_analyzer',
+    'MorphologicalFeature': '.morphological_feature',
+    'ConlluData': '.conllu',
+    'ParsedCorpus': '.conllu',
+    'read_conllu': '.utils.conllu_io',
+    'iter_conllu': '.utils.conllu_io',
+    'write_conllu': '.utils.conllu_io',
+    'build_conllu_index': '.utils.conllu_index',
+    'IndexedConllu': '.utils.conllu_index',
+    'write_conllu_npz': '.utils.conllu_npz',
+    'read_conllu_npz': '.utils.conllu_npz',
+    'SentenceCache': '.utils.sentence_cache',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
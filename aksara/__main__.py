@@ -1,4 +1,13 @@
+import sys
+
 from ._nlp_internal import _get_foma_script_path
 from ._nlp_internal.core import create_args_parser
 
-create_args_parser(_get_foma_script_path())
+# the guard keeps spawned worker processes (--n-jobs) from re-running the CLI
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["serve"]:
+        # pylint: disable=import-outside-toplevel
+        from ._nlp_internal.server import create_serve_args_parser
+        create_serve_args_parser(_get_foma_script_path(), sys.argv[2:])
+    else:
+        create_args_parser(_get_foma_script_path())
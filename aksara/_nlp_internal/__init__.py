@@ -1,26 +1,34 @@
-from .analyzer import (
-    BaseAnalyzer,
-)
-
-from .tokenizer import (
-    BaseTokenizer
-)
-
-from .formatter import (
-    to_conllu_line,
-    to_conllu_line_with_range,
-)
-
-from .core import (
-    analyze_sentence,
-    create_args_parser,
-    get_num_lines,
-)
-
-from .bin._get_foma_script_path import (
-    _get_foma_script_path
-)
-
-from .text_normalizer import (
-    TextNormalizer
-)
\ No newline at end of file
+"""
+Exports are resolved lazily (PEP 562) like the top-level ones of aksara,
+so importing one submodule, e.g. the tokenizer, doesn't import symspellpy
+or the analyzer with it.
+"""
+
+from importlib import import_module
+
+_LAZY_IMPORTS = {
+    'BaseAnalyzer': '.analyzer',
+    'BaseTokenizer': '.tokenizer',
+    'to_conllu_line': '.formatter',
+    'to_conllu_line_with_range': '.formatter',
+    'analyze_sentence': '.core',
+    'create_args_parser': '.core',
+    'get_num_lines': '.core',
+    '_get_foma_script_path': '.bin._get_foma_script_path',
+    'TextNormalizer': '.text_normalizer',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,23 +1,76 @@
 #!/usr/bin/python3
 
+import asyncio
 import os
 import re
 import stat
 import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
 from sys import platform
 from tempfile import NamedTemporaryFile
 
 
 # BIN_FILE = "bin/umabi@v1.0.3.bin"
 
+# foma queries remembered by a memoizing BaseAnalyzer, the least recently used are dropped
+MAX_MEMOIZED_LOOKUPS = 32768
+
+
+def run_lookups(steps, lookup):
+    """drives `steps`, a generator that yields foma queries, with a blocking `lookup`"""
+
+    try:
+        query = next(steps)
+        while True:
+            query = steps.send(lookup(query))
+    except StopIteration as stop:
+        return stop.value
+
+
+async def arun_lookups(steps, alookup):
+    """same as run_lookups, but awaits the coroutine function `alookup`"""
+
+    try:
+        query = next(steps)
+        while True:
+            query = steps.send(await alookup(query))
+    except StopIteration as stop:
+        return stop.value
+
 
 class BaseAnalyzer:
 
-    def __init__(self, bin_file, text_normalizer):
+    def __init__(self, bin_file, text_normalizer, memoize_lookups=False):
         self.__bin_file = bin_file
         self.__text_normalizer = text_normalizer
 
-    def __get_analysis(self, word):
+        # foma query -> Future (or asyncio Task) of its output in LRU order, None runs every query
+        self.__lookups = OrderedDict() if memoize_lookups else None
+        self.__alookups = OrderedDict() if memoize_lookups else None
+        self.__lock = threading.Lock()
+
+    def batch(self):
+        """a BaseAnalyzer for one batch of sentences, which runs foma once per distinct query
+
+        A foma query is a word variant (informal prefix and lowercased first
+        word included), its output doesn't depend on the sentence, so every
+        other occurrence of the variant in the batch reuses it. What depends
+        on the neighbors of a word, the normalization of an unknown informal
+        word, is still done per occurrence. At most MAX_MEMOIZED_LOOKUPS
+        queries are remembered, so a long stream of sentences keeps a bounded
+        memory. A memoizing analyzer shares its lookups already, it is its own
+        batch.
+        """
+
+        if self.__lookups is not None:
+            return self
+        return BaseAnalyzer(self.__bin_file, self.__text_normalizer, memoize_lookups=True)
+
+    @contextmanager
+    def __foma_script(self, word):
         auto_delate = True
         if platform == "win32":
             auto_delate = False
@@ -29,7 +82,7 @@ class BaseAnalyzer:
 
         os.chmod(temp_file.name, 777)
         temp_file.file.close()
-        out = subprocess.check_output(['foma', '-q', '-f', temp_file.name])
+        yield temp_file.name
 
         if platform == "win32":
             # temp file in windows is default to READ_ONLY
@@ -37,11 +90,76 @@ class BaseAnalyzer:
             os.chmod(temp_file.name, stat.S_IWRITE)
             os.unlink(temp_file.name)
 
+    def __get_analysis(self, word):
+        with self.__foma_script(word) as script:
+            out = subprocess.check_output(['foma', '-q', '-f', script])
+
+        return repr(out)[2:-1]
+
+    async def __aget_analysis(self, word):
+        with self.__foma_script(word) as script:
+            command = ['foma', '-q', '-f', script]
+            process = await asyncio.create_subprocess_exec(
+                *command, stdout=asyncio.subprocess.PIPE)
+            out, _ = await process.communicate()
+
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command, out)
+
         return repr(out)[2:-1]
 
+    def __lookup(self, word):
+        if self.__lookups is None:
+            return self.__get_analysis(word)
+
+        with self.__lock:
+            future = self.__lookups.get(word)
+            is_new = future is None
+            if is_new:
+                future = self.__lookups[word] = Future()
+                _drop_least_recent(self.__lookups)
+            else:
+                self.__lookups.move_to_end(word)
+
+        # concurrent occurrences of a new query wait for the first one instead of running foma
+        if is_new:
+            try:
+                future.set_result(self.__get_analysis(word))
+            except BaseException as error:
+                future.set_exception(error)
+                # the next occurrence runs the query again
+                with self.__lock:
+                    if self.__lookups.get(word) is future:
+                        del self.__lookups[word]
+                raise
+
+        return future.result()
+
+    async def __alookup(self, word):
+        if self.__alookups is None:
+            return await self.__aget_analysis(word)
+
+        task = self.__alookups.get(word)
+        if task is None or not _can_reuse(task):
+            task = self.__alookups[word] = asyncio.ensure_future(self.__aget_analysis(word))
+            _drop_least_recent(self.__alookups)
+        else:
+            self.__alookups.move_to_end(word)
+
+        # a cancelled occurrence must not cancel the lookup the other occurrences wait for
+        return await asyncio.shield(task)
+
     def analyze(self, word, *relations):
+        return run_lookups(self.__analyze(word, *relations), self.__lookup)
+
+    async def aanalyze(self, word, *relations):
+        """same as analyze, but foma runs in a non-blocking subprocess"""
+
+        return await arun_lookups(self.__analyze(word, *relations), self.__alookup)
+
+    def __analyze(self, word, *relations):
         # Get lemma from Foma
-        analysis = self.__get_analysis(word)
+        analysis = yield word
         analysis = analysis[:-2]  # Remove most right \n
 
         if ("@informal" == analysis[:9]):
@@ -52,10 +170,11 @@ class BaseAnalyzer:
             surface = word
             if (is_informal):
                 surface = word[9:]
-            analysis = self.__analyze_unknown(
+            analysis = yield from self.__analyze_unknown(
                 surface, is_informal,  *relations)
 
-        analysis = list(set(analysis.split("\\n")))
+        # drop duplicates but keep foma's order, so the result doesn't depend on the hash seed
+        analysis = list(dict.fromkeys(analysis.split("\\n")))
         return "\\n".join(analysis)
 
     def __trim_analysis(self, analysis):
@@ -82,8 +201,8 @@ class BaseAnalyzer:
         second_word = redup_search.group(3)
 
         # Get analysis for each word
-        first_word_analysis = self.__get_analysis(first_word)[:-2]
-        second_word_analysis = self.__get_analysis(second_word)[:-2]
+        first_word_analysis = (yield first_word)[:-2]
+        second_word_analysis = (yield second_word)[:-2]
 
         if first_word_analysis == "???":
             return "???"
@@ -121,7 +240,7 @@ class BaseAnalyzer:
         analysis = "???"
 
         if redup_pattern.match(surface):
-            analysis = self.__analyze_redup(surface)
+            analysis = yield from self.__analyze_redup(surface)
 
         if analysis != "???":
             return analysis
@@ -147,8 +266,7 @@ class BaseAnalyzer:
                         no_repetition_word += char
                         curr_char = char
 
-                analysis = self.__get_analysis(
-                    '@informal' + no_repetition_word)
+                analysis = yield '@informal' + no_repetition_word
                 analysis = analysis[:-2]  # Remove rightmost \n
 
                 temp_surface = analysis.split("+")[0]
@@ -157,7 +275,7 @@ class BaseAnalyzer:
 
             normalized = self.__text_normalizer.normalize_symspell(
                 surface, *relations)
-            analysis = self.__get_analysis('@informal' + normalized)
+            analysis = yield '@informal' + normalized
             analysis = analysis[:-2]  # Remove rightmost \n
 
             temp_surface = analysis.split("+")[0]
@@ -180,3 +298,15 @@ class BaseAnalyzer:
             tags = "+" + tags
 
         return tags
+
+
+def _drop_least_recent(lookups):
+    while len(lookups) > MAX_MEMOIZED_LOOKUPS:
+        lookups.popitem(last=False)
+
+
+def _can_reuse(task):
+    # a task of another event loop, e.g. of an earlier asyncio.run, may never finish in this one
+    if task.get_loop() is not asyncio.get_running_loop():
+        return False
+    return not task.done() or (not task.cancelled() and task.exception() is None)
@@ -0,0 +1,102 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_MAX_BATCH_SIZE = 16
+DEFAULT_MAX_WAIT = 0.005
+
+
+class ParseBatcher:
+    """
+    Coalesces concurrent parse requests into micro-batches.
+
+    A request waits at most `max_wait` seconds for others to join its batch,
+    a full batch of `max_batch_size` is sent right away. Every batch is parsed
+    by one job on a single parser thread, so concurrent requests never compete
+    for torch and the event loop only wakes up once per batch. Sentences are
+    still parsed one at a time inside the batch, which keeps every result
+    identical to the blocking API.
+    """
+
+    def __init__(self, max_batch_size=DEFAULT_MAX_BATCH_SIZE, max_wait=DEFAULT_MAX_WAIT):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, but {max_batch_size} was given")
+        if max_wait < 0:
+            raise ValueError(f"max_wait must not be negative, but {max_wait} was given")
+
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.__executor = None
+        # number of batches sent to the parser thread and the requests in them
+        self.n_batches = 0
+        self.n_requests = 0
+        # pending requests and flush timer of every running event loop
+        self.__pending = {}
+
+    async def parse(self, rows, dependency_parser, **kwargs):
+        """resolves to parse_tokens(rows, dependency_parser, **kwargs)"""
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        requests, timer = self.__pending.get(loop, ([], None))
+        requests.append((rows, dependency_parser, kwargs, future))
+
+        if len(requests) >= self.max_batch_size:
+            self.__flush(loop)
+        elif timer is None:
+            self.__pending[loop] = (requests, loop.call_later(self.max_wait, self.__flush, loop))
+        else:
+            self.__pending[loop] = (requests, timer)
+
+        return await future
+
+    def __flush(self, loop):
+        requests, timer = self.__pending.pop(loop, ([], None))
+        if timer is not None:
+            timer.cancel()
+        if not requests:
+            return
+
+        self.n_batches += 1
+        self.n_requests += len(requests)
+
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aksara-parser")
+
+        batch = loop.run_in_executor(
+            self.__executor, _parse_batch, [request[:3] for request in requests]
+        )
+        batch.add_done_callback(
+            lambda done: _set_results([request[3] for request in requests], done)
+        )
+
+
+def _parse_batch(requests):
+    # pylint: disable=import-outside-toplevel
+    from .core import parse_tokens
+
+    results = []
+    for rows, dependency_parser, kwargs in requests:
+        try:
+            results.append((True, parse_tokens(rows, dependency_parser, **kwargs)))
+        except Exception as error:  # pylint: disable=broad-except
+            results.append((False, error))
+
+    return results
+
+
+def _set_results(futures, batch):
+    if batch.cancelled():
+        results = [(False, asyncio.CancelledError())] * len(futures)
+    elif batch.exception() is not None:
+        results = [(False, batch.exception())] * len(futures)
+    else:
+        results = batch.result()
+
+    for future, (is_ok, value) in zip(futures, results):
+        if future.done():
+            continue
+        if is_ok:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
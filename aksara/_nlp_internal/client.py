@@ -0,0 +1,99 @@
+import json
+import socket
+from itertools import count, islice
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# sentences sent per request by AksaraClient.iter_analyze
+DEFAULT_CHUNK_SIZE = 64
+
+
+def parse_address(address):
+    """returns (host, port) for 'host:port' or ':port', and the path for 'unix:path'"""
+
+    if address.startswith("unix:"):
+        return address[len("unix:"):]
+
+    host, _, port = address.rpartition(":")
+    try:
+        return (host or DEFAULT_HOST, int(port))
+    except ValueError as error:
+        raise ValueError(
+            f"server address must be 'host:port' or 'unix:path', but {address} was given"
+        ) from error
+
+
+class ServerError(RuntimeError):
+    """an error reported by the aksara server for one request"""
+
+
+class AksaraClient:
+    """
+    Blocking client of `python -m aksara serve`
+
+    Every request is one JSON object per line, the server answers with one
+    JSON object per line. The connection is opened on the first request and
+    kept open until `close`
+    """
+
+    def __init__(self, address=f"{DEFAULT_HOST}:{DEFAULT_PORT}", timeout=None):
+        self.address = parse_address(address)
+        self.timeout = timeout
+        self.__ids = count(1)
+        self.__socket = None
+        self.__file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        if self.__socket is not None:
+            self.__file.close()
+            self.__socket.close()
+            self.__socket = None
+            self.__file = None
+
+    def request(self, op, **params):
+        """sends `op` with `params` and returns its result, raises ServerError on failure"""
+
+        if self.__socket is None:
+            self.__connect()
+
+        request_id = next(self.__ids)
+        message = json.dumps({"id": request_id, "op": op, **params}, ensure_ascii=False)
+        self.__file.write(message + "\n")
+        self.__file.flush()
+
+        line = self.__file.readline()
+        if not line:
+            self.close()
+            raise ConnectionError("the aksara server closed the connection")
+
+        response = json.loads(line)
+        if not response["ok"]:
+            raise ServerError(response["error"])
+
+        return response["result"]
+
+    def iter_analyze(self, sentences, chunk_size=DEFAULT_CHUNK_SIZE, **flags):
+        """yields the CLI output of every sentence, `chunk_size` sentences per request"""
+
+        sentences = iter(sentences)
+        chunk = list(islice(sentences, chunk_size))
+        while chunk:
+            yield from self.request("analyze", sentences=chunk, **flags)
+            chunk = list(islice(sentences, chunk_size))
+
+    def __connect(self):
+        if isinstance(self.address, str):
+            self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.__socket.settimeout(self.timeout)
+            self.__socket.connect(self.address)
+        else:
+            self.__socket = socket.create_connection(self.address, timeout=self.timeout)
+
+        self.__file = self.__socket.makefile("rw", encoding="utf-8", newline="\n")
@@ -1,40 +1,23 @@
 #!/usr/bin/python3
 import argparse
-import mmap
+import asyncio
 import re
-from tempfile import NamedTemporaryFile
-
-from tqdm import tqdm
-
-from .tokenizer import (
-    BaseTokenizer,
-)
-
-from .formatter import (
-    to_conllu_line,
-    to_conllu_line_with_range,
-)
-
-from .analyzer import (
-    BaseAnalyzer,
-)
-
-from .parser import (
-    parse,
-)
-
-from .disambiguator import (
-    Disambiguator
-)
-
-from .dependency_parsing.core import DependencyParser
-
-from .analyzer import BaseAnalyzer
-from .disambiguator import Disambiguator
-from .formatter import to_conllu_line, to_conllu_line_with_range
-from .parser import parse
-from .text_normalizer import TextNormalizer
+import sys
+import threading
+from functools import lru_cache, partial
+from itertools import tee
+
+from .analyzer import BaseAnalyzer, arun_lookups, run_lookups
+from .formatter import to_range_token, to_token
+from .pipeline import check_stage_workers, pipeline_map
+from .sentence import Token, to_conllu_lines
 from .tokenizer import BaseTokenizer
+from ..utils.compression import _open_text
+from ..utils.progress import TqdmProgress
+from ..utils.sentence_util import _split_stream
+
+# what cached_pipeline_map does with a sentence
+_NEW, _CACHED, _DUPLICATE = range(3)
 
 HEADER = """# sent_id = {}
 # text = {}
@@ -48,20 +31,270 @@ HELP_MSG = {
     'postag': 'only output POS tagging result',
     'informal': 'to use informal rule beside the formal rule',
     'model': 'set dependency parser model (default: FR_GSD-ID_CSUI)',
+    'n_jobs': 'number of worker processes, -1 uses all CPU cores (default: 1)',
+    'stage_workers': 'run analysis, disambiguation and parsing as a pipeline with '
+                     'this many threads each, e.g. 4,1,1',
+    'server': 'send the sentences to a running `python -m aksara serve` at host:port '
+              'or unix:path instead of loading the models',
+    'compression': 'codec of the input and output files, infer picks it from the '
+                   'extension (.gz, .bz2, .xz) (default: infer)',
+    'cache_size': 'keep the analysis of up to this many sentences in memory, so '
+                  'duplicate sentences are analyzed once (default: 0)',
+    'cache_dir': 'also store every analyzed sentence in this directory, where '
+                 'later runs find it again',
 }
 
+CLI_COMPRESSIONS = ['infer', 'none', 'gzip', 'bz2', 'xz']
+
 base_tokenizer = BaseTokenizer()
-disambiguator = Disambiguator()
-text_normalizer = TextNormalizer()
 
 
-def analyze_sentence(text, analyzer, dependency_parser, **kwargs):
+@lru_cache(maxsize=None)
+def get_disambiguator():
+    """shared Disambiguator, the HMM is trained on first use"""
+
+    # pylint: disable=import-outside-toplevel
+    from .disambiguator import Disambiguator
+    return Disambiguator()
+
+
+@lru_cache(maxsize=None)
+def get_text_normalizer():
+    """shared TextNormalizer, the SymSpell dictionary is built on first use"""
+
+    # pylint: disable=import-outside-toplevel
+    from .text_normalizer import TextNormalizer
+    return TextNormalizer()
+
+
+def analyze_sentence(text, analyzer, dependency_parser, cache=None, **kwargs):
+    """the command line output of one sentence"""
+
+    tokens = analyze_sentence_tokens(text, analyzer, dependency_parser, cache, **kwargs)
+    return format_tokens(tokens, **kwargs)
+
+
+def analyze_sentence_tokens(text, analyzer, dependency_parser, cache=None, **kwargs):
+    """analyzes, disambiguates and parses one sentence, returns its list of Token
+
+    With a SentenceCache `cache`, a sentence analyzed before with the same
+    options is taken from the cache and skips all three stages
+    """
+
+    if cache is not None:
+        key = cache_key(cache, text, dependency_parser, **kwargs)
+        tokens = cache.get(key)
+        if tokens is None:
+            tokens = analyze_sentence_tokens(text, analyzer, dependency_parser, **kwargs)
+            cache.put(key, tokens)
+        return tokens
+
+    tokens = analyze_tokens(text, analyzer, kwargs["informal"])
+    tokens = disambiguate_tokens(tokens, kwargs["v1"])
+    return parse_tokens(tokens, dependency_parser, **kwargs)
+
+
+def analyze_sentences(texts, analyzer, dependency_parser, stage_workers=None, cache=None,
+                      **kwargs):
+    """analyze_sentence_tokens on every text of `texts`, the results are yielded in order
+
+    With `stage_workers` = (analysis, disambiguation, parsing) the three stages
+    of analyze_sentence run concurrently with that many threads each, so the
+    FST lookups of the next sentences overlap the parsing of the current one
+    """
+
+    analyzer = batch_analyzer(analyzer)
+    if stage_workers is None:
+        return (
+            analyze_sentence_tokens(text, analyzer, dependency_parser, cache, **kwargs)
+            for text in texts
+        )
+
+    analysis_workers, disambiguation_workers, parsing_workers = check_stage_workers(stage_workers)
+    stages = [
+        partial(analyze_tokens, analyzer=analyzer, informal=kwargs["informal"]),
+        partial(disambiguate_tokens, v1=kwargs["v1"]),
+        partial(parse_tokens, dependency_parser=dependency_parser, **kwargs),
+    ]
+    workers = [analysis_workers, disambiguation_workers, parsing_workers]
+    if cache is not None:
+        get_key = partial(cache_key, cache, dependency_parser=dependency_parser, **kwargs)
+        return cached_pipeline_map(texts, stages, workers, get_key, cache)
+
+    return pipeline_map(texts, list(zip(stages, workers)))
+
+
+def batch_analyzer(analyzer):
+    """`analyzer` with its foma lookups shared by a batch of sentences, see BaseAnalyzer.batch
+
+    so a batch costs one lookup per distinct word variant, even when none of
+    its sentences is in a SentenceCache
+    """
+
+    if isinstance(analyzer, BaseAnalyzer):
+        return analyzer.batch()
+    return analyzer
+
+
+def cache_key(cache, text, dependency_parser, **kwargs):
+    """the key of `text` in a SentenceCache, for these analysis options"""
+
+    model = getattr(dependency_parser, "model_name", None)
+    return cache.key(text, model, kwargs["informal"], kwargs["v1"])
+
+
+def cached_pipeline_map(texts, stages, workers, get_key, cache):
+    """pipeline_map of the analysis stages, where a sentence found in `cache` skips them
+
+    A sentence whose duplicate is still in the pipeline is not analyzed again
+    either, it passes through and gets a copy of the result of the duplicate
+    """
+
+    # key -> number of duplicates that wait for the sentence in the pipeline
+    in_flight = {}
+    lock = threading.Lock()
+    first, *middle, last = stages
+
+    def run_first(text):
+        key = get_key(text)
+        with lock:
+            if key in in_flight:
+                in_flight[key] += 1
+                return key, None, _DUPLICATE
+            tokens = cache.get(key)
+            if tokens is not None:
+                return key, tokens, _CACHED
+            in_flight[key] = 0
+        return key, first(text), _NEW
+
+    def run_middle(stage, item):
+        key, tokens, state = item
+        return (key, stage(tokens), state) if state is _NEW else item
+
+    def run_last(item):
+        key, tokens, state = item
+        if state is _NEW:
+            tokens = last(tokens)
+            cache.put(key, tokens)
+        return key, tokens, state
+
+    stages = [run_first, *(partial(run_middle, stage) for stage in middle), run_last]
+    results = pipeline_map(texts, list(zip(stages, workers)))
+
+    # the results are in input order, so a sentence comes out before its duplicates
+    waiting = {}
+    for key, tokens, state in results:
+        if state is _NEW:
+            with lock:
+                n_duplicates = in_flight.pop(key)
+            if n_duplicates:
+                waiting[key] = [tokens, n_duplicates]
+        elif state is _DUPLICATE:
+            entry = waiting[key]
+            tokens = copy_tokens(entry[0])
+            entry[1] -= 1
+            if entry[1] == 0:
+                del waiting[key]
+        yield tokens
+
+
+def copy_tokens(tokens):
+    return [Token.from_fields(token.fields()) for token in tokens]
+
+
+async def aanalyze_sentence(text, analyzer, dependency_parser, parse_batcher, cache=None,
+                            **kwargs):
+    """analyze_sentence_tokens without blocking the event loop
+
+    foma runs as a non-blocking subprocess, the HMM runs on the default executor
+    and the parse is coalesced with other concurrent requests by `parse_batcher`
+    """
+
+    if cache is not None:
+        key = cache_key(cache, text, dependency_parser, **kwargs)
+        tokens = cache.get(key)
+        if tokens is None:
+            tokens = await aanalyze_sentence(
+                text, analyzer, dependency_parser, parse_batcher, **kwargs
+            )
+            cache.put(key, tokens)
+        return tokens
+
+    tokens = await aanalyze_tokens(text, analyzer, kwargs["informal"])
+    tokens = await asyncio.get_running_loop().run_in_executor(
+        None, disambiguate_tokens, tokens, kwargs["v1"]
+    )
+    return await parse_batcher.parse(tokens, dependency_parser, **kwargs)
+
+
+async def aanalyze_sentences(
+        texts, analyzer, dependency_parser, parse_batcher, max_concurrency=8, cache=None,
+        **kwargs
+):
+    """aanalyze_sentence on every text of `texts` concurrently, returns the results in order"""
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    analyzer = batch_analyzer(analyzer)
+
+    async def analyze_one(text):
+        async with semaphore:
+            return await aanalyze_sentence(
+                text, analyzer, dependency_parser, parse_batcher, cache, **kwargs
+            )
+
+    if cache is None:
+        return await asyncio.gather(*(analyze_one(text) for text in texts))
+
+    # duplicates are analyzed concurrently, so they are merged before the cache sees them
+    keys = [cache_key(cache, text, dependency_parser, **kwargs) for text in texts]
+    unique_texts = dict(zip(reversed(keys), reversed(texts)))
+    results = dict(zip(
+        unique_texts, await asyncio.gather(*(analyze_one(text) for text in unique_texts.values()))
+    ))
+
+    analyzed = []
+    seen = set()
+    for key in keys:
+        analyzed.append(copy_tokens(results[key]) if key in seen else results[key])
+        seen.add(key)
+    return analyzed
+
+
+def analyze_tokens(text, analyzer, informal):
+    """tokenizes `text` and analyzes every token with foma, returns a list of Token"""
+
+    return run_lookups(
+        _analyze_tokens(text, informal), lambda request: analyzer.analyze(*request)
+    )
+
+
+async def aanalyze_tokens(text, analyzer, informal):
+    """analyze_tokens with the foma lookups awaited instead of blocking"""
+
+    return await arun_lookups(
+        _analyze_tokens(text, informal), lambda request: analyzer.aanalyze(*request)
+    )
+
+
+def analyze_word_tokens(word, analyzer, informal):
+    """analyze_tokens of one word taken as a single token, `word` is not tokenized
+
+    the word is analyzed without a sentence around it, like the first word of a sentence
+    """
+
+    return run_lookups(
+        _analyze_surface([word], [False], informal), lambda request: analyzer.analyze(*request)
+    )
+
+
+def _analyze_tokens(text, informal):
+    # yields the arguments of every analyzer lookup and receives its analysis
     surface, SANflags = base_tokenizer.tokenize(text)
-    tokens = surface[:]
-    flag = dict()
+    return (yield from _analyze_surface(surface, SANflags, informal))
 
-    for key, value in kwargs.items():
-        flag[key] = value
+
+def _analyze_surface(surface, SANflags, informal):
+    tokens = surface[:]
 
     # lowercase first word
     word_pattern = re.compile(r"[^\w\s+]")
@@ -76,10 +309,10 @@ def analyze_sentence(text, analyzer, dependency_parser, **kwargs):
         if i == first_word_idx:
             temp = token.lower()
 
-        if flag["informal"]:
+        if informal:
             temp = "@informal" + temp
 
-        analysis = analyzer.analyze(
+        analysis = yield (
             temp,
             lemma[i-2].split("+")[0] if i-2 >= 0 else "",
             lemma[i-1].split("+")[0] if i-1 >= 0 else "",
@@ -87,7 +320,7 @@ def analyze_sentence(text, analyzer, dependency_parser, **kwargs):
             tokens[i+2].lower() if i+2 < len(tokens) else "",
         )
         if i == first_word_idx and re.match(r'([A-Za-z]+)(\+X)', analysis):
-            analysis = analyzer.analyze(
+            analysis = yield (
                 token,
                 lemma[i-2].split("+")[0] if i-2 >= 0 else "",
                 lemma[i-1].split("+")[0] if i-1 >= 0 else "",
@@ -97,7 +330,7 @@ def analyze_sentence(text, analyzer, dependency_parser, **kwargs):
 
         lemma.append(analysis)
 
-    rows = []
+    sentence = []
     line_id = 1
 
     for i in range(len(tokens)):
@@ -137,35 +370,50 @@ def analyze_sentence(text, analyzer, dependency_parser, **kwargs):
         # Add full word line, if splitted
         n_tokens = len(temp_surface)
         if n_tokens > 1:
-            new_row = to_conllu_line_with_range(line_id, surface[i], n_tokens)
-            rows.append(new_row)
+            sentence.append(to_range_token(line_id, surface[i], n_tokens))
 
         # Add word line(s)
         for j in range(n_tokens):
-            new_row = ""
             if j == n_tokens - 1:
-                new_row = to_conllu_line(
+                token = to_token(
                     line_id, temp_surface[j], temp_lemma[j], space_after=SANflags[i])
             else:
-                new_row = to_conllu_line(
+                token = to_token(
                     line_id, temp_surface[j], temp_lemma[j])
-            rows.append(new_row)
+            sentence.append(token)
             line_id += 1
 
-    parsed_rows = parse(rows)
-    if flag["v1"]:
-        parsed_rows = dependency_parser.parse_rows(parsed_rows)
-        if flag["lemma"] or flag["postag"]:
-            return '\n'.join(get_lemma_or_postag(parsed_rows, flag["lemma"], flag["postag"]))
-        else:
-            return '\n'.join(rows)
-    else:
-        disambiguated_rows = disambiguator.disambiguate(parsed_rows)
-        disambiguated_rows = dependency_parser.parse_rows(disambiguated_rows)
-        if flag["lemma"] or flag["postag"]:
-            return '\n'.join(get_lemma_or_postag(disambiguated_rows, flag["lemma"], flag["postag"]))
-        else:
-            return '\n'.join(['\t'.join(row) for row in disambiguated_rows])
+    return sentence
+
+
+def disambiguate_tokens(tokens, v1):
+    """picks one analysis per token with the HMM, in place, v1 keeps every analysis"""
+
+    if v1:
+        return tokens
+
+    return get_disambiguator().disambiguate(tokens)
+
+
+def parse_tokens(tokens, dependency_parser, **kwargs):
+    """sets the head and deprel of the tokens with the dependency parser, in place
+
+    The v1 output never contains the parse, so v1 tokens are returned as they are
+    """
+
+    if kwargs["v1"]:
+        return tokens
+
+    return dependency_parser.parse_rows(tokens)
+
+
+def format_tokens(tokens, **kwargs):
+    """serializes the tokens of one sentence as the command line prints them"""
+
+    if kwargs["lemma"] or kwargs["postag"]:
+        return '\n'.join(get_lemma_or_postag(tokens, kwargs["lemma"], kwargs["postag"]))
+
+    return to_conllu_lines(tokens)
 
 
 def create_args_parser(bin_file):
@@ -177,12 +425,13 @@ def create_args_parser(bin_file):
     input_group.add_argument(
         "-s", "--string", type=str, help=HELP_MSG['string'])
     input_group.add_argument(
-        "-f", "--file", type=argparse.FileType('r'), help="input file")
+        "-f", "--file", type=str, help=HELP_MSG['file'])
 
     # Add optional arguments
-    # open in 'write' mode and and specify encoding
-    parser.add_argument(
-        '--output', type=argparse.FileType('w', encoding='UTF-8'), help="")
+    # the files are opened after parsing, once the codec of --compression is known
+    parser.add_argument('--output', type=str, help=HELP_MSG['output'])
+    parser.add_argument('--compression', choices=CLI_COMPRESSIONS, default='infer',
+                        help=HELP_MSG['compression'])
     parser.add_argument('--v1', action='store_true')
     parser.add_argument('--lemma', action='store_true', help=HELP_MSG['lemma'])
     parser.add_argument('--postag', action='store_true',
@@ -190,81 +439,178 @@ def create_args_parser(bin_file):
     parser.add_argument('--informal', action='store_true',
                         help=HELP_MSG['informal'])
     parser.add_argument('--model', type=str, help=HELP_MSG['model'])
+    parser.add_argument('-j', '--n-jobs', type=int, default=1, help=HELP_MSG['n_jobs'])
+    parser.add_argument('--stage-workers', type=parse_stage_workers,
+                        help=HELP_MSG['stage_workers'])
+    parser.add_argument('--server', type=str, help=HELP_MSG['server'])
+    parser.add_argument('--cache-size', type=int, default=0, help=HELP_MSG['cache_size'])
+    parser.add_argument('--cache-dir', type=str, help=HELP_MSG['cache_dir'])
 
     args = parser.parse_args()
-    analyzer = BaseAnalyzer(bin_file, text_normalizer)
-    if args.model:
-        dependency_parser = DependencyParser(args.model)
-    else:
-        dependency_parser = DependencyParser()
 
-    output = ""
-    if args.file:
-        with args.file as infile:
-            print("Processing inputs...")
-            tqdm_setup = tqdm(
-                infile,
-                total=get_num_lines(infile.name),
-                bar_format='{l_bar}{bar:50}{r_bar}{bar:-10b}'
+    # pylint: disable=import-outside-toplevel
+    from ..utils.parallel import _check_n_jobs, _parallel_map
+
+    try:
+        n_jobs = _check_n_jobs(args.n_jobs)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if n_jobs > 1 and args.stage_workers:
+        parser.error("--stage-workers can not be combined with --n-jobs")
+
+    if args.server and (n_jobs > 1 or args.stage_workers):
+        parser.error("--server can not be combined with --n-jobs or --stage-workers")
+
+    cache = None
+    if args.cache_size or args.cache_dir:
+        if args.server:
+            parser.error("--cache-size and --cache-dir are options of the server")
+
+        # pylint: disable=import-outside-toplevel
+        from ..utils.sentence_cache import SentenceCache
+
+        try:
+            cache = SentenceCache(args.cache_size, args.cache_dir)
+        except ValueError as error:
+            parser.error(str(error))
+
+    compression = None if args.compression == 'none' else args.compression
+    # the progress bar follows the bytes read, the file is never scanned up front
+    progress = TqdmProgress() if args.file and args.file != '-' else None
+    input_file = open_cli_file(parser, args.file, 'r', compression, progress) \
+        if args.file else None
+    output_file = open_cli_file(parser, args.output, 'w', compression) if args.output else None
+
+    flags = {
+        'v1': args.v1, 'lemma': args.lemma,
+        'postag': args.postag, 'informal': args.informal,
+    }
+    sentence_analyzer = partial(get_sentence_analyzer, bin_file, args.model, flags, cache)
+
+    if input_file:
+        print("Processing inputs...")
+        # read in chunks, a line may be huge
+        sentences = _split_stream(input_file)
+    else:
+        sentences = iter(split_sentence(args.string))
+
+    sentences, to_analyze = tee(sentences)
+    if args.server:
+        # pylint: disable=import-outside-toplevel
+        from .client import AksaraClient
+
+        client = AksaraClient(args.server)
+        results = client.iter_analyze(to_analyze, model=args.model, **flags)
+    elif n_jobs == 1:
+        analyzer, dependency_parser = get_analyzer_and_parser(bin_file, args.model)
+        results = map(
+            partial(format_tokens, **flags),
+            analyze_sentences(
+                to_analyze, analyzer, dependency_parser, args.stage_workers, cache, **flags
             )
-            idx_sentence = 1
-            for i, line in enumerate(tqdm_setup, 1):
-                text = line.rstrip()
-                temp = re.split(r'([.!?]+[\s])', text)
-                sentences = []
-                for i in range(len(temp)):
-                    if (i % 2 == 0):
-                        sentences.append(
-                            temp[i] + (temp[i + 1] if i != len(temp) - 1 else ""))
-
-                for j in range(len(sentences)):
-                    temp = analyze_sentence(sentences[j], analyzer, dependency_parser, v1=args.v1,
-                                            lemma=args.lemma, postag=args.postag, informal=args.informal)
-                    output += HEADER.format(str(idx_sentence),
-                                            sentences[j], '')
-                    output += temp + '\n\n'
-                    idx_sentence += 1
+        )
     else:
-        text = args.string
-        temp = re.split(r'([.!?]+[\s])', text)
-        sentences = []
-        for i in range(len(temp)):
-            if (i % 2 == 0):
-                sentences.append(
-                    temp[i] + (temp[i + 1] if i != len(temp) - 1 else ""))
-
-        for i in range(len(sentences)):
-            output += HEADER.format(str(i + 1), sentences[i], '')
-            output += analyze_sentence(sentences[i], analyzer, dependency_parser,
-                                       v1=args.v1, lemma=args.lemma, postag=args.postag, informal=args.informal)
-            output += '\n\n'
-        # output += '\n'.join(output)
+        # every worker loads its own analyzer and parser, the output order is kept
+        results = _parallel_map(sentence_analyzer, to_analyze, n_jobs)
+
+    output = ""
+    for idx_sentence, (sentence, result) in enumerate(zip(sentences, results), 1):
+        output += HEADER.format(str(idx_sentence), sentence, '')
+        output += result + '\n\n'
+
+    if input_file and input_file is not sys.stdin:
+        input_file.close()
+    if progress is not None:
+        progress.close()
+    if args.server:
+        client.close()
 
     output = output.rstrip()
-    if args.output:
-        args.output.writelines(output)
+    if output_file:
+        output_file.writelines(output)
+        if output_file is not sys.stdout:
+            output_file.close()
     else:
         print(output)
 
 
+def open_cli_file(parser, file_path, mode, compression, progress=None):
+    """opens --file or --output like argparse.FileType, '-' is stdin or stdout"""
+
+    if file_path == '-':
+        return sys.stdin if 'r' in mode else sys.stdout
+
+    try:
+        return _open_text(file_path, mode, compression, progress=progress)
+    except OSError as error:
+        parser.error(f"can't open '{file_path}': {error}")
+
+
+def split_sentence(text):
+    temp = re.split(r'([.!?]+[\s])', text)
+    sentences = []
+    for i in range(len(temp)):
+        if (i % 2 == 0):
+            sentences.append(
+                temp[i] + (temp[i + 1] if i != len(temp) - 1 else ""))
+    return sentences
+
+
+def parse_stage_workers(value):
+    try:
+        return check_stage_workers(int(n) for n in value.split(','))
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from error
+
+
+def get_analyzer_and_parser(bin_file, model):
+    # pylint: disable=import-outside-toplevel
+    from .dependency_parsing.core import DependencyParser
+
+    analyzer = BaseAnalyzer(bin_file, get_text_normalizer())
+    if model:
+        dependency_parser = DependencyParser(model)
+    else:
+        dependency_parser = DependencyParser()
+
+    return analyzer, dependency_parser
+
+
+def get_sentence_analyzer(bin_file, model, flags, cache=None):
+    """builds an analyzer and a dependency parser, returns analyze_sentence bound to them"""
+
+    analyzer, dependency_parser = get_analyzer_and_parser(bin_file, model)
+    return partial(
+        analyze_sentence, analyzer=analyzer, dependency_parser=dependency_parser, cache=cache,
+        **flags
+    )
+
+
 def get_num_lines(file_path):
-    fp = open(file_path, "r+", encoding="utf-8")
-    buf = mmap.mmap(fp.fileno(), 0)
+    """number of lines of a file, counted in 1 MiB binary chunks"""
+
     lines = 0
-    while buf.readline():
+    last_chunk = b""
+    with open(file_path, "rb") as fp:
+        for chunk in iter(partial(fp.read, 1 << 20), b""):
+            lines += chunk.count(b"\n")
+            last_chunk = chunk
+
+    # the last line may not end with a newline
+    if last_chunk and not last_chunk.endswith(b"\n"):
         lines += 1
-    fp.close()
     return lines
 
 
 def get_lemma_or_postag(rows, lemma, postag):
     new_rows = []
     for row in rows:
-        temp = [row[0], row[1]]
+        temp = [row.idx, row.form]
         if lemma:
-            temp.append(row[2])
+            temp.append(row.lemma)
         if postag:
-            temp.append(row[3])
+            temp.append(row.upos)
         new_rows.append(temp)
 
     return ["\t".join(row) for row in new_rows]
@@ -29,6 +29,7 @@ class DependencyParser:
             file_handle.close()
             return arguments['args'], arguments['kwargs']
         
+        self.model_name = model_name
         self.model_path = os.path.join(model_dir, model_name)
         self.model_path += '.pt'
         arg_path = self.model_path + '.arg.json'
@@ -42,16 +43,17 @@ class DependencyParser:
         self.model.load_state_dict(torch.load(self.model_path))
     
     def parse_rows(self, rows):
-        modified_rows = rows.copy()
+        """sets the head and deprel of every word Token of `rows`, in place"""
+
         heads_pred, types_pred = self.predict(rows)
         
         i = 1
-        for row in modified_rows:
-            if (row[0].isnumeric()):
-                row[6] = str(heads_pred[i])
-                row[7] = self.type_alphabet.get_instance(types_pred[i])
+        for row in rows:
+            if row.is_word():
+                row.head = str(heads_pred[i])
+                row.deprel = self.type_alphabet.get_instance(types_pred[i])
                 i += 1
-        return modified_rows
+        return rows
 
     def predict(self, rows):
         self.model.cpu()
@@ -76,8 +78,8 @@ class DependencyParser:
         max_char_len = 0
 
         for row in rows:
-            if max_char_len < len(row[1]):
-                max_char_len = len(row[1])
+            if max_char_len < len(row.form):
+                max_char_len = len(row.form)
 
         words.append(self.word_alphabet.get_index(ROOT))
         temp_char = [self.char_alphabet.get_index(ROOT_CHAR)]
@@ -87,15 +89,15 @@ class DependencyParser:
         postags.append(self.pos_alphabet.get_index(ROOT_POS))
 
         for row in rows:
-            if(row[0].isnumeric()):
-                words.append(get_word_index_with_spec(self.word_alphabet, row[1], 'id'))
+            if row.is_word():
+                words.append(get_word_index_with_spec(self.word_alphabet, row.form, 'id'))
                 temp_char = []
-                for char in row[1]:
+                for char in row.form:
                     temp_char.append(self.char_alphabet.get_index(char))
-                for padding in range(max_char_len - len(row[1])):
+                for padding in range(max_char_len - len(row.form)):
                     temp_char.append(1)
                 chars.append(temp_char)
-                postags.append(self.pos_alphabet.get_index(row[3]))
+                postags.append(self.pos_alphabet.get_index(row.upos))
         
         return torch.tensor([words]), torch.tensor([chars]), torch.tensor([postags])
 
@@ -1,6 +1,8 @@
 import os
 import nltk
 
+from .hmmtrain import HMMTrain
+
 
 class HMMLearn:
 
@@ -14,59 +16,31 @@ class HMMLearn:
         'SYM', 'PROPN',
     ]
 
-    def __init__(self, train_file=os.path.join("etc", "dataset", "preprocessed.txt"), trigram=False):
-        self.trigram = trigram
-        word_tags = []
-
-        train_file = os.path.join(
-            os.path.dirname(__file__),
-            '..',
-            train_file)
+    def __init__(self, train_file=os.path.join("etc", "dataset", "preprocessed.txt"), trigram=False,
+                 model_file=None):
+        if model_file is not None:
+            # precompiled counts, see hmmtrain.train_hmm
+            trainer = HMMTrain.load(model_file)
+        else:
+            train_file = os.path.join(
+                os.path.dirname(__file__),
+                '..',
+                train_file)
 
-        train = open(train_file, "r+", encoding="utf-8").readlines()
-        for sentence in train:
-            word_tags.append(("START", "START"))
-            pairs = sentence.split(" ")
-            pairs = pairs[:-1]  # ignore newline
-            for pair in pairs:
-                word = "/".join(pair.split("/")[0:-1])
-                tag = pair.split("/")[-1]
-                if tag != "":
-                    word_tags.append((tag, word))
-                else:
-                    word_tags.append(("/", "PUNCT"))
-                self.N += 1
+            trainer = HMMTrain(trigram=trigram)
+            trainer.update_from_file(train_file, file_format="word_tag")
 
-            word_tags.append(("END", "END"))
+        self.trigram = trainer.trigram
+        self.N = trainer.N
 
         # get the conditional frequency distribution
-        self.cfd_word_tags = nltk.ConditionalFreqDist(word_tags)
-
-        tags = []
+        self.cfd_word_tags = nltk.ConditionalFreqDist()
+        for tag, words in trainer.word_tag_counts.items():
+            self.cfd_word_tags[tag].update(words)
 
-        for sentence in train:
-            tags.append("START")
-            pairs = sentence.split(" ")
-            pairs = pairs[:-1]  # ignore newline
-            for pair in pairs:
-                tag = pair.split("/")[-1]
-                if tag != "":
-                    tags.append(tag)
-                else:
-                    tags.append("PUNCT")
-
-            tags.append("END")
-
-        # self.fd = nltk.FreqDist(tags)
-        # for key, val in sorted(self.fd.items(), key=lambda x: x[1], reverse=True):
-        #     print(key, val)
-
-        if not trigram:
-            self.cfd_tags = nltk.ConditionalFreqDist(nltk.bigrams(tags))
-            # print(self.cfd_tags.keys())
-        else:
-            trigrams = [((x,y),z) for x,y,z in nltk.trigrams(tags)]
-            self.cfd_tags = nltk.ConditionalFreqDist(trigrams)
+        self.cfd_tags = nltk.ConditionalFreqDist()
+        for prev_tag, tags in trainer.transition_counts.items():
+            self.cfd_tags[prev_tag].update(tags)
 
     def get_emission_prob(self, word, tag, smoothing=True):
         num = self.cfd_word_tags[tag][word]
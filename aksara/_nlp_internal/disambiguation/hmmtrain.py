@@ -0,0 +1,218 @@
+import os
+import pickle
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+ARTIFACT_VERSION = 1
+
+
+class HMMTrain:
+    """
+    Accumulates the emission and transition counts used by HMMLearn.
+
+    Sentences are consumed one at a time, so memory only grows with the
+    vocabulary and never with the size of the training corpus. The last
+    two tags of the stream are carried over between files (and between
+    merged shards), which keeps the n-gram counts identical to training
+    on the concatenation of all inputs.
+    """
+
+    def __init__(self, trigram=False):
+        self.trigram = trigram
+        self.N = 0
+        self.word_tag_counts = defaultdict(Counter)
+        self.transition_counts = defaultdict(Counter)
+        self.head = []
+        self.tail = []
+
+    def add_sentence(self, word_tags):
+        self.__add_tag("START", "START")
+        for word, tag in word_tags:
+            if tag != "":
+                self.__add_tag(tag, word)
+            else:
+                self.word_tag_counts["/"]["PUNCT"] += 1
+                self.__add_transition("PUNCT")
+            self.N += 1
+
+        self.__add_tag("END", "END")
+
+    def update_from_file(self, train_file, file_format=None):
+        if file_format is None:
+            file_format = _guess_format(train_file)
+
+        if file_format == "conllu":
+            sentences = _iter_conllu_sentences(train_file)
+        elif file_format == "word_tag":
+            sentences = _iter_word_tag_sentences(train_file)
+        else:
+            raise ValueError(
+                f"file_format must be one of ['conllu', 'word_tag'], but {file_format} was given"
+            )
+
+        for sentence in sentences:
+            self.add_sentence(sentence)
+
+        return self
+
+    def merge(self, other):
+        """Adds the counts of `other`, as if its input came after ours"""
+
+        if self.trigram != other.trigram:
+            raise ValueError("can not merge bigram and trigram counts")
+
+        # n-grams that cross the boundary between the two streams
+        history = list(self.tail)
+        for i, tag in enumerate(other.head):
+            if self.trigram and len(history) == 2:
+                self.transition_counts[tuple(history)][tag] += 1
+            elif not self.trigram and i == 0 and history:
+                self.transition_counts[history[-1]][tag] += 1
+            history = (history + [tag])[-2:]
+
+        for tag, words in other.word_tag_counts.items():
+            self.word_tag_counts[tag].update(words)
+        for prev_tag, tags in other.transition_counts.items():
+            self.transition_counts[prev_tag].update(tags)
+
+        self.N += other.N
+        self.head = (self.head + other.head)[:2]
+        self.tail = (self.tail + other.tail)[-2:]
+        return self
+
+    def save(self, model_file):
+        artifact = {
+            "version": ARTIFACT_VERSION,
+            "trigram": self.trigram,
+            "N": self.N,
+            "word_tag_counts": {tag: dict(words) for tag, words in self.word_tag_counts.items()},
+            "transition_counts": {tag: dict(tags) for tag, tags in self.transition_counts.items()},
+            "head": self.head,
+            "tail": self.tail,
+        }
+
+        temp_file = model_file + ".tmp"
+        with open(temp_file, "wb") as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, model_file)
+
+        return os.path.realpath(model_file)
+
+    @classmethod
+    def load(cls, model_file):
+        with open(model_file, "rb") as f:
+            artifact = pickle.load(f)
+
+        if artifact.get("version") != ARTIFACT_VERSION:
+            raise ValueError(
+                f"{model_file} has HMM artifact version {artifact.get('version')}, "
+                f"expected {ARTIFACT_VERSION}"
+            )
+
+        trainer = cls(trigram=artifact["trigram"])
+        trainer.N = artifact["N"]
+        for tag, words in artifact["word_tag_counts"].items():
+            trainer.word_tag_counts[tag].update(words)
+        for prev_tag, tags in artifact["transition_counts"].items():
+            trainer.transition_counts[prev_tag].update(tags)
+        trainer.head = list(artifact["head"])
+        trainer.tail = list(artifact["tail"])
+        return trainer
+
+    def __add_tag(self, tag, word):
+        self.word_tag_counts[tag][word] += 1
+        self.__add_transition(tag)
+
+    def __add_transition(self, tag):
+        if self.trigram:
+            if len(self.tail) == 2:
+                self.transition_counts[tuple(self.tail)][tag] += 1
+        elif self.tail:
+            self.transition_counts[self.tail[-1]][tag] += 1
+
+        if len(self.head) < 2:
+            self.head.append(tag)
+        self.tail = (self.tail + [tag])[-2:]
+
+
+def train_hmm(train_files, model_file, trigram=True, base_model=None, n_jobs=1, file_format=None):
+    """
+    Trains an HMM from `train_files` and writes the artifact to `model_file`.
+
+    Every file is counted as a separate shard in its own process when
+    `n_jobs` > 1, then the shards are merged in the given order. If
+    `base_model` is set, its counts are loaded first and the new files
+    only update them instead of retraining from scratch.
+    """
+
+    if isinstance(train_files, str):
+        train_files = [train_files]
+
+    if base_model is not None:
+        trainer = HMMTrain.load(base_model)
+        trigram = trainer.trigram
+    else:
+        trainer = HMMTrain(trigram=trigram)
+
+    if n_jobs == 1 or len(train_files) <= 1:
+        for train_file in train_files:
+            trainer.update_from_file(train_file, file_format)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            shards = executor.map(
+                _train_shard,
+                train_files,
+                [trigram] * len(train_files),
+                [file_format] * len(train_files),
+            )
+            for shard in shards:
+                trainer.merge(shard)
+
+    return trainer.save(model_file)
+
+
+def _train_shard(train_file, trigram, file_format):
+    return HMMTrain(trigram=trigram).update_from_file(train_file, file_format)
+
+
+def _guess_format(train_file):
+    if train_file.endswith((".conllu", ".conll")):
+        return "conllu"
+    return "word_tag"
+
+
+def _iter_word_tag_sentences(train_file):
+    with open(train_file, "r", encoding="utf-8") as f:
+        for sentence in f:
+            pairs = sentence.split(" ")
+            pairs = pairs[:-1]  # ignore newline
+            word_tags = []
+            for pair in pairs:
+                word = "/".join(pair.split("/")[0:-1])
+                tag = pair.split("/")[-1]
+                word_tags.append((word, tag))
+            yield word_tags
+
+
+def _iter_conllu_sentences(train_file):
+    with open(train_file, "r", encoding="utf-8") as f:
+        word_tags = []
+        for line in f:
+            line = line.rstrip("\n")
+            if line.startswith("#"):
+                continue
+
+            if line.strip() == "":
+                if word_tags:
+                    yield word_tags
+                word_tags = []
+                continue
+
+            columns = line.split("\t")
+            if len(columns) < 4 or not columns[0].isdigit():
+                # skip multiword token ranges and empty nodes
+                continue
+            word_tags.append((columns[1], columns[3]))
+
+        if word_tags:
+            yield word_tags
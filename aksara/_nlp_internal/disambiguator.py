@@ -6,41 +6,34 @@ from .disambiguation.hmmdecode import HMMDecode
 
 class Disambiguator:
 
-    def __init__(self):
-        self.__hmmlearn = HMMLearn(trigram=True)
+    def __init__(self, model_file=None):
+        self.__hmmlearn = HMMLearn(trigram=True, model_file=model_file)
         self.__hmmdecode = HMMDecode(hmm=self.__hmmlearn, log=True)
 
-    def disambiguate(self, rows):
-        sentences = []
-        tags = []
-        for row in rows:
-            sentences.append(row[1])
-            tags.append(row[3])
-
-        predicted_tags = self.__hmmdecode.decode(sentences, tags)
-        new_rows = []
-        for i in range(len(rows)):
-            row = rows[i]
-            temp = row.copy()
-            lemmas = temp[2].split("/")
-            tags = temp[3].split("/")
-            features = temp[5].split("/")
-            misc = temp[9].split("/")
+    def disambiguate(self, tokens):
+        """keeps the analysis of the tag predicted by the HMM on every ambiguous token, in place"""
+
+        predicted_tags = self.__hmmdecode.decode(
+            [token.form for token in tokens], [token.upos for token in tokens]
+        )
+        for token, predicted_tag in zip(tokens, predicted_tags):
+            tags = token.upos.split("/")
             if len(tags) > 1:
+                lemmas = token.lemma.split("/")
+                features = token.feats.split("/")
+                misc = token.misc.split("/")
                 for j in range(len(tags)):
-                    if tags[j] == predicted_tags[i]:
-                        temp[2] = lemmas[j]
-                        temp[3] = tags[j]
-                        temp[9] = misc[j]
+                    if tags[j] == predicted_tag:
+                        token.lemma = lemmas[j]
+                        token.upos = tags[j]
+                        token.misc = misc[j]
                         for feature in features:
-                            temp[5] = "_"
+                            token.feats = "_"
                             if tags[j] in feature:
                                 idx = feature.find("->")
-                                temp[5] = feature[idx+3:-1]
+                                token.feats = feature[idx+3:-1]
                                 break
 
                         break
 
-            new_rows.append(temp)
-
-        return new_rows
+        return tokens
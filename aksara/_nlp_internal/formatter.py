@@ -1,19 +1,23 @@
 #!/usr/bin/python3
 
-def to_conllu_line_with_range(line_id, surface, n_tokens):
-    new_row = ['_'] * 10
-    range_id = "{}-{}".format(line_id, line_id + n_tokens - 1)
+from .sentence import Token
 
-    # basic info
-    new_row[0] = range_id
-    new_row[1] = surface
 
-    return '\t'.join(new_row)
+def to_conllu_line_with_range(line_id, surface, n_tokens):
+    return to_range_token(line_id, surface, n_tokens).to_conllu_line()
 
 
 def to_conllu_line(line_id, surface, text, **kwargs):
-    new_row = ['_'] * 10
+    return to_token(line_id, surface, text, **kwargs).to_conllu_line()
+
+
+def to_range_token(line_id, surface, n_tokens):
+    range_id = "{}-{}".format(line_id, line_id + n_tokens - 1)
+
+    return Token(range_id, surface)
 
+
+def to_token(line_id, surface, text, **kwargs):
     # Split classes
     candidates = text.split("\\n")
     candidates = [cand.split("+") for cand in candidates]
@@ -85,22 +89,11 @@ def to_conllu_line(line_id, surface, text, **kwargs):
     appended_features = appended_features[:-1]
     appended_misc = appended_misc[:-1]
 
-    candidate = [appended_lemma, appended_tags, appended_features]
-
-    # basic info
-    new_row[0] = str(line_id)
-    new_row[1] = surface
-
-    # lemma
-    new_row[2] = candidate[0]
-
-    # surface POS-tag
-    new_row[3] = candidate[1]
-
-    # lexical feature
-    new_row[5] = candidate[2]
-
-    # misc
-    new_row[9] = appended_misc
-
-    return '\t'.join(new_row)
+    return Token(
+        str(line_id),
+        surface,
+        lemma=appended_lemma,
+        upos=appended_tags,
+        feats=appended_features,
+        misc=appended_misc,
+    )
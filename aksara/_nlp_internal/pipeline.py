@@ -0,0 +1,145 @@
+import threading
+from queue import Queue
+
+DEFAULT_MAX_IN_FLIGHT = 32
+
+# end of input marker, sent once to every worker of a stage
+_END = object()
+
+
+class _Failure:
+    """an exception raised while processing one item, re-raised in input order"""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def check_stage_workers(stage_workers):
+    """returns `stage_workers` as a tuple of three positive ints
+
+    the three numbers are the worker threads for tokenization and FST analysis,
+    HMM disambiguation and dependency parsing
+    """
+
+    stage_workers = tuple(stage_workers)
+    if len(stage_workers) != 3 or not all(
+            isinstance(n, int) and not isinstance(n, bool) and n >= 1 for n in stage_workers
+    ):
+        raise ValueError(
+            "stage_workers must be 3 positive integers (analysis, disambiguation, parsing), "
+            f"but {stage_workers} was given"
+        )
+
+    return stage_workers
+
+
+def pipeline_map(items, stages, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+    """yields `item` passed through every `(function, n_workers)` of `stages`, in input order
+
+    Every stage has its own worker threads and the stages are connected by
+    queues, so item N+1 can be in the first stage while item N is in the last
+    one. At most `max_in_flight` items are between the reader and the consumer
+    at any time: reading `items` blocks until the consumer catches up, which
+    keeps memory bounded on large inputs. An exception raised by a stage is
+    re-raised here at the position of its item.
+    """
+
+    queues = [Queue() for _ in range(len(stages) + 1)]
+    in_flight = threading.Semaphore(max_in_flight)
+    stop = threading.Event()
+    workers = [n_workers for _, n_workers in stages]
+
+    threads = [threading.Thread(
+        target=_feed, args=(items, queues[0], in_flight, stop, workers[0]), daemon=True
+    )]
+    for i, (function, n_workers) in enumerate(stages):
+        n_next = workers[i + 1] if i + 1 < len(stages) else 1
+        is_last = _countdown(n_workers)
+        threads.extend(
+            threading.Thread(
+                target=_run_stage,
+                args=(function, queues[i], queues[i + 1], stop, is_last, n_next),
+                daemon=True
+            )
+            for _ in range(n_workers)
+        )
+
+    for thread in threads:
+        thread.start()
+
+    try:
+        pending = {}
+        next_idx = 0
+        while True:
+            message = queues[-1].get()
+            if message is _END:
+                break
+
+            idx, item = message
+            pending[idx] = item
+            while next_idx in pending:
+                item = pending.pop(next_idx)
+                next_idx += 1
+                in_flight.release()
+
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+    finally:
+        # wake up every thread that still waits for input, so they can exit
+        stop.set()
+        in_flight.release()
+        for queue, n_workers in zip(queues, workers):
+            for _ in range(n_workers):
+                queue.put(_END)
+
+
+def _feed(items, queue, in_flight, stop, n_workers):
+    idx = 0
+    try:
+        for item in items:
+            in_flight.acquire()
+            if stop.is_set():
+                return
+
+            queue.put((idx, item))
+            idx += 1
+    except Exception as error:  # pylint: disable=broad-except
+        queue.put((idx, _Failure(error)))
+
+    for _ in range(n_workers):
+        queue.put(_END)
+
+
+def _run_stage(function, in_queue, out_queue, stop, is_last, n_next):
+    while True:
+        message = in_queue.get()
+        if message is _END or stop.is_set():
+            break
+
+        idx, item = message
+        if not isinstance(item, _Failure):
+            try:
+                item = function(item)
+            except Exception as error:  # pylint: disable=broad-except
+                item = _Failure(error)
+
+        out_queue.put((idx, item))
+
+    if is_last():
+        for _ in range(n_next):
+            out_queue.put(_END)
+
+
+def _countdown(n_workers):
+    """returns a function that is True for the last of `n_workers` calls"""
+
+    lock = threading.Lock()
+    remaining = [n_workers]
+
+    def is_last():
+        with lock:
+            remaining[0] -= 1
+            return remaining[0] == 0
+
+    return is_last
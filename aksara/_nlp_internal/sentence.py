@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+
+FIELDS = ("idx", "form", "lemma", "upos", "xpos", "feats", "head", "deprel", "deps", "misc")
+
+
+class Token:
+    """
+    One CoNLL-U line of a sentence while it moves through analysis,
+    disambiguation and parsing. The stages read and update the fields in
+    place, the line is only joined with tabs for the output
+    """
+
+    __slots__ = FIELDS
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, idx, form, lemma="_", upos="_", xpos="_", feats="_",
+                 head="_", deprel="_", deps="_", misc="_"):
+        self.idx = idx
+        self.form = form
+        self.lemma = lemma
+        self.upos = upos
+        self.xpos = xpos
+        self.feats = feats
+        self.head = head
+        self.deprel = deprel
+        self.deps = deps
+        self.misc = misc
+
+    @classmethod
+    def from_fields(cls, fields):
+        """the Token of the 10 columns of a CoNLL-U line"""
+
+        return cls(*fields)
+
+    def is_word(self):
+        """False for the range line ("1-2") of a multiword token"""
+
+        return self.idx.isnumeric()
+
+    def fields(self):
+        return [getattr(self, field) for field in FIELDS]
+
+    def to_conllu_line(self):
+        return "\t".join(self.fields())
+
+    def __eq__(self, other):
+        if not isinstance(other, Token):
+            return NotImplemented
+        return self.fields() == other.fields()
+
+    def __repr__(self):
+        return f"Token({', '.join(repr(value) for value in self.fields())})"
+
+
+def to_conllu_lines(tokens):
+    return "\n".join(token.to_conllu_line() for token in tokens)
@@ -0,0 +1,323 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+
+from .analyzer import BaseAnalyzer
+from .batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT, ParseBatcher
+from .client import DEFAULT_HOST, DEFAULT_PORT
+from .core import aanalyze_sentences, format_tokens, get_disambiguator, get_text_normalizer
+from .tokenizer import BaseTokenizer
+from ..utils.sentence_cache import SentenceCache
+from ..utils.sentence_util import _split_sentence
+
+DEFAULT_MODEL = "FR_GSD-ID_CSUI"
+
+# a request line may hold a whole document
+MAX_LINE_BYTES = 2 ** 24
+
+# the latency percentiles are computed over this many recent requests per op
+LATENCY_WINDOW = 1024
+
+HELP_MSG = {
+    'host': f'host to listen on (default: {DEFAULT_HOST})',
+    'port': f'TCP port to listen on (default: {DEFAULT_PORT})',
+    'socket': 'listen on this Unix socket instead of a TCP port',
+    'model': f'dependency parser model loaded at startup (default: {DEFAULT_MODEL})',
+    'batch_max_wait': 'seconds a parse request waits for others to share its batch '
+                      f'(default: {DEFAULT_MAX_WAIT})',
+    'batch_max_size': f'maximum sentences in one parser batch (default: {DEFAULT_MAX_BATCH_SIZE})',
+    'cache_size': 'keep the analysis of up to this many sentences in memory, so '
+                  'duplicate sentences are analyzed once (default: 0)',
+    'cache_dir': 'also store every analyzed sentence in this directory, where '
+                 'later runs find it again',
+}
+
+
+class ServerStats:
+    """request counts and latencies of every op"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.__ops = {}
+
+    def record(self, op, seconds, is_ok):
+        stats = self.__ops.setdefault(op, {
+            "requests": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0,
+            "recent": deque(maxlen=LATENCY_WINDOW),
+        })
+        stats["requests"] += 1
+        stats["errors"] += not is_ok
+        stats["total_seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+        stats["recent"].append(seconds)
+
+    def as_dict(self):
+        ops = {}
+        for op, stats in self.__ops.items():
+            recent = sorted(stats["recent"])
+            ops[op] = {
+                "requests": stats["requests"],
+                "errors": stats["errors"],
+                "mean_ms": 1000 * stats["total_seconds"] / stats["requests"],
+                "p50_ms": 1000 * _percentile(recent, 0.50),
+                "p95_ms": 1000 * _percentile(recent, 0.95),
+                "max_ms": 1000 * stats["max_seconds"],
+            }
+
+        return {"uptime_seconds": time.monotonic() - self.started, "ops": ops}
+
+
+def _percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class AksaraServer:
+    """
+    Keeps the FST analyzer, SymSpell index, HMM and parser models loaded and
+    answers JSON requests, see `handle`. The parse stage of all concurrent
+    requests goes through one ParseBatcher
+    """
+
+    def __init__(self, bin_file, model=None, batch_max_wait=DEFAULT_MAX_WAIT,
+                 batch_max_size=DEFAULT_MAX_BATCH_SIZE, cache=None):
+        self.analyzer = BaseAnalyzer(bin_file, get_text_normalizer())
+        self.parse_batcher = ParseBatcher(batch_max_size, batch_max_wait)
+        self.default_model = model or DEFAULT_MODEL
+        self.cache = cache
+        self.stats = ServerStats()
+        self.__tokenizer = BaseTokenizer()
+        self.__dependency_parsers = {}
+        self.__ops = {
+            "health": self.__health,
+            "stats": self.__stats,
+            "tokenize": self.__tokenize,
+            "tag": self.__tag,
+            "lemmatize": self.__lemmatize,
+            "parse": self.__parse,
+            "analyze": self.__analyze,
+        }
+
+    def warm_up(self):
+        """loads the HMM and the default parser model before the first request"""
+
+        get_disambiguator()
+        self.__get_dependency_parser(self.default_model)
+
+    async def handle(self, request):
+        """answers one request, a dict with an "op" and its parameters
+
+        The response is {"id": ..., "ok": true, "result": ...} or
+        {"id": ..., "ok": false, "error": "..."}, where "id" is copied
+        from the request
+        """
+
+        start = time.perf_counter()
+        op = request.get("op") if isinstance(request, dict) else None
+        response = {"id": request.get("id") if isinstance(request, dict) else None}
+
+        try:
+            if op not in self.__ops:
+                raise ValueError(f"op must be one of {sorted(self.__ops)}, but {op} was given")
+            response["result"] = await self.__ops[op](request)
+            response["ok"] = True
+        except Exception as error:  # pylint: disable=broad-except
+            response["ok"] = False
+            response["error"] = f"{type(error).__name__}: {error}"
+
+        if op in self.__ops:
+            self.stats.record(op, time.perf_counter() - start, response["ok"])
+
+        return response
+
+    async def serve_connection(self, reader, writer):
+        """answers the JSON lines of one connection, in order"""
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # longer than MAX_LINE_BYTES, where the next request starts is unknown
+                    await _send(writer, {"id": None, "ok": False, "error": "request too large"})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                try:
+                    request = json.loads(line)
+                except ValueError as error:
+                    response = {"id": None, "ok": False, "error": f"invalid JSON: {error}"}
+                else:
+                    response = await self.handle(request)
+
+                await _send(writer, response)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def __health(self, _):
+        return {"status": "ok", "models": sorted(self.__dependency_parsers)}
+
+    async def __stats(self, _):
+        stats = self.stats.as_dict()
+        stats["parse_batches"] = self.parse_batcher.n_batches
+        stats["mean_parse_batch_size"] = (
+            self.parse_batcher.n_requests / self.parse_batcher.n_batches
+            if self.parse_batcher.n_batches else 0.0
+        )
+        if self.cache is not None:
+            stats["cache"] = self.cache.cache_info()._asdict()
+        return stats
+
+    async def __tokenize(self, request):
+        return [
+            self.__tokenizer.tokenize(sentence)[0]
+            for sentence in _request_sentences(request)
+        ]
+
+    async def __tag(self, request):
+        sentences = await self.__analyze_sentences(request)
+        return [[[token.idx, token.form, token.upos] for token in tokens] for tokens in sentences]
+
+    async def __lemmatize(self, request):
+        sentences = await self.__analyze_sentences(request)
+        return [[[token.idx, token.form, token.lemma] for token in tokens] for tokens in sentences]
+
+    async def __parse(self, request):
+        sentences = await self.__analyze_sentences(request)
+        return [[token.fields() for token in tokens] for tokens in sentences]
+
+    async def __analyze(self, request):
+        """the output of the command line interface for a list of already split sentences"""
+
+        sentences = request["sentences"]
+        if not isinstance(sentences, list):
+            raise ValueError("sentences must be a list of str")
+
+        flags = {
+            "v1": bool(request.get("v1", False)),
+            "lemma": bool(request.get("lemma", False)),
+            "postag": bool(request.get("postag", False)),
+        }
+        results = await self.__analyze_sentences(request, sentences, flags["v1"])
+        return [format_tokens(tokens, **flags) for tokens in results]
+
+    async def __analyze_sentences(self, request, sentences=None, v1=False):
+        if sentences is None:
+            sentences = _request_sentences(request)
+
+        model = request.get("model") or self.default_model
+        dependency_parser = await asyncio.to_thread(self.__get_dependency_parser, model)
+
+        return await aanalyze_sentences(
+            sentences,
+            self.analyzer,
+            dependency_parser,
+            self.parse_batcher,
+            cache=self.cache,
+            v1=v1,
+            informal=bool(request.get("informal", False)),
+        )
+
+    def __get_dependency_parser(self, model):
+        if model not in self.__dependency_parsers:
+            self.__dependency_parsers[model] = load_dependency_parser(model)
+
+        return self.__dependency_parsers[model]
+
+
+def load_dependency_parser(model):
+    """loads the parser of `model`, downloading it first if needed"""
+
+    # pylint: disable=import-outside-toplevel
+    from .dependency_parsing.core import DependencyParser
+    from .dependency_parsing.model_proxy import ModelProxy
+
+    if model not in ModelProxy.file_id:
+        raise ValueError(f"model must be one of {list(ModelProxy.file_id)}, but {model} was given")
+
+    return DependencyParser(model)
+
+
+def _request_sentences(request):
+    text = request["text"]
+    if not isinstance(text, str):
+        raise ValueError("text must be a str")
+
+    return _split_sentence(text, request.get("sep_regex"))
+
+
+async def _send(writer, response):
+    writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+async def run_server(server, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_socket=None,
+                     ready=None):
+    """serves `server` until cancelled, `ready` is called with the bound address"""
+
+    if unix_socket:
+        listener = await asyncio.start_unix_server(
+            server.serve_connection, unix_socket, limit=MAX_LINE_BYTES
+        )
+        address = f"unix:{unix_socket}"
+    else:
+        listener = await asyncio.start_server(
+            server.serve_connection, host, port, limit=MAX_LINE_BYTES
+        )
+        bound_host, bound_port = listener.sockets[0].getsockname()[:2]
+        address = f"{bound_host}:{bound_port}"
+
+    if ready is not None:
+        ready(address)
+
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        if unix_socket and os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+
+
+def create_serve_args_parser(bin_file, argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aksara serve",
+                                     description="Aksara server")
+
+    parser.add_argument('--host', type=str, default=DEFAULT_HOST, help=HELP_MSG['host'])
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=HELP_MSG['port'])
+    parser.add_argument('--socket', type=str, help=HELP_MSG['socket'])
+    parser.add_argument('--model', type=str, help=HELP_MSG['model'])
+    parser.add_argument('--batch-max-wait', type=float, default=DEFAULT_MAX_WAIT,
+                        help=HELP_MSG['batch_max_wait'])
+    parser.add_argument('--batch-max-size', type=int, default=DEFAULT_MAX_BATCH_SIZE,
+                        help=HELP_MSG['batch_max_size'])
+    parser.add_argument('--cache-size', type=int, default=0, help=HELP_MSG['cache_size'])
+    parser.add_argument('--cache-dir', type=str, help=HELP_MSG['cache_dir'])
+
+    args = parser.parse_args(argv)
+
+    try:
+        cache = SentenceCache(args.cache_size, args.cache_dir) \
+            if args.cache_size or args.cache_dir else None
+        server = AksaraServer(bin_file, args.model, args.batch_max_wait, args.batch_max_size,
+                              cache)
+    except ValueError as error:
+        parser.error(str(error))
+
+    print("Loading models...", file=sys.stderr)
+    server.warm_up()
+
+    def ready(address):
+        print(f"aksara server listening on {address}", file=sys.stderr, flush=True)
+
+    try:
+        asyncio.run(run_server(server, args.host, args.port, args.socket, ready))
+    except KeyboardInterrupt:
+        pass
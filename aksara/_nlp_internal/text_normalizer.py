@@ -1,5 +1,11 @@
+import gc
+import hashlib
 import json
+import logging
 import os
+import pickle
+import tempfile
+from functools import lru_cache
 
 from symspellpy import SymSpell, Verbosity
 
@@ -15,42 +21,203 @@ json_path = os.path.join(
     "text_normalization",
     "context_dictionary.json"
 )
-json_file = open(json_path)
-context_dictionary = json.load(json_file)
-json_file.close()
+
+INDEX_VERSION = 1
+MAX_EDIT_DISTANCE = 3
+NORMALIZATION_CACHE_SIZE = 4096
+
+CACHE_DIR_ENV = "AKSARA_CACHE_DIR"
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_context_dictionary():
+    with open(json_path, encoding="utf-8") as json_file:
+        return json.load(json_file)
+
+
+@lru_cache(maxsize=None)
+def get_context_index():
+    """
+    Maps (relation word, candidate) to the highest frequency bucket
+    in which the pair occurs in the context dictionary.
+    """
+
+    context_index = {}
+    for relation, frequencies in get_context_dictionary().items():
+        for freq, words in frequencies.items():
+            for word in words:
+                key = (relation, word)
+                context_index[key] = max(int(freq), context_index.get(key, 0))
+
+    return context_index
+
+
+def get_index_directory():
+    """
+    Per-user directory of the SymSpell index: `$AKSARA_CACHE_DIR`, else
+    `$XDG_CACHE_HOME/aksara`, else `~/.cache/aksara`.
+    """
+
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if cache_dir:
+        return cache_dir
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "aksara")
+
+
+def get_index_path(dictionary_path=gold_path, index_directory=None):
+    """
+    Path of the precompiled SymSpell index for `dictionary_path`,
+    in `index_directory` or else `get_index_directory()`.
+
+    The file name contains a hash of the word list, so editing the
+    word list (or the edit distance) points to a new index file.
+    """
+
+    with open(dictionary_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:16]
+
+    if index_directory is None:
+        index_directory = get_index_directory()
+
+    file_name = f"symspell-v{INDEX_VERSION}-d{MAX_EDIT_DISTANCE}-{digest}.pickle"
+    return os.path.join(index_directory, file_name)
+
+
+def load_sym_spell(dictionary_path=gold_path, index_directory=None):
+    """
+    Loads the SymSpell index of `dictionary_path` from `index_directory`,
+    building and saving it first if it is missing or out of date.
+    """
+
+    sym_spell = SymSpell(max_dictionary_edit_distance=MAX_EDIT_DISTANCE)
+    index_path = get_index_path(dictionary_path, index_directory)
+
+    if os.path.exists(index_path) and _load_index(sym_spell, index_path):
+        return sym_spell
+
+    sym_spell.create_dictionary(dictionary_path)
+    _save_index(sym_spell, index_path)
+    return sym_spell
+
+
+def _load_index(sym_spell, index_path):
+    # unpickling creates millions of containers, running the
+    # garbage collector meanwhile makes loading several times slower
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        # False if the index was written by another symspellpy data version
+        return sym_spell.load_pickle(index_path, compressed=False)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return False
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _save_index(sym_spell, index_path):
+    index_directory = os.path.dirname(index_path)
+    temp_path = None
+    try:
+        os.makedirs(index_directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=index_directory, suffix=".tmp")
+        os.close(fd)
+        sym_spell.save_pickle(temp_path, compressed=False)
+
+        # atomic, other processes never see a partially written index
+        os.replace(temp_path, index_path)
+    except OSError as e:
+        logger.warning(
+            "cannot save the SymSpell index to %s, it is rebuilt in every process "
+            "(set %s to a writable directory): %s", index_path, CACHE_DIR_ENV, e
+        )
+        if temp_path is not None and os.path.exists(temp_path):
+            os.remove(temp_path)
+        return
+
+    for file_name in os.listdir(index_directory):
+        file_path = os.path.join(index_directory, file_name)
+        if file_name.startswith("symspell-") and file_path != index_path:
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
 
 
 class TextNormalizer:
-    def __init__(self):
-        sym_spell = SymSpell(max_dictionary_edit_distance=3)
-        sym_spell.create_dictionary(gold_path)
-        self.__sym_spell = sym_spell
+    def __init__(self, dictionary_path=gold_path, index_directory=None,
+                 cache_size=NORMALIZATION_CACHE_SIZE, escalate=True):
+        """
+        `cache_size` bounds the number of memoized normalization results
+        (0 disables the cache). With `escalate`, SymSpell is queried at edit
+        distance 1, then 2, then 3, stopping at the first distance that has
+        a candidate confirmed by the context dictionary. The SymSpell index
+        is kept in `index_directory`, by default `get_index_directory()`.
+        """
+
+        self.__sym_spell = load_sym_spell(dictionary_path, index_directory)
+        self.__escalate = escalate
+        self.__normalize = lru_cache(maxsize=cache_size)(self.__normalize_uncached)
+        # the SymSpell candidates don't depend on the context, so every context of a word shares them
+        self.__suggest = lru_cache(maxsize=cache_size)(self.__suggest_uncached)
+
+    def normalize_symspell(self, sample, *relations, rank_by_frequency=False):
+        """
+        Normalizes `sample` to the first SymSpell candidate that occurs next
+        to one of `relations` in the context dictionary. With
+        `rank_by_frequency`, the candidate with the most frequent context
+        wins instead (ties are broken by the SymSpell order).
+        """
+
+        return self.__normalize(sample.strip('\n'), relations, rank_by_frequency)
+
+    def cache_info(self):
+        return self.__normalize.cache_info()
+
+    def cache_clear(self):
+        self.__normalize.cache_clear()
+        self.__suggest.cache_clear()
+
+    def __normalize_uncached(self, sample, relations, rank_by_frequency):
+        if self.__escalate:
+            distances = range(1, MAX_EDIT_DISTANCE + 1)
+        else:
+            distances = [MAX_EDIT_DISTANCE]
+
+        for distance in distances:
+            candidates = self.__suggest(sample, distance)
 
-    def normalize_symspell(self, sample, *relations):
-        sample = sample.strip('\n')
+            best_match = self.__match_context(candidates, relations, rank_by_frequency)
+            if best_match:
+                return best_match
 
-        suggestions = self.__sym_spell.lookup(sample, Verbosity.ALL)
-        candidates = [
-            suggestion.term for suggestion in suggestions]
+        return sample
 
-        if (not len(candidates)):
-            return sample
+    def __suggest_uncached(self, sample, distance):
+        suggestions = self.__sym_spell.lookup(
+            sample, Verbosity.ALL, max_edit_distance=distance)
+        return tuple(suggestion.term for suggestion in suggestions)
 
+    def __match_context(self, candidates, relations, rank_by_frequency):
         best_match = ''
+        best_freq = 0
+        context_index = get_context_index()
 
         for candidate in candidates:
-            for relation in relations:
-                if relation not in context_dictionary:
-                    continue
-
-                for freq in context_dictionary[relation]:
-                    match = candidate in context_dictionary[relation][freq]
-                    if match:
-                        best_match = candidate
-                        break
-                if (best_match):
+            freq = max(
+                (context_index.get((relation, candidate), 0) for relation in relations),
+                default=0
+            )
+            if freq > best_freq:
+                best_match = candidate
+                best_freq = freq
+                if not rank_by_frequency:
                     break
-            if (best_match):
-                break
 
-        return best_match if best_match else sample
+        return best_match
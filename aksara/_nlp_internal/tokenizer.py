@@ -1,36 +1,98 @@
 #!/usr/bin/python3
 
 import re
+from array import array
+from itertools import chain
 
 
 class BaseTokenizer:
     _whitespace_pattern = r"\s+"
     _tokenize_pattern = r'([0-9]+\-an|[+-]?[0-9]*[,.]?[0-9]+|[A-Z][a-z]\.|(?:[A-Z]+\.)(?:[A-Za-z]+\.){1,}|[\w\-\.]+@([\w\-]+\.)+[\w\-]{2,4}|(?P<punct>[^\w\s+])(?P=punct)+|@[\w.]+|#[\w.]+|:[\S](?=\s|$)|:-[\S](?=\s|$)|\w+(?=n\'t)|n\'t|\w+(?=\'[m|s]\s)|\'[m|s]\s|[^\w\s+]|(?:[\w-]{0,}))'
 
+    # without the empty matches, the gaps between the tokens are only seen in their offsets
+    _span_pattern = _tokenize_pattern.replace(r'(?:[\w-]{0,})', r'[\w-]+')
+
     def __init__(self):
         self.regex = re.compile(self._tokenize_pattern)
+        self.span_regex = re.compile(self._span_pattern)
         self.whitespace_regex = re.compile(self._whitespace_pattern)
 
     def tokenize(self, sent):
-        stripped_sent = self.whitespace_regex.sub(" ", sent).strip()
-        tokens = self.regex.findall(stripped_sent)
-        tokens = [token[0] for token in tokens]
-        spaceafterflags = self.__getspaceafterflag(tokens)
-        tokens = [token for token in tokens if token != '']
-        return tokens, spaceafterflags
-
-    def __getspaceafterflag(self, tokens):
-        flag = [False for token in tokens if token != '']
-
-        # Iterate over list
-        i = 0
-        is_whitespace = True
-        for token in tokens:
-            if token == '':
-                is_whitespace = True
-            else:
-                flag[i] = not is_whitespace
-                i += 1
-                is_whitespace = False
-
-        return flag[1:] + [False]
+        spans = self.tokenize_spans(sent)
+        tokens = spans.tokens()
+        if "'" in sent:
+            # 'm and 's keep the whitespace after them, which the tokenizer always read as a space
+            tokens = [token[:-1] + " " if token[-1].isspace() else token for token in tokens]
+        return tokens, spans.no_space_after()
+
+    def tokenize_spans(self, text, start=0, end=None):
+        """the tokens of text[start:end] as TokenSpans, with offsets into `text`
+
+        the same tokens as `tokenize`, found without rewriting the whitespace
+        or copying any substring
+        """
+
+        if end is None:
+            end = len(text)
+
+        # tokenize strips the text, so 's and 'm at its end must not see a whitespace after it
+        while end > start and text[end - 1].isspace():
+            end -= 1
+
+        offsets = array('Q', chain.from_iterable(
+            map(re.Match.span, self.span_regex.finditer(text, start, end))
+        ))
+        return TokenSpans(text, offsets[0::2], offsets[1::2])
+
+
+class TokenSpans:
+    """
+    (start, end) character offsets of the tokens of a text, in two arrays
+
+    A token is only copied out of the text when it's accessed.
+    """
+
+    __slots__ = ("text", "starts", "ends")
+
+    def __init__(self, text, starts, ends):
+        self.text = text
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, idx):
+        return self.text[self.starts[idx]:self.ends[idx]]
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def __eq__(self, other):
+        if not isinstance(other, TokenSpans):
+            return NotImplemented
+        return self.tokens() == other.tokens() and list(self) == list(other)
+
+    def __repr__(self):
+        return f"TokenSpans({list(self)!r})"
+
+    def tokens(self):
+        """the token strings"""
+
+        text = self.text
+        return [text[start:end] for start, end in zip(self.starts, self.ends)]
+
+    def no_space_after(self):
+        """SpaceAfter=No of every token: True when the next token starts right where it ends"""
+
+        flags = [end == start for end, start in zip(self.ends, self.starts[1:])] + [False]
+
+        text = self.text
+        if "'" in text:
+            # 'm and 's take one whitespace with them, only whitespace left before the next token
+            # was squeezed into that one by the tokenizer
+            for i, (end, start) in enumerate(zip(self.ends, self.starts[1:])):
+                if text[end - 1].isspace() and text[end:start].isspace():
+                    flags[i] = True
+
+        return flags
@@ -11,6 +11,11 @@
 Class Wrapper for ConLLU format 
 """
 
+from array import array
+from collections.abc import Sequence
+from itertools import count, islice
+from typing import Dict, Iterable, List, Union
+
 
 class ConlluData:
     """
@@ -18,6 +23,9 @@ class ConlluData:
     here: https://universaldependencies.org/format.html
     """
 
+    # no per-instance __dict__, a parsed corpus holds millions of these
+    __slots__ = ('__idx', '__lemma', '__form', '__upos', '__xpos', '__feat', '__head_id', 'deprel')
+
     def __init__(self, idx: str, form: str = "_",
                  lemma: str = '_', upos: str = '_',
                  xpos: str = '_', feat: str = '_',
@@ -78,11 +86,10 @@ class ConlluData:
     def get_conllu_str(self) -> str:
         """ConnluData string representation"""
 
-        the_string = self.__idx + "\t" + self.__form + "\t" + self.__lemma + "\t" + \
-                     self.__upos + "\t" + self.__xpos + "\t" + self.__feat + "\t" + \
-                     self.__head_id + "\t" + self.deprel + "\t" + "_" + "\t" + "_"
-
-        return the_string
+        return "\t".join((
+            self.__idx, self.__form, self.__lemma, self.__upos, self.__xpos,
+            self.__feat, self.__head_id, self.deprel, "_", "_"
+        ))
 
     def __str__(self) -> str:
         return self.get_conllu_str()
@@ -135,3 +142,197 @@ class ConlluData:
             )
 
         return False
+
+
+class ParsedCorpus(Sequence):
+    """
+    A columnar container of parsed sentences
+
+    Every column of every token is stored as a 4 byte code in a parallel
+    array, the code indexes the vocabulary of the column (each distinct
+    string is stored once). It behaves like a read-only ``List[List[ConlluData]]``:
+    indexing or iterating builds the :class:`ConlluData` of one sentence on
+    demand, so it can be passed to :func:`aksara.write_conllu` as is.
+
+    Parameters
+    ----------
+    sentences: iterable of list of :class:`ConlluData`, default=None
+        Sentences to append.
+
+    Examples
+    --------
+    >>> from aksara import ConlluData, ParsedCorpus
+    >>> corpus = ParsedCorpus([[ConlluData('1', 'Halo', 'halo', 'INTJ', head_id='0', deprel='root')]])
+    >>> len(corpus), corpus.n_tokens
+    (1, 1)
+    >>> corpus.column('upos')
+    ['INTJ']
+    """
+
+    COLUMNS = ('idx', 'form', 'lemma', 'upos', 'xpos', 'feat', 'head_id', 'deprel')
+
+    def __init__(self, sentences: Iterable[List[ConlluData]] = None):
+        self.__vocabularies = {column: [] for column in self.COLUMNS}
+        self.__code_of = {column: _CodeTable() for column in self.COLUMNS}
+        self.__codes = {column: array('I') for column in self.COLUMNS}
+        # token offset of every sentence, sentence i is tokens[offsets[i]:offsets[i + 1]]
+        self.__offsets = array('Q', [0])
+
+        if sentences is not None:
+            self.extend(sentences)
+
+    @classmethod
+    def from_columns(cls, codes: Dict[str, Sequence[int]], vocabularies: Dict[str, List[str]],
+                     sentence_offsets: Sequence[int]) -> 'ParsedCorpus':
+        """
+        Build a corpus from the output of :meth:`codes`, :meth:`vocabulary` and
+        :meth:`sentence_offsets`.
+
+        The code and offset sequences are used as they are, so they may be
+        read-only buffers such as memory-mapped files; they are copied into
+        arrays only when a sentence is appended.
+        """
+
+        corpus = cls()
+        for column in cls.COLUMNS:
+            vocabulary = list(vocabularies[column])
+            code_of = _CodeTable(zip(vocabulary, count()))
+            if len(code_of) != len(vocabulary):
+                raise ValueError(f"the vocabulary of {column} has duplicate values")
+            if len(codes[column]) != sentence_offsets[-1]:
+                raise ValueError(
+                    f"{column} has {len(codes[column])} codes, "
+                    f"but the sentence offsets end at {sentence_offsets[-1]}"
+                )
+
+            corpus.__vocabularies[column] = vocabulary
+            corpus.__code_of[column] = code_of
+            corpus.__codes[column] = codes[column]
+
+        corpus.__offsets = sentence_offsets
+        return corpus
+
+    @property
+    def n_tokens(self) -> int:
+        """number of rows (tokens) in all sentences"""
+
+        return self.__offsets[-1]
+
+    def append(self, sentence: List[ConlluData]):
+        """Append one sentence, a list of :class:`ConlluData`."""
+
+        self.append_rows(
+            (conllu.get_id(), conllu.get_form(), conllu.get_lemma(), conllu.get_upos(),
+             conllu.get_xpos(), conllu.get_feat(), conllu.get_head_id(), conllu.get_deprel())
+            for conllu in sentence
+        )
+
+    def append_rows(self, rows: Iterable[Iterable[str]]):
+        """Append one sentence given as rows of the 8 columns in :attr:`COLUMNS`."""
+
+        n_columns = len(self.COLUMNS)
+        # a short row gets the defaults of ConlluData, like in the list of ConlluData
+        rows = [
+            row if len(row) >= n_columns else (*row, *('_',) * (n_columns - len(row)))
+            for row in rows
+        ]
+        self.__make_appendable()
+        if rows:
+            # encode column by column, unseen values get the next code on lookup
+            for column, values in zip(self.COLUMNS, zip(*rows)):
+                self.__codes[column].extend(map(self.__code_of[column].__getitem__, values))
+
+        self.__offsets.append(self.__offsets[-1] + len(rows))
+
+    def extend(self, sentences: Iterable[List[ConlluData]]):
+        """Append every sentence of `sentences`, which may be another :class:`ParsedCorpus`."""
+
+        if isinstance(sentences, ParsedCorpus):
+            self.__extend_corpus(sentences)
+            return
+
+        for sentence in sentences:
+            self.append(sentence)
+
+    def sentence_range(self, sentence_idx: int) -> range:
+        """The token positions of one sentence in the column arrays."""
+
+        sentence_idx = range(len(self))[sentence_idx]
+        return range(self.__offsets[sentence_idx], self.__offsets[sentence_idx + 1])
+
+    def sentence_offsets(self) -> array:
+        """The token offset of every sentence and the total number of tokens at the end."""
+
+        return self.__offsets
+
+    def codes(self, column: str) -> array:
+        """The code array of `column`, code ``c`` stands for ``vocabulary(column)[c]``."""
+
+        return self.__codes[self.__check_column(column)]
+
+    def vocabulary(self, column: str) -> List[str]:
+        """The distinct values of `column`, in order of first appearance."""
+
+        return list(self.__get_vocabulary(self.__check_column(column)))
+
+    def column(self, column: str) -> List[str]:
+        """The value of `column` for every token of the corpus."""
+
+        vocabulary = self.__get_vocabulary(self.__check_column(column))
+        return [vocabulary[code] for code in self.__codes[column]]
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[List[ConlluData], List[List[ConlluData]]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+
+        positions = self.sentence_range(idx)
+        columns = [
+            (self.__codes[column], self.__get_vocabulary(column)) for column in self.COLUMNS
+        ]
+        return [
+            ConlluData(*(vocabulary[codes[i]] for codes, vocabulary in columns))
+            for i in positions
+        ]
+
+    def __extend_corpus(self, other: 'ParsedCorpus'):
+        # translate the codes of `other` to ours through its vocabulary, no row is decoded
+        self.__make_appendable()
+        for column in self.COLUMNS:
+            code_of = self.__code_of[column]
+            translation = array('I', map(code_of.__getitem__, other.vocabulary(column)))
+            self.__codes[column].extend(map(translation.__getitem__, other.codes(column)))
+
+        offset = self.__offsets[-1]
+        self.__offsets.extend(offset + other_offset for other_offset in other.__offsets[1:])
+
+    def __make_appendable(self):
+        # the columns of from_columns may be read-only buffers
+        if not isinstance(self.__offsets, array):
+            self.__codes = {column: array('I', codes) for column, codes in self.__codes.items()}
+            self.__offsets = array('Q', self.__offsets)
+
+    def __get_vocabulary(self, column: str) -> List[str]:
+        vocabulary = self.__vocabularies[column]
+        code_of = self.__code_of[column]
+        if len(vocabulary) != len(code_of):
+            # the codes are assigned in insertion order, so the new values are at the end
+            vocabulary.extend(islice(code_of, len(vocabulary), None))
+
+        return vocabulary
+
+    def __check_column(self, column: str) -> str:
+        if column not in self.__codes:
+            raise ValueError(f"column must be one of {list(self.COLUMNS)}, but {column} was given")
+
+        return column
+
+
+class _CodeTable(dict):
+    """a value -> code dict that gives an unseen value the next free code"""
+
+    def __missing__(self, value):
+        code = self[value] = len(self)
+        return code
@@ -2,20 +2,43 @@
 Module for aksara dependency parsing feature
 """
 
-from typing import List, Literal
+import asyncio
+from typing import Iterator, List, Literal, Tuple
 
 import aksara._nlp_internal.dependency_parsing.core as dep_parser_core
 from .conllu import ConlluData
-from ._nlp_internal import _get_foma_script_path, TextNormalizer
-from ._nlp_internal.core import analyze_sentence
+from ._nlp_internal import _get_foma_script_path
+from ._nlp_internal.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT, ParseBatcher
+from ._nlp_internal.core import (
+    aanalyze_sentences, analyze_sentence_tokens, get_text_normalizer
+)
 from ._nlp_internal.analyzer import BaseAnalyzer
-from .utils.conllu_io import write_conllu
-from .utils.sentence_util import _get_sentence_list
+from ._nlp_internal.sentence import Token
+from .utils.conllu_io import _write_analyzed_stream, _write_conllu_stream
+from .utils.parallel import _map_analyzed_sentences
+from .utils.progress import Progress
+from .utils.sentence_cache import SentenceCache
+from .utils.sentence_util import _aget_sentence_list, _get_sentence_list, _iter_sentence_list
 
 
 class DependencyParser:
     """
     Class to perform dependency parsing
+
+    The options for large inputs are described in :ref:`large_inputs`
+
+    Parameters
+    ----------
+    batch_max_wait : float, optional
+        seconds a concurrent :meth:`aparse` request waits for others to share
+        its parser batch, default is 0.005
+
+    batch_max_size : int, optional
+        maximum number of sentences in one parser batch of :meth:`aparse`,
+        default is 16
+
+    cache : SentenceCache, optional
+        analysis of the sentences seen before, default is None
     """
 
     __all_models = [
@@ -28,15 +51,29 @@ class DependencyParser:
     ]
 
 
-    def __init__(self):
-        self.default_analyzer = BaseAnalyzer(_get_foma_script_path(), TextNormalizer())
+    def __init__(
+            self,
+            batch_max_wait: float = DEFAULT_MAX_WAIT,
+            batch_max_size: int = DEFAULT_MAX_BATCH_SIZE,
+            cache: SentenceCache = None
+    ):
+        # the foma lookups are shared by all the sentences, see BaseAnalyzer.batch
+        self.default_analyzer = BaseAnalyzer(
+            _get_foma_script_path(), get_text_normalizer(), memoize_lookups=True
+        )
+        self.__dependency_parsers = {}
+        self.parse_batcher = ParseBatcher(batch_max_size, batch_max_wait)
+        self.cache = cache
 
     def parse(
             self, input_src: str,
             input_mode: Literal['f', 's'] = 's',
             is_informal: bool = False,
             sep_regex: str = None,
-            model: str = "FR_GSD-ID_CSUI"
+            model: str = "FR_GSD-ID_CSUI",
+            n_jobs: int = 1,
+            stage_workers: Tuple[int, int, int] = None,
+            progress: Progress = True
     ) -> List[List[ConlluData]]:
         """ performs dependency parsing on the text (multiple sentences)
 
@@ -64,6 +101,15 @@ class DependencyParser:
             the model to use for dependency parsing,
             default is "FR_GSD-ID_CSUI"
 
+        n_jobs : int, optional
+            number of worker processes, -1 uses all CPU cores, default is 1
+
+        stage_workers : tuple of 3 int, optional
+            threads of each pipelined analysis stage, e.g. (4, 1, 1), default is None
+
+        progress : bool or callable, optional
+            progress of reading the file of `input_mode` 'f', default is True
+
         Returns
         -------
         result : list of list of ConlluData
@@ -97,20 +143,171 @@ class DependencyParser:
         4   .       .       PUNCT   _       _       3       punct   _       _
         """
 
-        sentence_list = _get_sentence_list(input_src, input_mode, sep_regex)
+        sentence_list = _get_sentence_list(input_src, input_mode, sep_regex, progress=progress)
 
         if len(sentence_list) == 0:
             return []
 
-        result = []
-
-        for sentence in sentence_list:
-            sentence_result = self._parse_one_sentence(
-                sentence, is_informal, model
+        return list(
+            _map_analyzed_sentences(
+                self, "_parse_one_sentence", _to_conllu, sentence_list,
+                (is_informal, model), n_jobs, stage_workers
             )
-            result.append(sentence_result)
+        )
+
+    async def aparse(
+            self, input_src: str,
+            input_mode: Literal['f', 's'] = 's',
+            is_informal: bool = False,
+            sep_regex: str = None,
+            model: str = "FR_GSD-ID_CSUI",
+            progress: Progress = True
+    ) -> List[List[ConlluData]]:
+        """ coroutine version of :meth:`parse` for asyncio applications
+
+        foma runs as a non-blocking subprocess and the CPU bound stages run in
+        executor threads, so the event loop stays responsive. Sentences of
+        concurrent calls are coalesced into parser batches, see `batch_max_wait`
+        and `batch_max_size` of :class:`DependencyParser`
+
+        Parameters
+        ----------
+        input_src : str
+            text that will be parsed if `input_mode` is set to 's' or
+            file path to a file containing the text if `input_mode`
+            is set to 'f'
+
+        input_mode : {'f', 's'}, optional
+            specifies the source of the input, default is 's'
+
+        is_informal : bool, optional
+            tells aksara to treat text as informal one, default is False
+
+        sep_regex : str, optional
+            regex rule that specifies the end of sentence, default is None
+
+        model : str, optional
+            the model to use for dependency parsing,
+            default is "FR_GSD-ID_CSUI"
+
+        progress : bool or callable, optional
+            progress of reading the file of `input_mode` 'f', default is True
+
+        Returns
+        -------
+        result : list of list of ConlluData
+            same as :meth:`parse`
+
+        Raises
+        ------
+        FileNotFoundError
+            if `input_mode` is set to 'f' but file in `input_src` doesn't exist
+        ValueError
+            if `input_mode` is not in ['f', 's'] or `model` is unknown
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> from aksara import DependencyParser
+        >>> parser = DependencyParser()
+        >>> result = asyncio.run(parser.aparse("Saya ingin makan."))
+        >>> print(result[0][0]) #doctest: +NORMALIZE_WHITESPACE
+        1   Saya    saya    PRON    _       Number=Sing|Person=1|PronType=Prs       2       nsubj   _       _
+        """
+
+        self.__check_model(model)
+        sentence_list = await _aget_sentence_list(
+            input_src, input_mode, sep_regex, progress=progress
+        )
+
+        if len(sentence_list) == 0:
+            return []
+
+        # loading a model for the first time reads the weights from disk
+        await asyncio.to_thread(self.__get_default_dependency_parser, model)
+
+        analyzed_sentences = await aanalyze_sentences(
+            sentence_list, parse_batcher=self.parse_batcher,
+            **self._analysis_kwargs(is_informal, model)
+        )
+
+        return [_to_conllu(analyzed_sentence) for analyzed_sentence in analyzed_sentences]
+
+    def iter_parse(
+            self, input_src: str,
+            input_mode: Literal['f', 's'] = 's',
+            is_informal: bool = False,
+            sep_regex: str = None,
+            model: str = "FR_GSD-ID_CSUI",
+            n_jobs: int = 1,
+            stage_workers: Tuple[int, int, int] = None
+    ) -> Iterator[List[ConlluData]]:
+        """ lazy version of :meth:`parse`, yields the dependency parsing
+        result of one sentence at a time
+
+        With `input_mode` 'f', the file is read, split and parsed sentence by
+        sentence while the result is consumed, so memory stays flat for large
+        files and the first sentence is available immediately
+
+        Parameters
+        ----------
+        input_src : str
+            text that will be parsed if `input_mode` is set to 's' or
+            file path to a file containing the text if `input_mode`
+            is set to 'f'
+
+        input_mode : {'f', 's'}, optional
+            specifies the source of the input, default is 's'
+
+        is_informal : bool, optional
+            tells aksara to treat text as informal one, default is False
+
+        sep_regex : str, optional
+            regex rule that specifies the end of sentence, default is None
+
+        model : str, optional
+            the model to use for dependency parsing,
+            default is "FR_GSD-ID_CSUI"
+
+        n_jobs : int, optional
+            number of worker processes, -1 uses all CPU cores, default is 1
+
+        stage_workers : tuple of 3 int, optional
+            threads of each pipelined analysis stage, e.g. (4, 1, 1), default is None
+
+        Yields
+        ------
+        list of ConlluData
+            result of dependency parsing of one sentence
+            in form of ConlluData class for each word
+
+        Raises
+        ------
+        FileNotFoundError
+            if `input_mode` is set to 'f' but file in `input_src` doesn't exist
+        ValueError
+            if `input_mode` is not in ['f', 's'] or `model` is unknown
 
-        return result
+        Examples
+        --------
+        >>> from aksara import DependencyParser
+        >>> parser = DependencyParser()
+        >>> for sentence in parser.iter_parse("Saya ingin makan."): #doctest: +NORMALIZE_WHITESPACE
+        ...     for conllu_word in sentence:
+        ...         print(conllu_word)
+        1   Saya    saya    PRON    _       Number=Sing|Person=1|PronType=Prs       2       nsubj   _       _
+        2   ingin   ingin   VERB    _       _       0       root    _       _
+        3   makan   makan   VERB    _       _       2       xcomp   _       _
+        4   .       .       PUNCT   _       _       3       punct   _       _
+        """
+
+        self.__check_model(model)
+        sentences = _iter_sentence_list(input_src, input_mode, sep_regex)
+
+        return _map_analyzed_sentences(
+            self, "_parse_one_sentence", _to_conllu, sentences,
+            (is_informal, model), n_jobs, stage_workers
+        )
 
     def parse_to_file(
             self, input_src: str,
@@ -120,7 +317,10 @@ class DependencyParser:
             is_informal: bool = False,
             sep_regex: str = None,
             sep_column: str = '\t',
-            model: str = "FR_GSD-ID_CSUI"
+            model: str = "FR_GSD-ID_CSUI",
+            n_jobs: int = 1,
+            stage_workers: Tuple[int, int, int] = None,
+            resume: bool = False
     ) -> str:
         """ performs dependency parsing on the text (multiple sentences)
         and save the result in the CoNLL-U format in a file specified
@@ -173,6 +373,15 @@ class DependencyParser:
             the model to use for dependency parsing,
             default is "FR_GSD-ID_CSUI"
 
+        n_jobs : int, optional
+            number of worker processes, -1 uses all CPU cores, default is 1
+
+        stage_workers : tuple of 3 int, optional
+            threads of each pipelined analysis stage, e.g. (4, 1, 1), default is None
+
+        resume : bool, optional
+            continues the partial `write_path` of an interrupted call, default is False
+
         Returns
         -------
         str
@@ -188,20 +397,15 @@ class DependencyParser:
 
         """
 
-        result = self.parse(
-            input_src, input_mode=input_mode, is_informal=is_informal,
-            sep_regex=sep_regex, model=model
-        )
+        self.__check_model(model)
 
-        sentence_list = _get_sentence_list(
-            input_src,
-            input_mode=input_mode,
-            sep_regex=sep_regex
+        sentences = _iter_sentence_list(input_src, input_mode, sep_regex)
+        return _write_analyzed_stream(
+            _write_conllu_stream, self, "_parse_one_sentence", _to_conllu,
+            sentences, write_path, (is_informal, model), n_jobs, stage_workers, resume,
+            write_mode=write_mode, separator=sep_column
         )
 
-        return write_conllu(sentence_list, result, write_path,
-                            write_mode=write_mode, separator=sep_column)
-
     # pylint: disable-msg=too-many-locals
     def _parse_one_sentence(
             self, sentence: str,
@@ -231,33 +435,49 @@ class DependencyParser:
         if sentence == "":
             return []
 
-        default_dependency_parser = self.__get_default_dependency_parser(model)
+        tokens = analyze_sentence_tokens(sentence, **self._analysis_kwargs(is_informal, model))
 
-        analyzed_sentence = analyze_sentence(
-            sentence,
-            self.default_analyzer,
-            default_dependency_parser,
-            v1=False,
-            lemma=False,
-            postag=False,
-            informal=is_informal
-        )
+        return _to_conllu(tokens)
 
-        result = []
-        for row in analyzed_sentence.split("\n"):
-            idx, form, lemma, upos, xpos, feat, head_id, deprel, _, _ = row.split("\t")
-            conllu_data = ConlluData(
-                idx, form, lemma, upos, xpos, feat, head_id, deprel
-            )
-            result.append(conllu_data)
+    def _analysis_kwargs(self, is_informal: bool, model: str) -> dict:
+        """ the analyzer, dependency parser, cache and flags of one call,
+        see analyze_sentence_tokens
+        """
 
-        return result
+        return {
+            "analyzer": self.default_analyzer,
+            "dependency_parser": self.__get_default_dependency_parser(model),
+            "cache": self.cache,
+            "v1": False,
+            "lemma": False,
+            "postag": False,
+            "informal": is_informal,
+        }
 
     def __get_default_dependency_parser(self, model) -> dep_parser_core.DependencyParser:
         """ returns a dependency parser instance with the specified model
         """
 
+        self.__check_model(model)
+
+        if model not in self.__dependency_parsers:
+            self.__dependency_parsers[model] = dep_parser_core.DependencyParser(model)
+
+        return self.__dependency_parsers[model]
+
+    def __check_model(self, model: str):
+        """ raises ValueError if `model` is not one of the available models
+        """
+
         if model not in self.__all_models:
             raise ValueError(f"model must be one of {self.__all_models}, but {model} was given")
 
-        return dep_parser_core.DependencyParser(model)
+
+def _to_conllu(tokens: List[Token]) -> List[ConlluData]:
+    return [
+        ConlluData(
+            token.idx, token.form, token.lemma, token.upos, token.xpos,
+            token.feats, token.head, token.deprel
+        )
+        for token in tokens
+    ]
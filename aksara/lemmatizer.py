@@ -1,6 +1,8 @@
 from typing import Union
-from ._nlp_internal import _get_foma_script_path, TextNormalizer
-from ._nlp_internal.core import analyze_sentence
+from ._nlp_internal import _get_foma_script_path
+from ._nlp_internal.core import (
+    analyze_sentence_tokens, analyze_word_tokens, disambiguate_tokens, get_text_normalizer
+)
 from ._nlp_internal.analyzer import BaseAnalyzer
 from ._nlp_internal.dependency_parsing.core import DependencyParser
 
@@ -11,7 +13,7 @@ class Lemmatizer:
     """
 
     def __init__(self):
-        self.default_analyzer = BaseAnalyzer(_get_foma_script_path(), TextNormalizer())
+        self.default_analyzer = BaseAnalyzer(_get_foma_script_path(), get_text_normalizer())
         self.default_dependency_parser = DependencyParser()
 
     def lemmatize(self, word_input: str, is_informal: bool = False) -> Union[str, list[str]]:
@@ -50,7 +52,7 @@ class Lemmatizer:
         return result
 
     def lemmatize_batch(
-        self, list_word: list, is_informal: bool = False
+        self, list_word: list, is_informal: bool = False, pretokenized: bool = False
     ) -> list[tuple[str, str]]:
         """
         performs lemmatization on the sentence list,
@@ -65,19 +67,36 @@ class Lemmatizer:
         is_informal: bool
             tell aksara to treat text as informal , default to False
 
+        pretokenized: bool
+            treat every word as one token of its own instead of a word of
+            a sentence, default to False. The words are not tokenized again
+            nor parsed, and a word that occurs several times is analyzed
+            once, which is much faster for vocabulary lists or index terms.
+            A word is lemmatized without the words around it, like the
+            first word of a sentence
+
         returns
         -------
         list of tuple
             will return list containing each word paired with its
             corresponding lemma as the result
+
+        raises
+        ------
+        ValueError
+            if `pretokenized` is True and a word contains whitespace
+            other than at its ends
         """
 
         if list_word == []:
             return []
 
+        if pretokenized:
+            return self.__lemmatize_words(list_word, is_informal)
+
         input_text = " ".join(list_word)
 
-        temp_result = analyze_sentence(
+        tokens = analyze_sentence_tokens(
             text=input_text,
             analyzer=self.default_analyzer,
             dependency_parser=self.default_dependency_parser,
@@ -87,10 +106,29 @@ class Lemmatizer:
             informal=is_informal,
         )
 
+        return [(token.form, token.lemma) for token in tokens]
+
+    def __lemmatize_words(self, list_word, is_informal):
+        # the foma lookups are shared by the batch, e.g. by the parts of different words
+        words = [word.strip() for word in list_word]
+        for word in words:
+            # a token never contains whitespace, and a newline would end the foma lookup
+            if len(word.split()) > 1:
+                raise ValueError(f"a pretokenized word can't contain whitespace, but {word!r} was given")
+
+        analyzer = self.default_analyzer.batch()
+        lemmas = {}
         result = []
 
-        for line in temp_result.split("\n"):
-            _, word, lemma = line.split("\t")
-            result.append((word, lemma))
+        for word in words:
+            if word == "":
+                continue
+
+            if word not in lemmas:
+                tokens = analyze_word_tokens(word, analyzer, is_informal)
+                tokens = disambiguate_tokens(tokens, v1=False)
+                lemmas[word] = [(token.form, token.lemma) for token in tokens]
+
+            result.extend(lemmas[word])
 
         return result
@@ -1,28 +1,46 @@
 import os
 
-from typing import List, Literal
-from ._nlp_internal import _get_foma_script_path, TextNormalizer
-from ._nlp_internal.core import analyze_sentence
+from typing import Iterator, List, Literal, Tuple
+from ._nlp_internal import _get_foma_script_path
+from ._nlp_internal.core import analyze_sentence_tokens, get_text_normalizer
 from ._nlp_internal.analyzer import BaseAnalyzer
-from ._nlp_internal.core import DependencyParser
+from ._nlp_internal.dependency_parsing.core import DependencyParser
+from ._nlp_internal.sentence import Token
 
-from .utils.conllu_io import _write_reduce_conllu
-from .utils.sentence_util import _get_sentence_list
+from .utils.conllu_io import _write_analyzed_stream, _write_reduce_conllu_stream
+from .utils.parallel import _map_analyzed_sentences
+from .utils.progress import Progress
+from .utils.sentence_cache import SentenceCache
+from .utils.sentence_util import _get_sentence_list, _iter_sentence_list
 
 class MorphologicalAnalyzer:
     """
     Class to get all morphological analysis
+
+    The options for large inputs are described in :ref:`large_inputs`
+
+    Parameters
+    ----------
+    cache: :class:`aksara.SentenceCache`, optional
+        Analysis of the sentences seen before
     """
 
-    def __init__(self):
-        self.default_analyzer = BaseAnalyzer(_get_foma_script_path(), TextNormalizer())
+    def __init__(self, cache: SentenceCache = None):
+        # the foma lookups are shared by all the sentences, see BaseAnalyzer.batch
+        self.default_analyzer = BaseAnalyzer(
+            _get_foma_script_path(), get_text_normalizer(), memoize_lookups=True
+        )
         self.default_dependency_parser = DependencyParser()
+        self.cache = cache
 
     def analyze(
         self, input_src: str,
         input_mode: Literal["f", "s"] = "s",
         is_informal: bool = False,
         sep_regex: str = None,
+        n_jobs: int = 1,
+        stage_workers: Tuple[int, int, int] = None,
+        progress: Progress = True
     ) -> List[List[tuple[str, str]]]:
         """
         Get all morphological analysis in `input_src`
@@ -40,6 +58,12 @@ class MorphologicalAnalyzer:
         sep_regex: str, optional
             Regex that will be used to split a multi sentences text 
             into a list of single sentence
+        n_jobs: int, default=1
+            Number of worker processes, -1 uses all CPU cores
+        stage_workers: tuple of 3 int, optional
+            Threads of each pipelined analysis stage, e.g. (4, 1, 1)
+        progress: bool or callable, default=True
+            Progress of reading the file of 'f' mode
 
         Returns
         -------
@@ -66,18 +90,79 @@ class MorphologicalAnalyzer:
         if input_mode == "f" and os.stat(input_src).st_size == 0:
             return []
 
-        sentence_list = _get_sentence_list(input_src.strip(), input_mode, sep_regex)
+        sentence_list = _get_sentence_list(
+            input_src.strip(), input_mode, sep_regex, progress=progress
+        )
 
         if len(sentence_list) == 0:
             return []
 
-        result = []
+        return list(
+            _map_analyzed_sentences(
+                self, "_analyze_one_sentence", _to_form_morf, sentence_list,
+                (is_informal,), n_jobs, stage_workers
+            )
+        )
+
+    def iter_analyze(
+        self, input_src: str,
+        input_mode: Literal["f", "s"] = "s",
+        is_informal: bool = False,
+        sep_regex: str = None,
+        n_jobs: int = 1,
+        stage_workers: Tuple[int, int, int] = None
+    ) -> Iterator[List[tuple[str, str]]]:
+        """
+        Lazy version of :meth:`analyze`, yields the morphological analysis
+        of one sentence at a time
+
+        With `input_mode` 'f', the file is read, split and analyzed sentence by
+        sentence while the result is consumed, so memory stays flat for large files
+
+        Parameters
+        ----------
+        input_src: str
+            Python string or file path that contains Indonesian text
+        input_mode: {'f', 's'}, default='s'
+            's' mode : `input_src` is assumed to be a Python str.
+            'f' mode : `input_src` is processed as a file path.
+        is_informal: bool, default=False
+            Processes text in `input_src` as informal text or not
+            (default treat text as formal text)
+        sep_regex: str, optional
+            Regex that will be used to split a multi sentences text
+            into a list of single sentence
+        n_jobs: int, default=1
+            Number of worker processes, -1 uses all CPU cores
+        stage_workers: tuple of 3 int, optional
+            Threads of each pipelined analysis stage, e.g. (4, 1, 1)
+
+        Yields
+        ------
+        list of tuple
+            pairs of token and its morphological analysis for one sentence
+
+        Raises
+        ------
+        FileNotFoundError
+            if `input_mode` is set to 'f' but file in `input_src` doesn't exist
+        ValueError
+            if `input_mode` is not in ['f', 's']
+
+        Examples
+        --------
+        >>> from aksara import MorphologicalAnalyzer
+        >>> analyzer = MorphologicalAnalyzer()
+        >>> list(analyzer.iter_analyze('Andi tidur'))
+        [[('Andi', 'Morf=Andi<PROPN>_PROPN'), ('tidur', 'Morf=tidur<VERB>_VERB')]]
 
-        for sentence in sentence_list:
-            sentence_result = self._analyze_one_sentence(sentence, is_informal)
-            result.append(sentence_result)
+        """
 
-        return result
+        sentences = _iter_sentence_list(input_src.strip(), input_mode, sep_regex)
+        return _map_analyzed_sentences(
+            self, "_analyze_one_sentence", _to_form_morf, sentences,
+            (is_informal,), n_jobs, stage_workers
+        )
 
     def analyze_to_file(
         self, input_src: str,
@@ -85,7 +170,10 @@ class MorphologicalAnalyzer:
         input_mode: Literal["f", "s"] = "s",
         write_mode: Literal['a', 'w', 'x'] = 'x',
         is_informal: bool = False,
-        sep_regex: str = None
+        sep_regex: str = None,
+        n_jobs: int = 1,
+        stage_workers: Tuple[int, int, int] = None,
+        resume: bool = False
     ) -> str:
         """
         Get all morphological analysis in `input_src` and save the result in a file
@@ -108,6 +196,12 @@ class MorphologicalAnalyzer:
             (default treat text as formal text)
         sep_regex: str, optional
             Regex that will be used to split a multi sentences text into a list of single sentence
+        n_jobs: int, default=1
+            Number of worker processes, -1 uses all CPU cores
+        stage_workers: tuple of 3 int, optional
+            Threads of each pipelined analysis stage, e.g. (4, 1, 1)
+        resume: bool, default=False
+            Continues the partial `write_path` of an interrupted call
 
         Returns
         -------
@@ -131,38 +225,23 @@ class MorphologicalAnalyzer:
         if write_mode not in all_write_modes:
             raise ValueError(f"write_mode must be in {all_write_modes}")
 
-        sentence_list = _get_sentence_list(input_src.strip(), input_mode, sep_regex)
-
-        idx_token_misc = []
-
-        for sentence in sentence_list:
-            analyzed_sentence = analyze_sentence(
-                        sentence,
-                        self.default_analyzer,
-                        self.default_dependency_parser,
-                        v1=False,
-                        lemma=False,
-                        postag=False,
-                        informal=is_informal
-                    )
-
-            result = []
-            for row in analyzed_sentence.split("\n"):
-                idx, form, _, _, _, _, _, _, _, morf = row.split("\t")
+        sentences = _iter_sentence_list(input_src.strip(), input_mode, sep_regex)
+        _write_analyzed_stream(
+            _write_reduce_conllu_stream, self, "_analyze_one_sentence_with_id", _to_id_form_morf,
+            sentences, write_path, (is_informal,), n_jobs, stage_workers, resume,
+            write_mode=write_mode, separator=sep_regex
+        )
 
-                result.append((idx, form, morf))
+        return os.path.realpath(write_path)
 
-            idx_token_misc.append(result)
+    def _analyze_one_sentence_with_id(
+        self, sentence: str,
+        is_informal: bool = False
+    ) -> List[tuple[str, str, str]]:
 
-        _write_reduce_conllu(
-            sentence_list,
-            idx_token_misc,
-            write_path,
-            write_mode=write_mode,
-            separator=sep_regex
-        )
+        tokens = analyze_sentence_tokens(sentence, **self._analysis_kwargs(is_informal))
 
-        return os.path.realpath(write_path)
+        return _to_id_form_morf(tokens)
 
     def _analyze_one_sentence(
         self, sentence: str,
@@ -171,20 +250,29 @@ class MorphologicalAnalyzer:
 
         sentence = sentence.strip()
 
-        analyzed_sentence = analyze_sentence(
-            sentence,
-            self.default_analyzer,
-            self.default_dependency_parser,
-            v1=False,
-            lemma=False,
-            postag=False,
-            informal=is_informal
-        )
+        tokens = analyze_sentence_tokens(sentence, **self._analysis_kwargs(is_informal))
+
+        return _to_form_morf(tokens)
+
+    def _analysis_kwargs(self, is_informal: bool) -> dict:
+        """
+        the analyzer, dependency parser, cache and flags of one call, see analyze_sentence_tokens
+        """
+
+        return {
+            "analyzer": self.default_analyzer,
+            "dependency_parser": self.default_dependency_parser,
+            "cache": self.cache,
+            "v1": False,
+            "lemma": False,
+            "postag": False,
+            "informal": is_informal,
+        }
+
 
-        result = []
-        for row in analyzed_sentence.split("\n"):
-            _, form, _, _, _, _, _, _, _, morf = row.split("\t")
+def _to_form_morf(tokens: List[Token]) -> List[tuple[str, str]]:
+    return [(token.form, token.misc) for token in tokens]
 
-            result.append((form, morf))
 
-        return result
+def _to_id_form_morf(tokens: List[Token]) -> List[tuple[str, str, str]]:
+    return [(token.idx, token.form, token.misc) for token in tokens]
@@ -1,28 +1,46 @@
 import os
 
-from typing import List, Literal
-from ._nlp_internal import _get_foma_script_path, TextNormalizer
-from ._nlp_internal.core import analyze_sentence
+from typing import Iterator, List, Literal, Tuple
+from ._nlp_internal import _get_foma_script_path
+from ._nlp_internal.core import analyze_sentence_tokens, get_text_normalizer
 from ._nlp_internal.analyzer import BaseAnalyzer
 from ._nlp_internal.dependency_parsing.core import DependencyParser
-from .utils.sentence_util import _get_sentence_list
+from ._nlp_internal.sentence import Token
+from .utils.sentence_util import _get_sentence_list, _iter_sentence_list
 
-from .utils.conllu_io import _write_reduce_conllu
+from .utils.conllu_io import _write_analyzed_stream, _write_reduce_conllu_stream
+from .utils.parallel import _map_analyzed_sentences
+from .utils.progress import Progress
+from .utils.sentence_cache import SentenceCache
 
 class MorphologicalFeature:
     """
     Class to get all morphological features
+
+    The options for large inputs are described in :ref:`large_inputs`
+
+    Parameters
+    ----------
+    cache: :class:`aksara.SentenceCache`, optional
+        Analysis of the sentences seen before
     """
 
-    def __init__(self):
-        self.default_analyzer = BaseAnalyzer(_get_foma_script_path(), TextNormalizer())
+    def __init__(self, cache: SentenceCache = None):
+        # the foma lookups are shared by all the sentences, see BaseAnalyzer.batch
+        self.default_analyzer = BaseAnalyzer(
+            _get_foma_script_path(), get_text_normalizer(), memoize_lookups=True
+        )
         self.default_dependency_parser = DependencyParser()
+        self.cache = cache
 
     def get_feature(
         self, input_src: str,
         input_mode: Literal["f", "s"] = "s",
         is_informal: bool = False,
         sep_regex: str = None,
+        n_jobs: int = 1,
+        stage_workers: Tuple[int, int, int] = None,
+        progress: Progress = True
     ) -> List[List[tuple[str, List]]]:
         """
         Get all morphological features in `input_src`
@@ -39,6 +57,12 @@ class MorphologicalFeature:
             (default treat text as formal text)
         sep_regex: str, optional
             Regex that will be used to split a multi sentences text into a list of single sentence 
+        n_jobs: int, default=1
+            Number of worker processes, -1 uses all CPU cores
+        stage_workers: tuple of 3 int, optional
+            Threads of each pipelined analysis stage, e.g. (4, 1, 1)
+        progress: bool or callable, default=True
+            Progress of reading the file of 'f' mode
 
         Returns
         -------
@@ -55,20 +79,71 @@ class MorphologicalFeature:
 
         """
 
-        sentence_list = _get_sentence_list(input_src.strip(), input_mode, sep_regex)
+        sentence_list = _get_sentence_list(
+            input_src.strip(), input_mode, sep_regex, progress=progress
+        )
 
         if len(sentence_list) == 0:
             return []
 
-        result = []
-
-        for sentence in sentence_list:
-            sentence_result = self._get_feature_one_sentence(
-                sentence, is_informal
+        return list(
+            _map_analyzed_sentences(
+                self, "_get_feature_one_sentence", _to_form_feat, sentence_list,
+                (is_informal,), n_jobs, stage_workers
             )
-            result.append(sentence_result)
+        )
+
+    def iter_feature(
+        self, input_src: str,
+        input_mode: Literal["f", "s"] = "s",
+        is_informal: bool = False,
+        sep_regex: str = None,
+        n_jobs: int = 1,
+        stage_workers: Tuple[int, int, int] = None
+    ) -> Iterator[List[tuple[str, List]]]:
+        """
+        Lazy version of :meth:`get_feature`, yields the morphological features
+        of one sentence at a time
+
+        With `input_mode` 'f', the file is read, split and analyzed sentence by
+        sentence while the result is consumed, so memory stays flat for large files
+
+        Parameters
+        ----------
+        input_src: str
+            Python string or file path that contains Indonesian text
+        input_mode: {'f', 's'}, default='s'
+            's' mode : `input_src` is assumed to be a Python str.
+            'f' mode : `input_src` is processed as a file path.
+        is_informal: bool, default=False
+            Processes text in `input_src` as informal text or not
+            (default treat text as formal text)
+        sep_regex: str, optional
+            Regex that will be used to split a multi sentences text into a list of single sentence
+        n_jobs: int, default=1
+            Number of worker processes, -1 uses all CPU cores
+        stage_workers: tuple of 3 int, optional
+            Threads of each pipelined analysis stage, e.g. (4, 1, 1)
 
-        return result
+        Yields
+        ------
+        list of tuple
+            pairs of token and its list of morphological features for one sentence
+
+        Examples
+        --------
+        >>> from aksara import MorphologicalFeature
+        >>> features = MorphologicalFeature()
+        >>> list(features.iter_feature('Andi bermain di taman'))
+        [[('Andi', []), ('bermain', ['Voice=Act']), ('di', []), ('taman', ['Number=Sing'])]]
+
+        """
+
+        sentences = _iter_sentence_list(input_src.strip(), input_mode, sep_regex)
+        return _map_analyzed_sentences(
+            self, "_get_feature_one_sentence", _to_form_feat, sentences,
+            (is_informal,), n_jobs, stage_workers
+        )
 
     def get_feature_to_file(
             self, input_src: str,
@@ -76,7 +151,10 @@ class MorphologicalFeature:
             input_mode: Literal["f", "s"] = "s",
             write_mode: Literal['a', 'w', 'x'] = 'x',
             is_informal: bool = False,
-            sep_regex: str = None
+            sep_regex: str = None,
+            n_jobs: int = 1,
+            stage_workers: Tuple[int, int, int] = None,
+            resume: bool = False
     ) -> str:
         """
         Get all morphological features in `input_src` and save the result in a file
@@ -99,6 +177,12 @@ class MorphologicalFeature:
             (default treat text as formal text)
         sep_regex: str, optional
             Regex that will be used to split a multi sentences text into a list of single sentence 
+        n_jobs: int, default=1
+            Number of worker processes, -1 uses all CPU cores
+        stage_workers: tuple of 3 int, optional
+            Threads of each pipelined analysis stage, e.g. (4, 1, 1)
+        resume: bool, default=False
+            Continues the partial `write_path` of an interrupted call
 
         Returns
         -------
@@ -112,38 +196,24 @@ class MorphologicalFeature:
         if write_mode not in all_write_modes:
             raise ValueError(f"write_mode must be in {all_write_modes}")
 
-        sentence_list = _get_sentence_list(input_src.strip(), input_mode, sep_regex)
-
-        idx_token_morphs = []
-
-        for sentence in sentence_list:
-            analyzed_sentence = analyze_sentence(
-                        sentence,
-                        self.default_analyzer,
-                        self.default_dependency_parser,
-                        v1=False,
-                        lemma=False,
-                        postag=False,
-                        informal=is_informal
-                    )
-
-            result = []
-            for row in analyzed_sentence.split("\n"):
-                idx, form, _, _, _, feat, _, _, _, _ = row.split("\t")
-                result.append((idx, form, feat))
-
-            idx_token_morphs.append(result)
-
-        _write_reduce_conllu(
-            sentence_list,
-            idx_token_morphs,
-            write_path,
-            write_mode=write_mode,
-            separator=sep_regex
+        sentences = _iter_sentence_list(input_src.strip(), input_mode, sep_regex)
+        _write_analyzed_stream(
+            _write_reduce_conllu_stream, self, "_get_feature_one_sentence_with_id",
+            _to_id_form_feat, sentences, write_path, (is_informal,), n_jobs, stage_workers, resume,
+            write_mode=write_mode, separator=sep_regex
         )
 
         return os.path.realpath(write_path)
 
+    def _get_feature_one_sentence_with_id(
+        self, sentence: str,
+        is_informal: bool = False
+    ) -> List[tuple[str, str, str]]:
+
+        tokens = analyze_sentence_tokens(sentence, **self._analysis_kwargs(is_informal))
+
+        return _to_id_form_feat(tokens)
+
     def _get_feature_one_sentence(
         self, sentence: str,
         is_informal: bool = False
@@ -154,24 +224,36 @@ class MorphologicalFeature:
         if sentence == "":
             return []
 
-        analyzed_sentence = analyze_sentence(
-            sentence,
-            self.default_analyzer,
-            self.default_dependency_parser,
-            v1=False,
-            lemma=False,
-            postag=False,
-            informal=is_informal
-        )
+        tokens = analyze_sentence_tokens(sentence, **self._analysis_kwargs(is_informal))
+
+        return _to_form_feat(tokens)
+
+    def _analysis_kwargs(self, is_informal: bool) -> dict:
+        """
+        the analyzer, dependency parser, cache and flags of one call, see analyze_sentence_tokens
+        """
+
+        return {
+            "analyzer": self.default_analyzer,
+            "dependency_parser": self.default_dependency_parser,
+            "cache": self.cache,
+            "v1": False,
+            "lemma": False,
+            "postag": False,
+            "informal": is_informal,
+        }
+
+
+def _to_form_feat(tokens: List[Token]) -> List[tuple[str, List]]:
+    result = []
+    for token in tokens:
+        if token.feats != "_":
+            result.append((token.form, token.feats.split("|")))
+        else:
+            result.append((token.form, []))
 
-        result = []
-        for row in analyzed_sentence.split("\n"):
-            _, form, _, _, _, feat, _, _, _, _ = row.split("\t")
+    return result
 
-            if feat != "_":
-                feat = feat.split("|")
-                result.append((form, feat))
-            else:
-                result.append((form, []))
 
-        return result
+def _to_id_form_feat(tokens: List[Token]) -> List[tuple[str, str, str]]:
+    return [(token.idx, token.form, token.feats) for token in tokens]
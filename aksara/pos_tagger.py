@@ -1,22 +1,54 @@
 """This file contains various POS tagging functions"""
 
 import os
-from typing import List, Tuple, Literal
-from ._nlp_internal import _get_foma_script_path, TextNormalizer
-from ._nlp_internal.core import analyze_sentence
+from typing import Iterator, List, Tuple, Literal
+from ._nlp_internal import _get_foma_script_path
+from ._nlp_internal.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_WAIT, ParseBatcher
+from ._nlp_internal.core import (
+    aanalyze_sentences, analyze_sentence_tokens, get_text_normalizer
+)
 from ._nlp_internal.analyzer import BaseAnalyzer
 from ._nlp_internal.dependency_parsing.core import DependencyParser
-from .utils.conllu_io import _write_reduce_conllu
-from .utils.sentence_util import _get_sentence_list
+from ._nlp_internal.sentence import Token
+from .utils.conllu_io import _write_analyzed_stream, _write_reduce_conllu_stream
+from .utils.parallel import _map_analyzed_sentences
+from .utils.progress import Progress
+from .utils.sentence_cache import SentenceCache
+from .utils.sentence_util import _aget_sentence_list, _get_sentence_list, _iter_sentence_list
 
 class POSTagger:
     """
     Class to perform POS Tagging
+
+    The options for large inputs are described in :ref:`large_inputs`
+
+    Parameters
+    ----------
+    batch_max_wait : float, optional
+        seconds a concurrent :meth:`atag` request waits for others to share
+        its parser batch, default is 0.005
+
+    batch_max_size : int, optional
+        maximum number of sentences in one parser batch of :meth:`atag`,
+        default is 16
+
+    cache : SentenceCache, optional
+        analysis of the sentences seen before, default is None
     """
 
-    def __init__(self) -> None:
-        self.analyzer = BaseAnalyzer(_get_foma_script_path(), TextNormalizer())
+    def __init__(
+        self,
+        batch_max_wait: float = DEFAULT_MAX_WAIT,
+        batch_max_size: int = DEFAULT_MAX_BATCH_SIZE,
+        cache: SentenceCache = None
+    ) -> None:
+        # the foma lookups are shared by all the sentences, see BaseAnalyzer.batch
+        self.analyzer = BaseAnalyzer(
+            _get_foma_script_path(), get_text_normalizer(), memoize_lookups=True
+        )
         self.dependency_parser = DependencyParser()
+        self.parse_batcher = ParseBatcher(batch_max_size, batch_max_wait)
+        self.cache = cache
 
     def tag(
         self,
@@ -24,6 +56,9 @@ class POSTagger:
         input_mode: Literal["s", "f"] = "s",
         is_informal: bool = False,
         sep_regex: str = None,
+        n_jobs: int = 1,
+        stage_workers: Tuple[int, int, int] = None,
+        progress: Progress = True
     ) -> List[List[Tuple[str, str]]]:
         """
         Performs POS tagging on the input text, then returns a list of list of tuple containing
@@ -49,6 +84,15 @@ class POSTagger:
         sep_regex : str, optional
             regex rule that specifies the end of sentence, default is None
 
+        n_jobs : int, optional
+            number of worker processes, -1 uses all CPU cores, default is 1
+
+        stage_workers : tuple of 3 int, optional
+            threads of each pipelined analysis stage, e.g. (4, 1, 1), default is None
+
+        progress : bool or callable, optional
+            progress of reading the file of `input_mode` 'f', default is True
+
         Returns
         -------
         list of list of tuple
@@ -72,13 +116,149 @@ class POSTagger:
 
         """
 
-        sentence_list = _get_sentence_list(input_src, input_mode, sep_regex)
-        result = []
-        for sentence in sentence_list:
-            analyzed_sentence = self._tag_one_sentence(sentence, is_informal)
+        sentence_list = _get_sentence_list(input_src, input_mode, sep_regex, progress=progress)
+
+        return list(
+            _map_analyzed_sentences(
+                self, "_tag_one_sentence", _to_word_tags, sentence_list,
+                (is_informal,), n_jobs, stage_workers
+            )
+        )
+
+    async def atag(
+        self,
+        input_src: str,
+        input_mode: Literal["s", "f"] = "s",
+        is_informal: bool = False,
+        sep_regex: str = None,
+        progress: Progress = True
+    ) -> List[List[Tuple[str, str]]]:
+        """
+        Coroutine version of :meth:`tag` for asyncio applications
+
+        foma runs as a non-blocking subprocess and the CPU bound stages run in
+        executor threads, so the event loop stays responsive. Sentences of
+        concurrent calls are coalesced into parser batches, see `batch_max_wait`
+        and `batch_max_size` of :class:`POSTagger`
+
+        Parameters
+        ----------
+        input_src : str
+            text that will be parsed if `input_mode` is set to 's' or
+            file path to a file containing the text if `input_mode`
+            is set to 'f'
+
+        input_mode : {'f', 's'}, optional
+            specifies the source of the input, default is 's'
+
+        is_informal : bool, optional
+            assumes the text is informal, default is False
+
+        sep_regex : str, optional
+            regex rule that specifies the end of sentence, default is None
+
+        progress : bool or callable, optional
+            progress of reading the file of `input_mode` 'f', default is True
+
+        Returns
+        -------
+        list of list of tuple
+            same as :meth:`tag`
+
+        Raises
+        ------
+        ValueError
+            if `input_mode` is not in ['f', 's']
+        FileNotFoundError
+            if `input_mode` is set to 'f' but the referenced file in `input_src` doesn't exist
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> from aksara import POSTagger
+        >>> tagger = POSTagger()
+        >>> asyncio.run(tagger.atag("Apa yang kamu inginkan?"))
+        [[('Apa', 'PRON'), ('yang', 'SCONJ'), ('kamu', 'PRON'), ('inginkan', 'VERB'), ('?', 'PUNCT')]]
+
+        """
+
+        sentence_list = await _aget_sentence_list(
+            input_src, input_mode, sep_regex, progress=progress
+        )
+
+        analyzed_sentences = await aanalyze_sentences(
+            sentence_list, parse_batcher=self.parse_batcher, **self._analysis_kwargs(is_informal)
+        )
+
+        return [_to_word_tags(analyzed_sentence) for analyzed_sentence in analyzed_sentences]
+
+    def iter_tag(
+        self,
+        input_src: str,
+        input_mode: Literal["s", "f"] = "s",
+        is_informal: bool = False,
+        sep_regex: str = None,
+        n_jobs: int = 1,
+        stage_workers: Tuple[int, int, int] = None
+    ) -> Iterator[List[Tuple[str, str]]]:
+        """
+        Lazy version of :meth:`tag`, yields the POS tagging result of
+        one sentence at a time
+
+        With `input_mode` 'f', the file is read, split and tagged sentence by
+        sentence while the result is consumed, so memory stays flat for large
+        files and the first sentence is available immediately
+
+        Parameters
+        ----------
+        input_src : str
+            text that will be parsed if `input_mode` is set to 's' or
+            file path to a file containing the text if `input_mode`
+            is set to 'f'
+
+        input_mode : {'f', 's'}, optional
+            specifies the source of the input, default is 's'
+
+        is_informal : bool, optional
+            assumes the text is informal, default is False
+
+        sep_regex : str, optional
+            regex rule that specifies the end of sentence, default is None
+
+        n_jobs : int, optional
+            number of worker processes, -1 uses all CPU cores, default is 1
+
+        stage_workers : tuple of 3 int, optional
+            threads of each pipelined analysis stage, e.g. (4, 1, 1), default is None
+
+        Yields
+        ------
+        list of tuple
+            each word in one sentence with its corresponding POS tag
+
+        Raises
+        ------
+        ValueError
+            if `input_mode` is not in ['f', 's']
+        FileNotFoundError
+            if `input_mode` is set to 'f' but the referenced file in `input_src` doesn't exist
+
+        Examples
+        --------
+        >>> from aksara import POSTagger
+        >>> tagger = POSTagger()
+        >>> for sentence in tagger.iter_tag("Apa yang kamu inginkan? Saya ingin makan."):
+        ...     print(sentence)
+        [('Apa', 'PRON'), ('yang', 'SCONJ'), ('kamu', 'PRON'), ('inginkan', 'VERB'), ('?', 'PUNCT')]
+        [('Saya', 'PRON'), ('ingin', 'VERB'), ('makan', 'VERB'), ('.', 'PUNCT')]
+
+        """
 
-            result.append(analyzed_sentence)
-        return result
+        sentences = _iter_sentence_list(input_src, input_mode, sep_regex)
+        return _map_analyzed_sentences(
+            self, "_tag_one_sentence", _to_word_tags, sentences,
+            (is_informal,), n_jobs, stage_workers
+        )
 
     def tag_to_file(
         self,
@@ -88,6 +268,9 @@ class POSTagger:
         write_mode: Literal["x", "a", "w"] = "x",
         is_informal: bool = False,
         sep_regex: str = None,
+        n_jobs: int = 1,
+        stage_workers: Tuple[int, int, int] = None,
+        resume: bool = False
     ) -> str:
         """
         Performs POS tagging on the input text, then saves the result
@@ -132,6 +315,15 @@ class POSTagger:
         sep_regex : str, optional
             regex rule that specifies the end of sentence, default is None
 
+        n_jobs : int, optional
+            number of worker processes, -1 uses all CPU cores, default is 1
+
+        stage_workers : tuple of 3 int, optional
+            threads of each pipelined analysis stage, e.g. (4, 1, 1), default is None
+
+        resume : bool, optional
+            continues the partial `write_path` of an interrupted call, default is False
+
         Returns
         -------
         str
@@ -154,36 +346,26 @@ class POSTagger:
         if write_mode not in all_write_modes:
             raise ValueError(f"write_mode must be in {all_write_modes}")
 
-        clean_sentence_list = _get_sentence_list(input_src, input_mode, sep_regex)
-        result = []
-        for sentence in clean_sentence_list:
-            temp_result = analyze_sentence(
-                text=sentence,
-                analyzer=self.analyzer,
-                dependency_parser=self.dependency_parser,
-                v1=False,
-                lemma=False,
-                postag=True,
-                informal=is_informal,
-            )
-
-            one_sentence_result = []
+        sentences = _iter_sentence_list(input_src, input_mode, sep_regex)
+        _write_analyzed_stream(
+            _write_reduce_conllu_stream, self, "_tag_one_sentence_with_id", _to_id_word_tags,
+            sentences, write_path, (is_informal,), n_jobs, stage_workers, resume,
+            write_mode=write_mode, separator=sep_regex
+        )
 
-            for line in temp_result.split("\n"):
-                id_token_tag = line.split("\t")
-                one_sentence_result.append(id_token_tag)
+        return os.path.abspath(write_path)
 
-            result.append(one_sentence_result)
+    def _tag_one_sentence_with_id(
+        self, sentence: str, is_informal: bool = False
+    ) -> List[List[str]]:
+        """
+        performs pos tagging on one sentence, then returns the
+        [id, word, POS tag] rows of the sentence
+        """
 
-        _write_reduce_conllu(
-            clean_sentence_list,
-            result,
-            write_path,
-            write_mode=write_mode,
-            separator=sep_regex
-        )
+        tokens = analyze_sentence_tokens(sentence, **self._analysis_kwargs(is_informal))
 
-        return os.path.abspath(write_path)
+        return _to_id_word_tags(tokens)
 
     def _tag_one_sentence(
         self, sentence: str, is_informal: bool = False
@@ -199,20 +381,29 @@ class POSTagger:
         if sentence == "":
             return []
 
-        temp_result = analyze_sentence(
-            text=sentence,
-            analyzer=self.analyzer,
-            dependency_parser=self.dependency_parser,
-            v1=False,
-            lemma=False,
-            postag=True,
-            informal=is_informal,
-        )
+        tokens = analyze_sentence_tokens(sentence, **self._analysis_kwargs(is_informal))
+
+        return _to_word_tags(tokens)
+
+    def _analysis_kwargs(self, is_informal: bool) -> dict:
+        """
+        the analyzer, dependency parser, cache and flags of one call, see analyze_sentence_tokens
+        """
+
+        return {
+            "analyzer": self.analyzer,
+            "dependency_parser": self.dependency_parser,
+            "cache": self.cache,
+            "v1": False,
+            "lemma": False,
+            "postag": True,
+            "informal": is_informal,
+        }
+
 
-        result = []
+def _to_word_tags(tokens: List[Token]) -> List[Tuple[str, str]]:
+    return [(token.form, token.upos) for token in tokens]
 
-        for line in temp_result.split("\n"):
-            _, word, postag = line.split("\t")
-            result.append((word, postag))
 
-        return result
+def _to_id_word_tags(tokens: List[Token]) -> List[List[str]]:
+    return [[token.idx, token.form, token.upos] for token in tokens]
@@ -1,3 +1,28 @@
-from .abstract_tokenizer import AbstractTokenizer
-from .base_tokenizer import BaseTokenizer
-from .multiword_tokenizer import MultiwordTokenizer
\ No newline at end of file
+"""
+Exports are resolved lazily (PEP 562), so BaseTokenizer doesn't import
+the analyzer that MultiwordTokenizer needs.
+"""
+
+from importlib import import_module
+
+_LAZY_IMPORTS = {
+    'AbstractTokenizer': '.abstract_tokenizer',
+    'BaseTokenizer': '.base_tokenizer',
+    'MultiwordTokenizer': '.multiword_tokenizer',
+    'TokenSpans': '.._nlp_internal.tokenizer',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
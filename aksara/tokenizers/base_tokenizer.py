@@ -1,5 +1,6 @@
-from typing import List
+from typing import Iterable, List, Union
 import aksara._nlp_internal.tokenizer as _internal_tokenizer
+from aksara._nlp_internal.tokenizer import TokenSpans
 
 from .abstract_tokenizer import AbstractTokenizer
 
@@ -52,3 +53,87 @@ class BaseTokenizer(AbstractTokenizer):
             all_tokens.append(token_in_sentence)
 
         return all_tokens
+
+    def tokenize_spans(self, text: str, ssplit: bool=True) -> List[TokenSpans]:
+        """tokenize `text` into character offsets instead of strings
+
+        The tokens are the same as the ones of `tokenize`, but each sentence is
+        a `TokenSpans` that holds the (start, end) offsets of its tokens into
+        `text` in two compact arrays, so no token string is copied until it's
+        accessed. SpaceAfter follows from the offsets, see
+        `TokenSpans.no_space_after`.
+
+        Parameters
+        ----------
+
+        text: str
+            text that will be tokenized
+
+        ssplit: bool, default=True
+            Tell tokenizer to split sentences (ssplit=False, assume the text as one sentence)
+
+        Returns
+        -------
+        list of TokenSpans
+            The token offsets of each sentence
+
+        Examples
+        --------
+        >>> from aksara import BaseTokenizer
+        >>> tokenizer = BaseTokenizer()
+        >>> spans = tokenizer.tokenize_spans("Ani suka apel. Beni suka tidur")
+        >>> list(spans[0])
+        [(0, 3), (4, 8), (9, 13), (13, 14)]
+        >>> spans[1][0]
+        'Beni'
+
+        """
+
+        stripped_text = text.strip()
+
+        if len(stripped_text) == 0:
+            return []
+
+        all_spans = []
+
+        # the sentences are pieces of the stripped text, in order
+        offset = len(text) - len(text.lstrip())
+        for sentence in self._preprocess_text(stripped_text, ssplit):
+            start = text.index(sentence, offset)
+            offset = start + len(sentence)
+            all_spans.append(self.__base_tokenizer.tokenize_spans(text, start, offset))
+
+        return all_spans
+
+    def tokenize_batch(self, texts: Iterable[str], ssplit: bool=True,
+                       spans: bool=False) -> Union[List[List[List[str]]], List[List[TokenSpans]]]:
+        """tokenize every text of `texts`
+
+        Parameters
+        ----------
+
+        texts: iterable of str
+            texts that will be tokenized, e.g. the documents of a corpus
+
+        ssplit: bool, default=True
+            Tell tokenizer to split sentences (ssplit=False, assume every text as one sentence)
+
+        spans: bool, default=False
+            Return the `TokenSpans` of `tokenize_spans` instead of the token strings
+
+        Returns
+        -------
+        list of list of list of str, or list of list of TokenSpans
+            The result of `tokenize` (or `tokenize_spans`) of each text
+
+        Examples
+        --------
+        >>> from aksara import BaseTokenizer
+        >>> tokenizer = BaseTokenizer()
+        >>> tokenizer.tokenize_batch(["Ani suka apel.", "Beni suka tidur"])
+        [[['Ani', 'suka', 'apel', '.']], [['Beni', 'suka', 'tidur']]]
+
+        """
+
+        tokenize = self.tokenize_spans if spans else self.tokenize
+        return [tokenize(text, ssplit) for text in texts]
@@ -1,7 +1,6 @@
 from typing import List
-from .._nlp_internal import _get_foma_script_path, TextNormalizer
-from .._nlp_internal.dependency_parsing.core import DependencyParser
-from .._nlp_internal.core import analyze_sentence
+from .._nlp_internal import _get_foma_script_path
+from .._nlp_internal.core import analyze_tokens, get_text_normalizer
 from .._nlp_internal.analyzer import BaseAnalyzer
 
 from .abstract_tokenizer import AbstractTokenizer
@@ -13,8 +12,7 @@ class MultiwordTokenizer(AbstractTokenizer):
     """
 
     def __init__(self) -> None:
-        self.__base_analyzer = BaseAnalyzer(_get_foma_script_path(), TextNormalizer())
-        self.__dependency_parser = DependencyParser()
+        self.__base_analyzer = BaseAnalyzer(_get_foma_script_path(), get_text_normalizer())
 
     def tokenize(self, text: str, ssplit: bool=True, **kwargs) -> List[str]:
         """tokenize `text`
@@ -50,23 +48,13 @@ class MultiwordTokenizer(AbstractTokenizer):
 
         all_tokens = []
 
-        for stripped_sentence in self._preprocess_text(stripped_text, ssplit):
-            analyzed_result = analyze_sentence(
-                stripped_sentence,
-                self.__base_analyzer,
-                self.__dependency_parser,
-                informal=True,
-                v1=False,
-                postag=True,
-                lemma=False
-            )
+        # the split points come from the foma analysis alone, the disambiguation and the
+        # parser never change a form, and the sentences of `text` share their lookups
+        analyzer = self.__base_analyzer.batch()
 
-            result: List[str] = []
-            for conllu_row in analyzed_result.split("\n"):
-                idx, form, _ = conllu_row.split("\t")
-                if "-" not in idx:
-                    result.append(form)
+        for stripped_sentence in self._preprocess_text(stripped_text, ssplit):
+            tokens = analyze_tokens(stripped_sentence, analyzer, informal=True)
 
-            all_tokens.append(result)
+            all_tokens.append([token.form for token in tokens if token.is_word()])
 
         return all_tokens
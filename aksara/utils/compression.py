@@ -0,0 +1,66 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+from typing import IO, Literal, Optional
+
+from .progress import ProgressCallback, _ProgressReader
+
+Compression = Optional[Literal['infer', 'gzip', 'bz2', 'xz']]
+
+_OPENERS = {
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+
+_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.lzma': 'xz',
+}
+
+COMPRESSIONS = ['infer', None] + list(_OPENERS)
+
+
+def _get_codec(file_path: str, compression: Compression = 'infer') -> Optional[str]:
+    """ the codec of `compression`, 'infer' picks it from the extension of `file_path`
+
+    returns None for an uncompressed file
+    """
+
+    if compression == 'infer':
+        return _EXTENSIONS.get(os.path.splitext(str(file_path))[1].lower())
+
+    if compression is not None and compression not in _OPENERS:
+        raise ValueError(f"compression must be one of {COMPRESSIONS}, but {compression} was given")
+
+    return compression
+
+
+def _open_text(file_path: str, mode: str = 'r', compression: Compression = 'infer',
+               buffering: int = -1, progress: ProgressCallback = None) -> IO[str]:
+    """ opens a UTF-8 text file, (de)compressing it on the fly with the codec of `compression`
+
+    the compressed streams are read and written incrementally, a compressed
+    file is never held in memory or on disk uncompressed. When reading,
+    `progress` is called with the bytes read from disk and the file size,
+    for a compressed file both are compressed sizes
+    """
+
+    codec = _get_codec(file_path, compression)
+    if progress is not None and mode == 'r':
+        raw = open(file_path, 'rb', buffering=0)  # pylint: disable=consider-using-with
+        reader = _ProgressReader(raw, progress, os.fstat(raw.fileno()).st_size)
+        stream = io.BufferedReader(reader, buffering if buffering > 0 else io.DEFAULT_BUFFER_SIZE)
+        if codec is None:
+            return io.TextIOWrapper(stream, encoding='utf-8')
+        return _OPENERS[codec](stream, 'rt', encoding='utf-8')
+
+    if codec is None:
+        return open(file_path, mode, encoding='utf-8', buffering=buffering)
+
+    return _OPENERS[codec](file_path, mode + 't', encoding='utf-8')
@@ -0,0 +1,249 @@
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from typing import List, Optional, Union
+
+from ..conllu import ConlluData
+from .conllu_io import _parse_conllu_lines, _text_lines
+
+_INDEX_SUFFIX = '.idx'
+_INDEX_MAGIC = b'AKSIDX2\n'
+
+# number of sentences, size and modification time (ns) of the indexed file
+_INDEX_HEADER = struct.Struct('<QQQ')
+
+
+def build_conllu_index(file_path: str, index_path: str = None) -> str:
+    """
+    Record the byte range and ``sent_id`` of every sentence of a CoNLL-U file
+    in a sidecar index file.
+
+    The file is scanned once in binary mode, nothing is parsed but the
+    ``# sent_id`` comments.
+
+    Parameters
+    ----------
+    file_path: str
+        the path of file containing CoNNL-U data
+
+    index_path: str, default=None
+        Where to write the index, default to ``file_path + '.idx'``.
+
+    Returns
+    -------
+    str
+        The absolute path of the index file.
+    """
+
+    if index_path is None:
+        index_path = file_path + _INDEX_SUFFIX
+
+    starts = array('Q')
+    ends = array('Q')
+    sent_ids = []
+
+    offset = 0
+    in_sentence = False
+    # a block of comments only belongs to the next sentence, like in _parse_conllu_lines
+    has_rows = False
+    with open(file_path, 'rb', buffering=1 << 20) as conllu_file:
+        for line in conllu_file:
+            if line.isspace():
+                if has_rows:
+                    ends.append(offset)
+                    in_sentence = has_rows = False
+            else:
+                if not in_sentence:
+                    starts.append(offset)
+                    sent_ids.append('')
+                    in_sentence = True
+                if line.startswith(b'#'):
+                    if line.startswith(b'# sent_id'):
+                        _, has_value, value = line.partition(b' = ')
+                        if has_value:
+                            sent_ids[-1] = value.strip().decode('utf-8')
+                else:
+                    has_rows = True
+            offset += len(line)
+
+    if has_rows:
+        ends.append(offset)
+    elif in_sentence:
+        # comments after the last sentence
+        starts.pop()
+        sent_ids.pop()
+
+    stat = os.stat(file_path)
+    _write_index(index_path, stat, starts, ends, sent_ids)
+
+    return os.path.realpath(index_path)
+
+
+class IndexedConllu:
+    """
+    Random access to the sentences of a large CoNLL-U file
+
+    The file is memory-mapped and the sentence byte ranges come from the
+    sidecar index of :func:`build_conllu_index`, so fetching a sentence only
+    parses that sentence. The index is built when it doesn't exist yet or
+    when the CoNLL-U file changed after it was built.
+
+    Parameters
+    ----------
+    file_path: str
+        the path of file containing CoNNL-U data
+
+    index_path: str, default=None
+        The sidecar index, default to ``file_path + '.idx'``.
+
+    separator: str
+        Regex separator between 2 columns in CoNNL-U, default to one or more whitespaces.
+
+    Examples
+    --------
+    >>> from aksara.utils.conllu_index import IndexedConllu
+    >>> with IndexedConllu('parsed.conllu') as conllu:  # doctest: +SKIP
+    ...     last = conllu[-1]
+    ...     sentence = conllu.get_by_sent_id('1024')
+    """
+
+    def __init__(self, file_path: str, index_path: str = None, separator: str = r'\s+'):
+        if index_path is None:
+            index_path = file_path + _INDEX_SUFFIX
+
+        self.separator = separator
+        stat = os.stat(file_path)
+
+        index = _read_index(index_path) if os.path.exists(index_path) else None
+        if index is None or index[0] != (stat.st_size, stat.st_mtime_ns):
+            build_conllu_index(file_path, index_path)
+            index = _read_index(index_path)
+
+        _, self.__starts, self.__ends, self.__sent_ids = index
+        self.__sent_id_positions = None
+
+        self.__file = open(file_path, 'rb')
+        # an empty file can't be mapped, but it has no sentence to read either
+        self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ) \
+            if stat.st_size > 0 else b''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """Unmap and close the CoNLL-U file."""
+
+        if isinstance(self.__mmap, mmap.mmap):
+            self.__mmap.close()
+        self.__file.close()
+
+    def __len__(self) -> int:
+        return len(self.__starts)
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[List[ConlluData], List[List[ConlluData]]]:
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self.get_range(start, stop)
+
+        idx = range(len(self))[idx]
+        return self.__parse(self.__starts[idx], self.__ends[idx])[0]
+
+    def get_range(self, start: int, stop: int) -> List[List[ConlluData]]:
+        """
+        Sentences ``start`` to ``stop - 1``, read as one contiguous slice of the file.
+        """
+
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return []
+
+        return self.__parse(self.__starts[start], self.__ends[stop - 1])
+
+    def sent_ids(self) -> List[str]:
+        """The ``sent_id`` of every sentence, an empty string for a sentence without one."""
+
+        return list(self.__sent_ids)
+
+    def get_by_sent_id(self, sent_id: str) -> Optional[List[ConlluData]]:
+        """The sentence with ``# sent_id = sent_id``, or None if there is none."""
+
+        if self.__sent_id_positions is None:
+            self.__sent_id_positions = {}
+            for position, known_id in enumerate(self.__sent_ids):
+                self.__sent_id_positions.setdefault(known_id, position)
+
+        position = self.__sent_id_positions.get(str(sent_id))
+        if position is None:
+            return None
+
+        return self[position]
+
+    def __parse(self, start, end):
+        lines = _text_lines(self.__mmap[start:end])
+        return [
+            [ConlluData(*row) for row in rows]
+            for _, rows in _parse_conllu_lines(lines, self.separator)
+        ]
+
+
+def _write_index(index_path, stat, starts, ends, sent_ids):
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(index_path)), suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'wb') as index_file:
+            index_file.write(_INDEX_MAGIC)
+            index_file.write(_INDEX_HEADER.pack(len(starts), stat.st_size, stat.st_mtime_ns))
+            _to_little_endian(starts).tofile(index_file)
+            _to_little_endian(ends).tofile(index_file)
+            # every sent_id ends with a newline, a truncated list is detected when reading
+            index_file.write(''.join(sent_id + '\n' for sent_id in sent_ids).encode('utf-8'))
+        os.chmod(temp_path, 0o644)  # mkstemp creates files readable by the owner only
+
+        # atomic, a reader never sees a partially written index
+        os.replace(temp_path, index_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def _read_index(index_path):
+    """((file size, mtime), starts, ends, sent_ids), or None if it's not a complete index"""
+
+    with open(index_path, 'rb') as index_file:
+        if index_file.read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+            return None
+
+        # a truncated or corrupt index (e.g. the disk was full) is rebuilt like a missing one
+        try:
+            n_sentences, size, mtime_ns = _INDEX_HEADER.unpack(
+                index_file.read(_INDEX_HEADER.size)
+            )
+
+            starts = array('Q')
+            starts.fromfile(index_file, n_sentences)
+            ends = array('Q')
+            ends.fromfile(index_file, n_sentences)
+            sent_ids = index_file.read().decode('utf-8').split('\n')
+        except (EOFError, ValueError, struct.error, MemoryError, OverflowError):
+            return None
+
+    if sent_ids.pop() != '' or len(sent_ids) != n_sentences:
+        return None
+
+    return (size, mtime_ns), _to_little_endian(starts), _to_little_endian(ends), sent_ids
+
+
+def _to_little_endian(offsets):
+    # the index is stored little endian, swapping is its own inverse
+    if struct.pack('=H', 1) != struct.pack('<H', 1):
+        offsets = array('Q', offsets)
+        offsets.byteswap()
+    return offsets
@@ -1,10 +1,29 @@
-from typing import Any, List, Literal, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice, tee
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Tuple, Union
+import io
 import re
 import os
 
-from ..conllu import ConlluData
+from ..conllu import ConlluData, ParsedCorpus
+from .compression import Compression, _get_codec, _open_text
+from .parallel import _check_n_jobs, _map_analyzed_sentences
 
-def read_conllu(file_path: str, separator: str=r'\s+') -> List[List[ConlluData]]:
+_READ_BUFFER_SIZE = 1 << 20
+
+# the parallel reader gives every process a few byte ranges of at least this size
+_MIN_CHUNK_BYTES = 1 << 20
+_CHUNKS_PER_JOB = 4
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# the first line of every block written by _write_blocks
+_SENT_ID_LINE = re.compile(rb'\n# sent_id = (\d+)\n')
+_RESUME_READ_SIZE = 1 << 16
+
+def read_conllu(file_path: str, separator: str=r'\s+', as_corpus: bool=False,
+                n_jobs: int=1, compression: Compression='infer'
+                ) -> Union[List[List[ConlluData]], ParsedCorpus]:
     """
     Read CoNNL-U format file.
 
@@ -15,72 +34,263 @@ def read_conllu(file_path: str, separator: str=r'\s+') -> List[List[ConlluData]]
     
     separator: str
         Regex separator between 2 columns in CoNNL-U, default to one or more whitespaces.
+
+    as_corpus: bool, default=False
+        Return a columnar :class:`ParsedCorpus` instead of creating one
+        :class:`ConlluData` per row, which needs far less memory for large treebanks.
+
+    n_jobs: int, default=1
+        Number of processes, -1 uses all CPU cores. The file is split into byte
+        ranges at blank lines between sentences, the ranges are parsed in parallel
+        and merged in order, so the result is the same as with one process. The
+        merge is cheapest with `as_corpus`. A compressed file can't be split and
+        is always read by one process.
+
+    compression: {'infer', 'gzip', 'bz2', 'xz', None}, default='infer'
+        Codec of the file, 'infer' picks it from the extension (``.gz``,
+        ``.bz2``, ``.xz``) and None reads the file as plain text. A compressed
+        file is decompressed while it is read.
     
     Returns
     -------
-    list of list of :class:`ConnluData`
+    list of list of :class:`ConnluData` or :class:`ParsedCorpus`
         The inner list contains CoNNL-U rows for one sentence.
 
     """
 
-    conllu_result = []
-    with open(file_path, encoding='utf-8') as conllu_file:
-        next_sentence = conllu_file.readline()
-        while next_sentence != '':
+    n_jobs = _check_n_jobs(n_jobs)
+    if n_jobs > 1 and _get_codec(file_path, compression) is None:
+        return _read_conllu_parallel(file_path, separator, as_corpus, n_jobs)
+
+    if not as_corpus:
+        return list(iter_conllu(file_path, separator, compression=compression))
+
+    corpus = ParsedCorpus()
+    for _, rows in _iter_conllu_rows(file_path, separator, compression):
+        corpus.append_rows(rows)
+
+    return corpus
+
+
+def _read_conllu_parallel(file_path, separator, as_corpus, n_jobs):
+    file_size = os.path.getsize(file_path)
+    n_chunks = max(1, min(n_jobs * _CHUNKS_PER_JOB, file_size // _MIN_CHUNK_BYTES))
+    boundaries = _find_sentence_boundaries(file_path, n_chunks)
+    byte_ranges = list(zip(boundaries, boundaries[1:]))
+
+    corpus = ParsedCorpus() if as_corpus else []
+    read_range = partial(_read_byte_range, file_path, separator=separator)
+
+    starts, ends = zip(*byte_ranges)
+    with ProcessPoolExecutor(max_workers=min(n_jobs, len(byte_ranges))) as executor:
+        for chunk in executor.map(read_range, starts, ends):
+            # chunks travel back as columns, far smaller to pickle than ConlluData rows
+            corpus.extend(chunk)
+
+    return corpus
+
+
+def _find_sentence_boundaries(file_path, n_chunks):
+    """
+    ``n_chunks + 1`` (or fewer) sorted byte offsets from 0 to the file size,
+    every inner offset is the start of the line after a blank line
+    """
+
+    file_size = os.path.getsize(file_path)
+    boundaries = [0]
+
+    with open(file_path, 'rb') as conllu_file:
+        for i in range(1, n_chunks):
+            target = max(file_size * i // n_chunks, boundaries[-1])
+            conllu_file.seek(target)
+            if target > 0:
+                conllu_file.readline()  # skip the line the target falls into
+
+            line = conllu_file.readline()
+            while line and not line.isspace():
+                line = conllu_file.readline()
+
+            boundary = conllu_file.tell()
+            if boundary >= file_size:
+                break
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+
+    boundaries.append(file_size)
+    return boundaries
+
+
+def _read_byte_range(file_path, start, end, separator=r'\s+'):
+    """the sentences between two boundaries, as a ParsedCorpus"""
+
+    with open(file_path, 'rb') as conllu_file:
+        conllu_file.seek(start)
+        lines = _text_lines(conllu_file.read(end - start))
+
+    corpus = ParsedCorpus()
+    for _, rows in _parse_conllu_lines(lines, separator):
+        corpus.append_rows(rows)
+
+    return corpus
+
+
+def _text_lines(data: bytes) -> io.StringIO:
+    """the lines of UTF-8 `data`, split like a file opened in text mode
+
+    str.splitlines would also split on characters such as U+2028 or \\f,
+    which may occur inside a column
+    """
+
+    return io.StringIO(data.decode('utf-8'), newline=None)
+
+
+def iter_conllu(file_path: str, separator: str=r'\s+', with_comments: bool=False,
+                compression: Compression='infer') -> Iterator[Union[List[ConlluData], Tuple[Dict[str, str], List[ConlluData]]]]:
+    """
+    Lazily read CoNNL-U format file, one sentence at a time.
+
+    The file is read through a large buffer and only the current sentence is
+    held in memory, so treebanks of any size can be processed with flat memory.
+    Every sentence may be preceded by any number of comment lines.
+
+    Parameters
+    ----------
+    file_path: str
+        the path of file containing CoNNL-U data
+
+    separator: str
+        Regex separator between 2 columns in CoNNL-U, default to one or more whitespaces.
+
+    with_comments: bool, default=False
+        Yield ``(comments, sentence)`` pairs, where ``comments`` maps the key of
+        every ``# key = value`` comment of the sentence to its value. A comment
+        without `` = `` is stored with its whole text as key and None as value.
+
+    compression: {'infer', 'gzip', 'bz2', 'xz', None}, default='infer'
+        Codec of the file, see :func:`read_conllu`.
+
+    Yields
+    ------
+    list of :class:`ConnluData`, or a pair of dict and list of :class:`ConnluData`
+        The CoNNL-U rows of one sentence.
+
+    """
+
+    # fail now rather than on the first next() if the file doesn't exist
+    os.stat(file_path)
+    _get_codec(file_path, compression)
+    return _iter_conllu(file_path, separator, with_comments, compression)
 
-            # next_line currently is '# sent_id = ...'
-            conllu_file.readline()  #  '# read text = ...'
 
-            one_sentence_result = []
-            next_line = conllu_file.readline()
-            while next_line not in ['', '\n']:
-                conllu_attrs= re.split(separator, next_line)
-                one_sentence_result.append(ConlluData(*conllu_attrs[:8]))
-                next_line = conllu_file.readline()
+def _iter_conllu(file_path, separator, with_comments, compression='infer'):
+    for comments, rows in _iter_conllu_rows(file_path, separator, compression):
+        sentence = [ConlluData(*row) for row in rows]
+        yield (comments, sentence) if with_comments else sentence
 
-            conllu_result.append(one_sentence_result)
-            next_sentence = conllu_file.readline()
 
-    return conllu_result
+def _iter_conllu_rows(file_path, separator, compression='infer'):
+    """yields (comments, rows) per sentence, every row is a list of the first 8 columns"""
 
+    with _open_text(file_path, 'r', compression, _READ_BUFFER_SIZE) as conllu_file:
+        yield from _parse_conllu_lines(conllu_file, separator)
 
-def write_conllu(list_sentences: List[str], list_list_conllu: List[List[ConlluData]],
-                 file_path: str, write_mode: Literal['a', 'w', 'x'] = 'x', separator: str='\t'
-                 ) -> str:
+
+def _parse_conllu_lines(lines, separator=r'\s+'):
+    """(comments, rows) of every sentence in `lines`, any iterable of CoNLL-U lines
+
+    A block of comments only, e.g. ``# newdoc id = d1``, is not a sentence,
+    its comments belong to the next sentence. Comments after the last
+    sentence are dropped.
+    """
+
+    split_row = _get_row_splitter(separator)
+    comments = {}
+    rows = []
+    for line in lines:
+        if line[0] == '#':
+            key, has_value, value = line[1:].strip().partition(' = ')
+            comments[key.strip()] = value.strip() if has_value else None
+        elif line.isspace():
+            if rows:
+                yield comments, rows
+                comments = {}
+                rows = []
+        else:
+            rows.append(split_row(line))
+
+    if rows:
+        yield comments, rows
+
+
+def _get_row_splitter(separator):
+    separator_pattern = re.compile(separator)
+
+    def split_row(line):
+        return separator_pattern.split(line, 8)[:8]
+
+    if separator != r'\s+':
+        return split_row
+
+    def split_tab_row(line):
+        # fast path: a well-formed CoNLL-U line has 10 tab separated columns
+        columns = line.split('\t', 8)
+        if len(columns) == 9:
+            return columns[:8]
+        return split_row(line)
+
+    return split_tab_row
+
+
+def write_conllu(list_sentences: List[str],
+                 list_list_conllu: Union[List[List[ConlluData]], ParsedCorpus],
+                 file_path: str, write_mode: Literal['a', 'w', 'x'] = 'x', separator: str='\t',
+                 compression: Compression='infer') -> str:
     """
     Write list of list of :class:`ConnluData` of an Indonesian text to a file.
 
+    The file is compressed while it is written when `compression` is a codec
+    ('gzip', 'bz2' or 'xz'), or when it is 'infer' and `file_path` ends with
+    ``.gz``, ``.bz2`` or ``.xz``.
+
     If we have a detokenizer, we may drop list_sentences argument.
     """
 
-    all_write_modes = ['a', 'w', 'x']
-
-    if write_mode not in all_write_modes:
-        raise ValueError(f"write_mode must be one of {all_write_modes}, but {write_mode} was given")
+    _check_write_mode(write_mode)
 
     if len(list_sentences) != len(list_list_conllu):
         raise ValueError("list_sentences length must be equal with list_list_conllu length")
 
-    if separator is None:
-        separator = '\t'
+    return _write_conllu_stream(
+        zip(list_sentences, list_list_conllu), file_path,
+        write_mode=write_mode, separator=separator, compression=compression
+    )
 
-    with open(file_path, mode=write_mode, encoding='utf-8') as file:
-        if write_mode == 'a':
-            file.writelines('\n')
+def _write_conllu_stream(
+        sentence_with_conllu: Iterable[Tuple[str, List[ConlluData]]],
+        file_path: str,
+        write_mode: Literal['a', 'w', 'x'] = 'x',
+        separator: str = '\t',
+        compression: Compression = 'infer',
+        resume_from: int = None) -> str:
+    """
+    Write (sentence, list of :class:`ConnluData`) pairs to a file as they are produced.
 
-        for idx, (sentence, list_conllu) in enumerate(zip(list_sentences, list_list_conllu)):
-            file.writelines(f'# sent_id = {idx + 1}\n')
+    ``sentence_with_conllu`` may be a generator; each sentence block is written
+    as soon as it is yielded, so the output never has to be held in memory and
+    a failure leaves the blocks written so far as a valid CoNLL-U file. With
+    ``resume_from``, the number returned by :func:`_resume_conllu`, the blocks
+    continue that partial file instead.
+    """
 
-            sentence = sentence.strip()
-            file.writelines(f'# text = {sentence}\n')
+    _check_write_mode(write_mode)
 
-            for conllu in list_conllu:
-                row = str(conllu).split('\t')
-                row_sentence = separator.join(row)
-                file.writelines(f"{row_sentence}\n")
+    if separator is None:
+        separator = '\t'
 
-            if idx < len(list_list_conllu) - 1:
-                file.writelines('\n')
+    def to_rows(list_conllu):
+        return [separator.join(str(conllu).split('\t')) for conllu in list_conllu]
+
+    _write_blocks(sentence_with_conllu, to_rows, file_path, write_mode, compression, resume_from)
 
     return os.path.realpath(file_path)
 
@@ -89,7 +299,8 @@ def _write_reduce_conllu(
         list_list_conllu: List[List[Tuple[str, str, Any]]],
         file_path: str,
         write_mode:Literal['a', 'w', 'x']='x',
-        separator='\t'):
+        separator='\t',
+        compression: Compression='infer'):
     """
     Write 3 columns of CoNNL-U (idx, form, another column) in a file.
 
@@ -101,23 +312,127 @@ def _write_reduce_conllu(
     if len(list_sentences) != len(list_list_conllu):
         raise ValueError("list_sentences length must be equal with list_list_conllu length")
 
+    _write_reduce_conllu_stream(
+        zip(list_sentences, list_list_conllu), file_path,
+        write_mode=write_mode, separator=separator, compression=compression
+    )
+
+def _write_reduce_conllu_stream(
+        sentence_with_conllu: Iterable[Tuple[str, List[Tuple[str, str, Any]]]],
+        file_path: str,
+        write_mode: Literal['a', 'w', 'x'] = 'x',
+        separator='\t',
+        compression: Compression = 'infer',
+        resume_from: int = None):
+    """
+    Streaming version of :func:`_write_reduce_conllu`, see :func:`_write_conllu_stream`.
+    """
+
     if separator is None:
         separator = '\t'
 
-    with open(file_path, mode=write_mode, encoding='utf-8') as file:
-        if write_mode == 'a':
-            file.writelines('\n')
+    def to_rows(list_conllu):
+        return [f"{idx}{separator}{form}{separator}{conllu_col}"
+                for idx, form, conllu_col in list_conllu]
+
+    _write_blocks(sentence_with_conllu, to_rows, file_path, write_mode, compression, resume_from)
+
+def _write_blocks(sentence_with_rows, to_rows, file_path, write_mode, compression='infer',
+                  resume_from=None):
+    """
+    Write one '# sent_id' / '# text' block per sentence, blocks are separated by
+    an empty line and every block goes to the (buffered) file in one write call.
+
+    With `resume_from`, the blocks are appended to a partial file prepared by
+    `_resume_conllu` and numbered after its `resume_from` sentences.
+    """
+
+    first_idx = 0
+    if resume_from is not None:
+        write_mode = 'a'
+        first_idx = resume_from
 
-        sentence_with_conllu = zip(list_sentences, list_list_conllu)
-        for sentence_idx, (sentence, list_conllu) in enumerate(sentence_with_conllu):
-            file.writelines(f'# sent_id = {sentence_idx + 1}\n')
+    with _open_text(file_path, write_mode, compression, _WRITE_BUFFER_SIZE) as file:
+        if write_mode == 'a' and resume_from is None:
+            file.write('\n')
 
-            sentence = sentence.strip()
+        for sentence_idx, (sentence, list_conllu) in enumerate(sentence_with_rows, first_idx):
+            block = [f'# sent_id = {sentence_idx + 1}', f'# text = {sentence.strip()}']
+            block.extend(to_rows(list_conllu))
 
-            file.writelines(f'# text = {sentence}\n')
+            if sentence_idx > first_idx:
+                file.write('\n')
+            file.write('\n'.join(block) + '\n')
 
-            for idx, form, conllu_col in list_conllu:
-                file.writelines(f"{idx}{separator}{form}{separator}{conllu_col}\n")
+def _resume_conllu(file_path: str) -> int:
+    """
+    Prepare the partial output of an interrupted ``*_to_file`` call to be continued,
+    returns the number of its sentences to skip in the input.
+
+    An interruption may have cut the last block, so the last block is removed
+    and written again. A missing file is started from the first sentence.
+    """
+
+    if _get_codec(file_path) is not None:
+        raise ValueError(f"only an uncompressed file can be resumed, but {file_path} was given")
+
+    try:
+        conllu_file = open(file_path, 'rb+')  # pylint: disable=consider-using-with
+    except FileNotFoundError:
+        return 0
+
+    with conllu_file:
+        end = conllu_file.seek(0, os.SEEK_END)
+
+        # the last block is near the end, the tail that is searched grows until it's found
+        read_size = _RESUME_READ_SIZE
+        while True:
+            start = max(0, end - read_size)
+            conllu_file.seek(start)
+            tail = conllu_file.read(end - start)
+            if start == 0:
+                # the first line of the file starts after a virtual newline
+                tail = b'\n' + tail
+                start = -1
+
+            last_match = None
+            for last_match in _SENT_ID_LINE.finditer(tail):
+                pass
+            if last_match is not None or start < 0:
+                break
+            read_size *= 2
+
+        if last_match is None:
+            # not even the first block was completed
+            n_sentences, offset = 0, 0
+        else:
+            n_sentences = int(last_match.group(1)) - 1
+            offset = start + last_match.start() + 1
+
+        # the empty line before the removed block stays, it separates the next block
+        conllu_file.truncate(offset)
+
+    return n_sentences
+
+def _write_analyzed_stream(write_stream, instance, method_name, to_result, sentences, write_path,
+                           args=(), n_jobs=1, stage_workers=None, resume=False, **write_kwargs):
+    """
+    Writes every sentence with its `instance.<method_name>(sentence, *args)`
+    through `write_stream`, see `_map_analyzed_sentences`. With `resume`, the
+    sentences already in `write_path` are skipped, see `_resume_conllu`.
+    """
 
-            if sentence_idx < len(list_list_conllu) - 1:
-                file.writelines('\n')
+    resume_from = _resume_conllu(write_path) if resume else None
+    sentences, to_analyze = tee(islice(sentences, resume_from, None))
+    results = _map_analyzed_sentences(
+        instance, method_name, to_result, to_analyze, args, n_jobs, stage_workers
+    )
+
+    return write_stream(zip(sentences, results), write_path, resume_from=resume_from,
+                        **write_kwargs)
+
+def _check_write_mode(write_mode: str):
+    all_write_modes = ['a', 'w', 'x']
+
+    if write_mode not in all_write_modes:
+        raise ValueError(f"write_mode must be one of {all_write_modes}, but {write_mode} was given")
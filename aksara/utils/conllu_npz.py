@@ -0,0 +1,148 @@
+import struct
+import zipfile
+from array import array
+from typing import List, Union
+
+import numpy as np
+
+from ..conllu import ConlluData, ParsedCorpus
+
+_FORMAT_VERSION = 1
+
+# fixed part of a zip local file header, the name and extra field lengths are its last 4 bytes
+_ZIP_LOCAL_HEADER = struct.Struct('<4s22xHH')
+
+
+def write_conllu_npz(file_path: str, data: Union[ParsedCorpus, List[List[ConlluData]]],
+                     compressed: bool = False):
+    """
+    Write parsed sentences to a binary NumPy ``.npz`` file.
+
+    Every column of :attr:`ParsedCorpus.COLUMNS` is stored as a ``uint32``
+    code array and a table of its distinct strings, the sentences as an array
+    of token offsets. Reading it back with :func:`read_conllu_npz` gives the
+    same sentences without parsing any text.
+
+    Parameters
+    ----------
+    file_path: str
+        The path of the ``.npz`` file, the extension is added by NumPy when missing.
+
+    data: :class:`ParsedCorpus` or list of list of :class:`ConlluData`
+        The sentences to write.
+
+    compressed: bool, default=False
+        Compress the arrays with zlib. A compressed file is smaller but can't
+        be memory-mapped by :func:`read_conllu_npz`.
+    """
+
+    corpus = data if isinstance(data, ParsedCorpus) else ParsedCorpus(data)
+
+    arrays = {
+        'format_version': np.array(_FORMAT_VERSION, dtype=np.uint32),
+        'sentence_offsets': np.asarray(memoryview(corpus.sentence_offsets())),
+    }
+    for column in ParsedCorpus.COLUMNS:
+        encoded = [value.encode('utf-8') for value in corpus.vocabulary(column)]
+        arrays[f'{column}_codes'] = np.asarray(memoryview(corpus.codes(column)))
+        arrays[f'{column}_strings'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        arrays[f'{column}_string_ends'] = np.cumsum([len(value) for value in encoded],
+                                                    dtype=np.uint64)
+
+    save = np.savez_compressed if compressed else np.savez
+    save(file_path, **arrays)
+
+
+def read_conllu_npz(file_path: str, mmap: bool = False) -> ParsedCorpus:
+    """
+    Read the sentences written by :func:`write_conllu_npz`.
+
+    Parameters
+    ----------
+    file_path: str
+        The path of the ``.npz`` file.
+
+    mmap: bool, default=False
+        Memory-map the code and offset arrays instead of reading them, so
+        opening a large corpus is almost free and only the sentences that are
+        accessed are loaded from disk. Only the string tables are read. Falls
+        back to reading for a compressed file.
+
+    Returns
+    -------
+    :class:`ParsedCorpus`
+        The sentences, which can be written back to text with :func:`aksara.write_conllu`.
+    """
+
+    with np.load(file_path) as npz:
+        if 'format_version' not in npz.files:
+            raise ValueError(f"{file_path} is not a CoNLL-U npz file")
+        version = int(npz['format_version'])
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"unsupported CoNLL-U npz format version {version}")
+
+        vocabularies = {
+            column: _decode_strings(npz[f'{column}_strings'], npz[f'{column}_string_ends'])
+            for column in ParsedCorpus.COLUMNS
+        }
+
+        names = ['sentence_offsets'] + [f'{column}_codes' for column in ParsedCorpus.COLUMNS]
+        if mmap:
+            arrays = {name: _map_member(file_path, name) for name in names}
+            load = _to_buffer
+        else:
+            arrays = {name: npz[name] for name in names}
+            load = _to_array
+
+    codes = {column: load('I', arrays[f'{column}_codes']) for column in ParsedCorpus.COLUMNS}
+    return ParsedCorpus.from_columns(codes, vocabularies, load('Q', arrays['sentence_offsets']))
+
+
+def _decode_strings(data, ends):
+    data = data.tobytes()
+    starts = [0] + ends[:-1].tolist()
+    return [data[start:end].decode('utf-8') for start, end in zip(starts, ends.tolist())]
+
+
+def _map_member(file_path, name):
+    """a read-only memmap of the array `name` of an npz file, or the array itself if it's compressed"""
+
+    with zipfile.ZipFile(file_path) as archive:
+        info = archive.getinfo(name + '.npy')
+        if info.compress_type != zipfile.ZIP_STORED:
+            with archive.open(info) as member:
+                return np.lib.format.read_array(member)
+
+    with open(file_path, 'rb') as npz_file:
+        npz_file.seek(info.header_offset)
+        _, name_length, extra_length = _ZIP_LOCAL_HEADER.unpack(
+            npz_file.read(_ZIP_LOCAL_HEADER.size)
+        )
+        npz_file.seek(name_length + extra_length, 1)
+
+        version = np.lib.format.read_magic(npz_file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(npz_file)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(npz_file)
+        offset = npz_file.tell()
+
+    if fortran_order or np.prod(shape) == 0:
+        # a 1-d array is never stored in Fortran order, and an empty one can't be mapped
+        return np.load(file_path)[name]
+
+    return np.memmap(file_path, dtype=dtype, mode='r', offset=offset, shape=shape)
+
+
+def _to_array(typecode, values):
+    result = array(typecode)
+    result.frombytes(np.ascontiguousarray(values, dtype=f'=u{result.itemsize}').tobytes())
+    return result
+
+
+def _to_buffer(typecode, values):
+    # a memoryview gives python ints like an array does, without copying the map
+    if values.dtype != np.dtype(f'=u{array(typecode).itemsize}'):
+        return _to_array(typecode, values)
+
+    return memoryview(values).cast('B').cast(typecode)
@@ -0,0 +1,156 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List
+
+DEFAULT_CHUNK_SIZE = 8
+
+# worker-process state, set once by `_init_worker`
+_worker = None
+
+
+def _check_n_jobs(n_jobs: int, stage_workers: tuple = None) -> int:
+    """ returns the number of worker processes for `n_jobs`
+
+    -1 means one worker per CPU core. `stage_workers` pipelines the stages
+    within one process, so it can only be given with a single worker
+    """
+
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif not isinstance(n_jobs, int) or isinstance(n_jobs, bool) or n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer or -1, but {n_jobs} was given")
+
+    if stage_workers is not None and n_jobs > 1:
+        raise ValueError("stage_workers can not be combined with n_jobs > 1")
+
+    return n_jobs
+
+
+def _map_sentences(
+        instance: Any,
+        method_name: str,
+        sentences: Iterable[str],
+        args: tuple = (),
+        n_jobs: int = 1,
+        init_kwargs: dict = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Any]:
+    """ lazily applies `instance.<method_name>(sentence, *args)` to each sentence
+
+    With `n_jobs` > 1, every worker process builds its own
+    `type(instance)(**init_kwargs)` (its own analyzer, HMM and parser) and the
+    results are yielded in input order
+    """
+
+    n_jobs = _check_n_jobs(n_jobs)
+
+    if n_jobs == 1:
+        method = getattr(instance, method_name)
+        return (method(sentence, *args) for sentence in sentences)
+
+    worker_factory = partial(_method_worker, type(instance), method_name, args, init_kwargs or {})
+    return _parallel_map(worker_factory, sentences, n_jobs, chunk_size)
+
+
+def _map_analyzed_sentences(
+        instance: Any,
+        method_name: str,
+        to_result: Callable[[list], Any],
+        sentences: Iterable[str],
+        args: tuple = (),
+        n_jobs: int = 1,
+        stage_workers: tuple = None
+) -> Iterator[Any]:
+    """ applies `instance.<method_name>(sentence, *args)` to every sentence, in `n_jobs`
+    worker processes or with the analysis stages pipelined over `stage_workers` threads
+
+    The pipelined stages are analyze_sentences with the keyword arguments
+    `instance._analysis_kwargs(*args)` (analyzer, dependency parser, cache and
+    flags), `to_result` turns the tokens of a sentence into the result of
+    `method_name`. The worker processes build their instance with its cache
+    """
+
+    if stage_workers is None:
+        return _map_sentences(
+            instance, method_name, sentences, args, n_jobs, {"cache": instance.cache}
+        )
+
+    _check_n_jobs(n_jobs, stage_workers)
+
+    # pylint: disable=import-outside-toplevel
+    from .._nlp_internal.core import analyze_sentences
+
+    analysis_kwargs = instance._analysis_kwargs(*args)  # pylint: disable=protected-access
+    analyzed_sentences = analyze_sentences(
+        sentences, stage_workers=stage_workers, **analysis_kwargs
+    )
+    return map(to_result, analyzed_sentences)
+
+
+def _parallel_map(
+        worker_factory: Callable[[], Callable[[str], Any]],
+        sentences: Iterable[str],
+        n_jobs: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Any]:
+    """ fans chunks of sentences out to `n_jobs` processes and yields the results in order
+
+    `worker_factory` is called once in each worker process and must return the
+    per-sentence function, so it (and its arguments) must be picklable. At most
+    two chunks per worker are in flight, which keeps memory bounded when the
+    sentences are read lazily from a large file
+    """
+
+    executor = ProcessPoolExecutor(
+        max_workers=n_jobs,
+        initializer=_init_worker,
+        initargs=(worker_factory,)
+    )
+
+    try:
+        pending = deque()
+        for chunk in _iter_chunks(sentences, chunk_size):
+            pending.append(executor.submit(_process_chunk, chunk))
+
+            if len(pending) >= 2 * n_jobs:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _iter_chunks(sentences: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    iterator = iter(sentences)
+    chunk = list(islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunk_size))
+
+
+def _init_worker(worker_factory):
+    # the workers already run in parallel, one torch thread each avoids oversubscription
+    # pylint: disable=import-outside-toplevel
+    import torch
+    torch.set_num_threads(1)
+
+    global _worker  # pylint: disable=global-statement
+    _worker = worker_factory()
+
+
+def _process_chunk(chunk: List[str]) -> List[Any]:
+    return [_worker(sentence) for sentence in chunk]
+
+
+def _method_worker(cls, method_name: str, args: tuple,
+                   init_kwargs: dict = None) -> Callable[[str], Any]:
+    method = getattr(cls(**(init_kwargs or {})), method_name)
+    return partial(_call_with_args, method, args)
+
+
+def _call_with_args(method, args, sentence):
+    return method(sentence, *args)
@@ -0,0 +1,78 @@
+import io
+from typing import Callable, Optional, Union
+
+# called with the number of bytes read so far and the size of the file (None if unknown)
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+Progress = Union[bool, ProgressCallback]
+
+BAR_FORMAT = "{l_bar}{bar:50}{r_bar}{bar:-10b}"
+
+
+class TqdmProgress:
+    """ a ProgressCallback that draws a tqdm bar in bytes, `close` ends the bar """
+
+    def __init__(self, total: Optional[int] = None):
+        # pylint: disable=import-outside-toplevel
+        from tqdm import tqdm
+
+        self.__bar = tqdm(
+            total=total, unit="B", unit_scale=True, unit_divisor=1024, bar_format=BAR_FORMAT
+        )
+
+    def __call__(self, done: int, total: Optional[int]):
+        if total is not None and self.__bar.total != total:
+            self.__bar.total = total
+        self.__bar.update(done - self.__bar.n)
+
+    def close(self):
+        self.__bar.close()
+
+
+class _ProgressReader(io.RawIOBase):
+    """ a raw binary stream that reports every read of `raw` to `callback`
+
+    the callback runs once per buffer refill of the stream above it, not
+    once per line, so reporting costs nothing measurable
+    """
+
+    def __init__(self, raw, callback: ProgressCallback, total: Optional[int]):
+        super().__init__()
+        self.__raw = raw
+        self.__callback = callback
+        self.__total = total
+        self.__done = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        n_bytes = self.__raw.readinto(buffer)
+        if n_bytes:
+            self.__done += n_bytes
+            self.__callback(self.__done, self.__total)
+        return n_bytes
+
+    def close(self):
+        if not self.closed:
+            self.__raw.close()
+        super().close()
+
+
+def _get_progress_callback(progress: Progress, total: Optional[int]):
+    """ (callback, close) for the `progress` argument of the file-mode APIs
+
+    True draws a tqdm bar, False reports nothing and a callable is used as is
+    """
+
+    if progress is True:
+        bar = TqdmProgress(total)
+        return bar, bar.close
+
+    if progress is False or progress is None:
+        return None, lambda: None
+
+    if not callable(progress):
+        raise ValueError(f"progress must be a bool or a callable, but {progress!r} was given")
+
+    return progress, lambda: None
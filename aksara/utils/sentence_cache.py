@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict, namedtuple
+from importlib.metadata import PackageNotFoundError, version
+from typing import List, Optional
+
+from .._nlp_internal.sentence import Token
+
+DEFAULT_MAX_SIZE = 100_000
+
+_DISK_FILE_NAME = 'sentences.sqlite3'
+
+# changes whenever the layout of a key or of a stored sentence changes
+_KEY_FORMAT = 1
+
+try:
+    _PACKAGE_VERSION = version('aksara')
+except PackageNotFoundError:
+    _PACKAGE_VERSION = 'unknown'
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'disk_hits', 'maxsize', 'currsize'])
+
+
+class SentenceCache:
+    """
+    Content-addressed cache of analyzed sentences
+
+    A sentence is looked up by a hash of its text, the informal flag, the
+    dependency parser model, the pipeline stages (v1 skips disambiguation
+    and parsing) and the aksara version, so an exact duplicate sentence is
+    tokenized, analyzed with foma, disambiguated and parsed only once. The
+    text is not normalized any further than the sentence splitter does,
+    because the analysis of a sentence keeps its exact surface forms.
+
+    Recent sentences are kept in memory, the least recently used one is
+    evicted beyond `max_size`. With a `directory`, every analyzed sentence
+    is also stored in an SQLite file there, which outlives the process and
+    can be shared by several processes.
+
+    Parameters
+    ----------
+    max_size: int, default=100000
+        Maximum number of sentences kept in memory, 0 keeps none.
+
+    directory: str, default=None
+        Directory of the persistent store, created if needed. None keeps
+        the cache in memory only.
+
+    Examples
+    --------
+    >>> from aksara import POSTagger, SentenceCache
+    >>> tagger = POSTagger(cache=SentenceCache(directory='.aksara-cache'))  # doctest: +SKIP
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, directory: Optional[str] = None):
+        if not isinstance(max_size, int) or max_size < 0:
+            raise ValueError(f"max_size must be a non-negative integer, but {max_size} was given")
+
+        self.max_size = max_size
+        self.directory = directory
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__disk_hits = 0
+        self.__store = None
+
+    def __getstate__(self):
+        # worker processes get the same settings, an empty memory tier and their own connection
+        return {'max_size': self.max_size, 'directory': self.directory}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @staticmethod
+    def key(text: str, model: Optional[str], informal: bool, v1: bool) -> str:
+        """The cache key of one sentence analyzed with these options."""
+
+        fields = [str(_KEY_FORMAT), _PACKAGE_VERSION, str(model), str(bool(informal)),
+                  str(bool(v1)), text]
+        return hashlib.sha256('\0'.join(fields).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[List[Token]]:
+        """New Token objects of the cached sentence, or None if it isn't cached."""
+
+        with self.__lock:
+            fields = self.__entries.get(key)
+            if fields is not None:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+            elif self.directory is not None:
+                fields = self.__load(key)
+                if fields is not None:
+                    self.__remember(key, fields)
+                    self.__hits += 1
+                    self.__disk_hits += 1
+
+            if fields is None:
+                self.__misses += 1
+                return None
+
+        # the caller owns (and may modify) the returned tokens
+        return [Token(*token_fields) for token_fields in fields]
+
+    def put(self, key: str, tokens: List[Token]):
+        """Store the analyzed tokens of one sentence."""
+
+        fields = tuple(tuple(token.fields()) for token in tokens)
+        with self.__lock:
+            self.__remember(key, fields)
+            if self.directory is not None:
+                self.__get_store().execute(
+                    'INSERT OR REPLACE INTO sentences VALUES (?, ?)', (key, json.dumps(fields))
+                )
+
+    def cache_info(self) -> CacheInfo:
+        """Hits (including those from disk), misses and size of the memory tier."""
+
+        with self.__lock:
+            return CacheInfo(
+                self.__hits, self.__misses, self.__disk_hits, self.max_size, len(self.__entries)
+            )
+
+    def clear(self):
+        """Empty the memory tier and the persistent store, and reset the statistics."""
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = self.__misses = self.__disk_hits = 0
+            if self.directory is not None:
+                self.__get_store().execute('DELETE FROM sentences')
+
+    def close(self):
+        """Close the persistent store, it is reopened when needed."""
+
+        with self.__lock:
+            if self.__store is not None:
+                self.__store.close()
+                self.__store = None
+
+    def __remember(self, key, fields):
+        if self.max_size == 0:
+            return
+
+        self.__entries[key] = fields
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+    def __load(self, key):
+        row = self.__get_store().execute(
+            'SELECT tokens FROM sentences WHERE key = ?', (key,)
+        ).fetchone()
+        return None if row is None else tuple(tuple(token) for token in json.loads(row[0]))
+
+    def __get_store(self):
+        if self.__store is None:
+            os.makedirs(self.directory, exist_ok=True)
+            # autocommit without fsync: a lost write only costs one more analysis
+            store = sqlite3.connect(
+                os.path.join(self.directory, _DISK_FILE_NAME),
+                timeout=30, isolation_level=None, check_same_thread=False
+            )
+            store.execute('PRAGMA journal_mode=WAL')
+            store.execute('PRAGMA synchronous=OFF')
+            store.execute(
+                'CREATE TABLE IF NOT EXISTS sentences (key TEXT PRIMARY KEY, tokens TEXT NOT NULL)'
+            )
+            self.__store = store
+
+        return self.__store
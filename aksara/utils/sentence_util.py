@@ -1,39 +1,94 @@
 import re
-from typing import List
+from functools import partial
+from typing import Iterable, Iterator, List
 import os
 
-from tqdm import tqdm
-
-from aksara._nlp_internal.core import get_num_lines
+from aksara.utils.compression import _get_codec, _open_text
+from aksara.utils.progress import _get_progress_callback
 
 
 __all_input_modes = ['s', 'f']
 
-def _get_sentence_list(input_src, input_mode='s', sep_regex=None) -> List[str]:
+_DEFAULT_SEP_REGEX = r"([.!?]+[\s])"
+
+# in a stream a line break ends a sentence too, or only a blank line when wrapped lines are joined
+_LINE_END = re.compile(r"\n")
+_PARAGRAPH_BREAK = re.compile(r"\n[^\S\n]*\n")
+_LINE_BREAK = re.compile(r"\s*\n\s*")
+
+# a separator is assumed to be shorter than this, so when more text arrives
+# only the end of the previous text is searched again for a separator it completes
+_MAX_SEPARATOR_LENGTH = 1024
+
+_READ_CHUNK_SIZE = 1 << 16
+
+def _get_sentence_list(input_src, input_mode='s', sep_regex=None,
+                       compression='infer', progress=True, join_lines=False) -> List[str]:
     """ extracts a list of sentences from text
 
     If `input_mode` is set to 's', text is provided as string
     in `input_src`. Alternatively, if `input_mode` is set to 'f',
-    the path to a file containing the text is provided in `input_src`
+    the path to a file containing the text is provided in `input_src`.
+    A gzip, bz2 or xz file is decompressed while it is read, its codec is
+    `compression` or inferred from the extension. While a file is read,
+    `progress` draws a tqdm bar (True), reports nothing (False) or is
+    called with the bytes read and the file size (a callable).
+    Each line of a file ends a sentence, unless `join_lines` is set, then a
+    sentence wrapped over lines is joined and only a blank line ends it
     """
 
     if input_mode == "s":
         return _split_sentence(input_src, sep_regex)
 
     if input_mode == "f":
-        return _sentences_from_file(input_src, sep_regex)
+        return _sentences_from_file(input_src, sep_regex, compression, progress, join_lines)
+
+    raise ValueError(
+        f"input_mode must be one of {__all_input_modes}, but {input_mode} was given"
+    )
+
+def _iter_sentence_list(input_src, input_mode='s', sep_regex=None,
+                        compression='infer', join_lines=False) -> Iterator[str]:
+    """ lazily extracts sentences from text
+
+    Same as `_get_sentence_list`, but with `input_mode` 'f' the file is read
+    line by line while the sentences are consumed instead of up front
+    """
+
+    if input_mode == "s":
+        return iter(_split_sentence(input_src, sep_regex))
+
+    if input_mode == "f":
+        # fail now rather than on the first next() if the file doesn't exist
+        os.stat(input_src)
+        _get_codec(input_src, compression)
+        return _iter_sentences_from_file(input_src, sep_regex, compression, join_lines)
 
     raise ValueError(
         f"input_mode must be one of {__all_input_modes}, but {input_mode} was given"
     )
 
+async def _aget_sentence_list(input_src, input_mode='s', sep_regex=None,
+                              compression='infer', progress=True) -> List[str]:
+    """ `_get_sentence_list` for coroutines, a file is read in a worker thread """
+
+    if input_mode == "f":
+        # pylint: disable=import-outside-toplevel
+        import asyncio
+
+        return await asyncio.to_thread(
+            _get_sentence_list, input_src, input_mode, sep_regex, compression, progress
+        )
+
+    return _get_sentence_list(input_src, input_mode, sep_regex)
+
 def _split_sentence(text: str, sep_regex: str = None) -> List[str]:
     """
     this method will split a multi sentences text based on separator regex (sep_regex)
     """
 
     if sep_regex is None:
-        sep_regex = r"([.!?]+[\s])"
+        sep_regex = _DEFAULT_SEP_REGEX
 
     splitted_sentences = re.split(sep_regex, text)
     sentence_list = []
@@ -51,22 +106,119 @@ def _split_sentence(text: str, sep_regex: str = None) -> List[str]:
     return sentence_list
 
 
-def _sentences_from_file(file_path: str, sep_regex: str = None) -> List[str]:
+class _SentenceSegmenter:
+    """
+    splits text that arrives in chunks of any size into sentences
+
+    A sentence ends after a match of `sep_regex` (`[.!?]+\\s` by default) or
+    at a line break, wherever the chunks are cut. With `join_lines` only a
+    blank line ends a sentence, and the line breaks of a sentence wrapped over
+    lines are replaced by a space, so a sentence is always one line. `feed`
+    returns the sentences closed by a chunk and keeps the unfinished one,
+    `close` returns the rest.
+    """
+
+    def __init__(self, sep_regex: str = None, join_lines: bool = False):
+        if sep_regex is None:
+            sep_regex = _DEFAULT_SEP_REGEX
+
+        self.__separator = re.compile(sep_regex)
+        self.__break = _PARAGRAPH_BREAK if join_lines else _LINE_END
+        # the unfinished sentence is the pieces followed by the tail, only the
+        # tail is searched again when the next chunk arrives
+        self.__pieces = []
+        self.__tail = ""
+
+    def feed(self, chunk: str) -> List[str]:
+        return self.__split(self.__tail + chunk, final=False)
+
+    def close(self) -> List[str]:
+        sentences = self.__split(self.__tail, final=True)
+        self.__pieces = []
+        self.__tail = ""
+        return sentences
+
+    def __split(self, buffer, final):
+        # a separator that touches the end of the buffer may go on in the next chunk
+        end_of_text = len(buffer) + 1 if final else len(buffer)
+        sentences = []
+        start = 0
+
+        def cut(end):
+            sentence = buffer[start:end]
+            if self.__pieces:
+                self.__pieces.append(sentence)
+                sentence = "".join(self.__pieces)
+                self.__pieces = []
+            sentence = sentence.strip()
+            if "\n" in sentence:
+                sentence = _LINE_BREAK.sub(" ", sentence)
+            if sentence:
+                sentences.append(sentence)
+            return end
+
+        line_break = self.__break.search(buffer)
+        for match in self.__separator.finditer(buffer):
+            while line_break is not None and line_break.start() < match.start():
+                start = cut(line_break.end())
+                line_break = self.__break.search(buffer, start)
+            if match.end() >= end_of_text:
+                break
+            if match.start() >= start:
+                start = cut(match.end())
+        else:
+            while line_break is not None and line_break.end() < end_of_text:
+                start = cut(line_break.end())
+                line_break = self.__break.search(buffer, start)
+
+        if final:
+            cut(len(buffer))
+            return sentences
+
+        rest = len(buffer) - start
+        if rest > _MAX_SEPARATOR_LENGTH:
+            self.__pieces.append(buffer[start:len(buffer) - _MAX_SEPARATOR_LENGTH])
+            start = len(buffer) - _MAX_SEPARATOR_LENGTH
+        self.__tail = buffer[start:]
+        return sentences
+
+
+def _sentences_from_file(file_path: str, sep_regex: str = None,
+                         compression='infer', progress=True, join_lines=False) -> List[str]:
     result = []
 
-    if os.path.getsize(file_path) == 0:
+    file_size = os.path.getsize(file_path)
+    if file_size == 0:
         return []
 
-    with open(file_path, "r", encoding="utf-8") as infile:
-
-        tqdm_setup = tqdm(
-            infile,
-            total=get_num_lines(infile.name),
-            bar_format="{l_bar}{bar:50}{r_bar}{bar:-10b}",
-        )
-        for _, line in enumerate(tqdm_setup, 1):
-            sentences = _split_sentence(line.rstrip(), sep_regex)
-            for sentence in sentences:
-                result.append(sentence.strip())
+    # progress is counted in bytes read, so the file is read only once
+    callback, close_progress = _get_progress_callback(progress, file_size)
+    try:
+        with _open_text(file_path, "r", compression, progress=callback) as infile:
+            result.extend(_split_stream(infile, sep_regex, join_lines))
+    finally:
+        close_progress()
 
     return result
+
+
+def _iter_sentences_from_file(file_path: str, sep_regex: str = None,
+                              compression='infer', join_lines=False) -> Iterator[str]:
+    with _open_text(file_path, "r", compression) as infile:
+        yield from _split_stream(infile, sep_regex, join_lines)
+
+
+def _split_stream(text_file, sep_regex: str = None, join_lines=False) -> Iterator[str]:
+    """ the sentences of a text file, read in chunks so a file without line breaks streams too """
+
+    yield from _split_chunks(
+        iter(partial(text_file.read, _READ_CHUNK_SIZE), ""), sep_regex, join_lines
+    )
+
+
+def _split_chunks(chunks: Iterable[str], sep_regex: str = None,
+                  join_lines=False) -> Iterator[str]:
+    segmenter = _SentenceSegmenter(sep_regex, join_lines)
+    for chunk in chunks:
+        yield from segmenter.feed(chunk)
+    yield from segmenter.close()
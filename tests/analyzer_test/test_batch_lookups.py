@@ -0,0 +1,227 @@
+import asyncio
+import threading
+import unittest
+from collections import Counter
+from unittest.mock import patch, Mock
+
+import aksara._nlp_internal.analyzer as analyzer_module
+import aksara._nlp_internal.core as core
+import aksara.morphological_analyzer
+import aksara.morphological_feature
+import aksara.pos_tagger
+from aksara import DependencyParser, MorphologicalAnalyzer, MorphologicalFeature, POSTagger
+from aksara._nlp_internal.analyzer import BaseAnalyzer
+from aksara._nlp_internal.batching import ParseBatcher
+from aksara.tokenizers import MultiwordTokenizer
+
+LEXICON = {
+    'saya': 'saya+PRON',
+    'dia': 'dia+PRON',
+    'makan': 'makan+VERB',
+    'nasi': 'nasi+NOUN',
+    '.': '.+PUNCT',
+    '@informalsaya': 'saya+PRON',
+    '@informalmakan': 'makan+VERB',
+    '@informalgimana': 'gimana+ADV',
+    '@informalbiarlah': 'biar+VERB_lah+PART',
+    '@informalsaja': 'saja+ADV',
+    '@informal.': '.+PUNCT',
+}
+
+FLAGS = {'v1': True, 'lemma': False, 'postag': False, 'informal': False}
+
+
+class FakeFoma:
+    """stands in for the foma binary, counts the queries"""
+
+    def __init__(self):
+        self.queries = Counter()
+        self.lock = threading.Lock()
+
+    def output(self, command):
+        with open(command[-1], encoding='utf-8') as script:
+            query = script.read().split('apply up ')[-1]
+        with self.lock:
+            self.queries[query] += 1
+        return (LEXICON.get(query, '???') + '\n').encode('utf-8')
+
+    async def create_subprocess_exec(self, *command, **_):
+        process = Mock(returncode=0)
+
+        async def communicate():
+            await asyncio.sleep(0)
+            return self.output(command), None
+
+        process.communicate = communicate
+        return process
+
+
+class BatchLookupsTest(unittest.TestCase):
+    """Test the foma lookups shared by a batch of sentences, BaseAnalyzer.batch"""
+
+    def setUp(self) -> None:
+        self.foma = FakeFoma()
+        self.normalizer = Mock()
+        self.normalizer.normalize_symspell.return_value = 'gimana'
+        self.analyzer = BaseAnalyzer('umabi.bin', self.normalizer)
+
+        patcher = patch(target=analyzer_module.__name__ + '.subprocess.check_output',
+                        side_effect=self.foma.output)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return super().setUp()
+
+    def analyze(self, texts, stage_workers=None, **flags):
+        return list(core.analyze_sentences(
+            texts, self.analyzer, None, stage_workers, **{**FLAGS, **flags}
+        ))
+
+    def test_every_variant_is_looked_up_once(self):
+        texts = ['Saya makan nasi .', 'Dia makan nasi .', 'Saya makan .'] * 3
+        expected = [core.analyze_tokens(text, self.analyzer, False) for text in texts]
+
+        for stage_workers in [None, (3, 1, 1)]:
+            with self.subTest(stage_workers=stage_workers):
+                self.foma.queries.clear()
+
+                self.assertEqual(expected, self.analyze(texts, stage_workers))
+                self.assertEqual(Counter({'saya': 1, 'dia': 1, 'makan': 1, 'nasi': 1, '.': 1}),
+                                 self.foma.queries)
+
+    def test_lookups_are_not_shared_between_batches(self):
+        self.analyze(['Saya makan .'])
+        self.analyze(['Saya makan .'])
+
+        self.assertEqual(2, self.foma.queries['makan'])
+
+    def test_unknown_words_are_normalized_per_occurrence(self):
+        texts = ['Saya makan gmn', 'gmn makan', 'Saya makan gmn']
+
+        result = self.analyze(texts, informal=True)
+
+        self.assertEqual(1, self.foma.queries['@informalgmn'])
+        self.assertEqual(1, self.foma.queries['@informalgimana'])
+        self.assertEqual(['gimana'] * 3, [
+            token.lemma for tokens in result for token in tokens if token.form == 'gmn'
+        ])
+        # the neighbors of every occurrence are still passed to the normalizer
+        self.assertEqual(
+            [('gmn', 'saya', 'makan', '', ''), ('gmn', '', '', 'makan', ''),
+             ('gmn', 'saya', 'makan', '', '')],
+            [call.args for call in self.normalizer.normalize_symspell.call_args_list]
+        )
+
+    def test_least_recently_used_lookups_are_dropped(self):
+        analyzer = self.analyzer.batch()
+
+        with patch.object(analyzer_module, 'MAX_MEMOIZED_LOOKUPS', 2):
+            for word in ['saya', 'dia', 'saya', 'nasi', 'saya', 'dia']:
+                core.analyze_tokens(word, analyzer, False)
+
+        self.assertEqual(Counter({'saya': 1, 'dia': 2, 'nasi': 1}), self.foma.queries)
+
+    def test_failed_lookup_is_run_again(self):
+        analyzer = self.analyzer.batch()
+        outputs = iter([OSError('foma'), self.foma.output])
+
+        def check_output(command):
+            output = next(outputs)
+            if isinstance(output, OSError):
+                raise output
+            return output(command)
+
+        with patch(target=analyzer_module.__name__ + '.subprocess.check_output',
+                   side_effect=check_output):
+            with self.assertRaises(OSError):
+                core.analyze_tokens('saya', analyzer, False)
+            core.analyze_tokens('saya', analyzer, False)
+
+        self.assertEqual(Counter({'saya': 1}), self.foma.queries)
+
+    def test_memoizing_analyzer_is_its_own_batch(self):
+        analyzer = BaseAnalyzer('umabi.bin', self.normalizer, memoize_lookups=True)
+        self.assertIs(analyzer, analyzer.batch())
+
+        texts = ['Saya makan nasi .', 'Dia makan nasi .']
+        expected = self.analyze(texts)
+        self.foma.queries.clear()
+
+        for _ in range(2):
+            self.assertEqual(expected, list(core.analyze_sentences(texts, analyzer, None, **FLAGS)))
+
+        # the lookups are shared between the calls
+        self.assertEqual(Counter({'saya': 1, 'dia': 1, 'makan': 1, 'nasi': 1, '.': 1}),
+                         self.foma.queries)
+
+    def test_public_classes_share_lookups_between_calls(self):
+        modules = [aksara.pos_tagger, aksara.morphological_analyzer, aksara.morphological_feature]
+        patchers = [patch.object(module, 'DependencyParser') for module in modules]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        for instance, analyzer_name in [
+            (POSTagger(), 'analyzer'),
+            (DependencyParser(), 'default_analyzer'),
+            (MorphologicalAnalyzer(), 'default_analyzer'),
+            (MorphologicalFeature(), 'default_analyzer'),
+        ]:
+            with self.subTest(instance=type(instance).__name__):
+                self.foma.queries.clear()
+                analyzer = getattr(instance, analyzer_name)
+
+                for text in ['Saya makan nasi .', 'Dia makan nasi .']:
+                    core.analyze_tokens(text, analyzer, False)
+
+                self.assertEqual(Counter({'saya': 1, 'dia': 1, 'makan': 1, 'nasi': 1, '.': 1}),
+                                 self.foma.queries)
+
+    def test_word_is_analyzed_as_one_token(self):
+        self.foma.queries.clear()
+
+        tokens = core.analyze_word_tokens("Don't", self.analyzer, False)
+
+        self.assertEqual(["Don't"], [token.form for token in tokens])
+        # like the first word of a sentence, the word is looked up lowercased
+        self.assertEqual(Counter({"don't": 1}), self.foma.queries)
+
+    def test_multiword_tokenizer_shares_lookups_of_text(self):
+        tokenizer = MultiwordTokenizer()
+
+        result = tokenizer.tokenize("Biarlah saja. Biarlah saja.")
+
+        self.assertEqual([['Biar', 'lah', 'saja', '.']] * 2, result)
+        self.assertEqual(Counter({'@informalbiarlah': 1, '@informalsaja': 1, '@informal.': 1}),
+                         self.foma.queries)
+
+    def test_async_every_variant_is_looked_up_once(self):
+        texts = ['Saya makan nasi .', 'Dia makan nasi .'] * 4
+        expected = self.analyze(texts)
+        self.foma.queries.clear()
+
+        with patch(target=analyzer_module.__name__ + '.asyncio.create_subprocess_exec',
+                   side_effect=self.foma.create_subprocess_exec):
+            result = asyncio.run(core.aanalyze_sentences(
+                texts, self.analyzer, None, ParseBatcher(), **FLAGS
+            ))
+
+        self.assertEqual(expected, result)
+        self.assertEqual(Counter({'saya': 1, 'dia': 1, 'makan': 1, 'nasi': 1, '.': 1}),
+                         self.foma.queries)
+
+    def test_async_lookups_of_earlier_event_loop_are_run_again(self):
+        analyzer = BaseAnalyzer('umabi.bin', self.normalizer, memoize_lookups=True)
+
+        with patch(target=analyzer_module.__name__ + '.asyncio.create_subprocess_exec',
+                   side_effect=self.foma.create_subprocess_exec):
+            for _ in range(2):
+                result = asyncio.run(core.aanalyze_sentences(
+                    ['Saya makan .'], analyzer, None, ParseBatcher(), **FLAGS
+                ))
+                self.assertEqual(['Saya', 'makan', '.'], [token.form for token in result[0]])
+
+        self.assertEqual(Counter({'saya': 2, 'makan': 2, '.': 2}), self.foma.queries)
+
+
+if __name__ == '__main__':
+    unittest.main()
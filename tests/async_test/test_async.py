@@ -0,0 +1,116 @@
+import asyncio
+import unittest
+from unittest.mock import patch, Mock
+
+import aksara._nlp_internal.batching as batching
+import aksara._nlp_internal.core as core
+from aksara._nlp_internal.analyzer import arun_lookups, run_lookups
+from aksara._nlp_internal.batching import ParseBatcher
+
+
+class FakeAnalyzer:
+    """stands in for BaseAnalyzer, every token is a noun"""
+
+    def analyze(self, word, *_):
+        return word.lower() + "+NOUN"
+
+    async def aanalyze(self, word, *context):
+        await asyncio.sleep(0)
+        return self.analyze(word, *context)
+
+
+class FakeDependencyParser:
+    """stands in for the neural parser, attaches every token to the root"""
+
+    def parse_rows(self, rows):
+        for row in rows:
+            if row.is_word():
+                row.head = "0"
+                row.deprel = "root"
+        return rows
+
+
+FLAGS = {'v1': False, 'lemma': False, 'postag': False, 'informal': False}
+
+
+def _steps():
+    first = yield 'a'
+    second = yield 'b'
+    return first + second
+
+
+class LookupTest(unittest.IsolatedAsyncioTestCase):
+    """Test the drivers of the sans-IO analysis generators"""
+
+    def test_run_lookups(self):
+        self.assertEqual('AB', run_lookups(_steps(), str.upper))
+
+    async def test_arun_lookups(self):
+        async def alookup(query):
+            await asyncio.sleep(0)
+            return query.upper()
+
+        self.assertEqual('AB', await arun_lookups(_steps(), alookup))
+
+    async def test_aanalyze_tokens_same_as_analyze_tokens(self):
+        text = 'Andi pergi ke pasar , lalu pulang .'
+
+        self.assertEqual(
+            core.analyze_tokens(text, FakeAnalyzer(), False),
+            await core.aanalyze_tokens(text, FakeAnalyzer(), False)
+        )
+
+
+class ParseBatcherTest(unittest.IsolatedAsyncioTestCase):
+    """Test aksara._nlp_internal.batching.ParseBatcher"""
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            ParseBatcher(max_batch_size=0)
+        with self.assertRaises(ValueError):
+            ParseBatcher(max_wait=-1)
+
+    async def test_concurrent_requests_are_coalesced(self):
+        batch_sizes = []
+
+        def parse_batch(requests):
+            batch_sizes.append(len(requests))
+            return [(True, rows) for rows, _, _ in requests]
+
+        batcher = ParseBatcher(max_batch_size=4, max_wait=0.05)
+        with patch(target=batching.__name__ + '._parse_batch', side_effect=parse_batch):
+            result = await asyncio.gather(*(batcher.parse(i, None) for i in range(10)))
+
+        self.assertEqual(list(range(10)), result)
+        self.assertEqual([4, 4, 2], batch_sizes)
+
+    async def test_error_only_fails_its_request(self):
+        def parse_batch(requests):
+            return [(rows != 1, ValueError() if rows == 1 else rows) for rows, _, _ in requests]
+
+        batcher = ParseBatcher(max_wait=0.01)
+        with patch(target=batching.__name__ + '._parse_batch', side_effect=parse_batch):
+            result = await asyncio.gather(
+                *(batcher.parse(i, None) for i in range(3)), return_exceptions=True
+            )
+
+        self.assertEqual(0, result[0])
+        self.assertIsInstance(result[1], ValueError)
+        self.assertEqual(2, result[2])
+
+    @patch(target=core.__name__ + '.get_disambiguator')
+    async def test_aanalyze_sentences_same_as_analyze_sentences(self, mock: Mock):
+        mock.return_value.disambiguate.side_effect = lambda rows: rows
+        sentences = [f'Kalimat nomor {i} , ditulis Andi .' for i in range(20)]
+
+        result = await core.aanalyze_sentences(
+            sentences, FakeAnalyzer(), FakeDependencyParser(),
+            ParseBatcher(max_batch_size=8), max_concurrency=5, **FLAGS
+        )
+
+        self.assertEqual(
+            list(core.analyze_sentences(
+                sentences, FakeAnalyzer(), FakeDependencyParser(), **FLAGS
+            )),
+            result
+        )
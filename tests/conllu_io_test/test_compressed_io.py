@@ -0,0 +1,103 @@
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+import unittest
+
+from aksara.utils.conllu_io import _write_reduce_conllu, iter_conllu, read_conllu, write_conllu
+
+OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+CONLLU_TEXT = (
+    '# sent_id = 1\n# text = Saya makan.\n'
+    '1\tSaya\tsaya\tPRON\t_\tNumber=Sing|Person=1\t2\tnsubj\t_\t_\n'
+    '2\tmakan\tmakan\tVERB\t_\t_\t0\troot\t_\t_\n'
+    '3\t.\t.\tPUNCT\t_\t_\t2\tpunct\t_\t_\n\n'
+    '# sent_id = 2\n# text = Rumahnya besar\n'
+    '1-2\tRumahnya\t_\t_\t_\t_\t_\t_\t_\t_\n'
+    '1\tRumah\trumah\tNOUN\t_\t_\t3\tnsubj\t_\t_\n'
+    '2\tnya\tia\tPRON\t_\t_\t1\tnmod\t_\t_\n'
+    '3\tbesar\tbesar\tADJ\t_\t_\t0\troot\t_\t_\n\n'
+)
+
+
+class CompressedConlluTest(unittest.TestCase):
+    """test reading and writing gzip, bz2 and xz CoNLL-U files"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.plain_path = os.path.join(self.temp_dir.name, 'corpus.conllu')
+        with open(self.plain_path, 'w', encoding='utf-8') as file:
+            file.write(CONLLU_TEXT)
+
+        self.sentences = read_conllu(self.plain_path)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        return super().tearDown()
+
+    def __compressed_path(self, extension):
+        file_path = os.path.join(self.temp_dir.name, 'corpus.conllu' + extension)
+        with OPENERS[extension](file_path, 'wt', encoding='utf-8') as file:
+            file.write(CONLLU_TEXT)
+        return file_path
+
+    def test_read_by_extension(self):
+        for extension in OPENERS:
+            with self.subTest(extension=extension):
+                file_path = self.__compressed_path(extension)
+                self.assertEqual(self.sentences, read_conllu(file_path))
+                self.assertEqual(self.sentences, list(read_conllu(file_path, as_corpus=True)))
+                self.assertEqual(self.sentences, list(iter_conllu(file_path)))
+                # a compressed file is never split into byte ranges
+                self.assertEqual(self.sentences, read_conllu(file_path, n_jobs=2))
+
+    def test_read_explicit_codec(self):
+        file_path = os.path.join(self.temp_dir.name, 'corpus.data')
+        with gzip.open(file_path, 'wt', encoding='utf-8') as file:
+            file.write(CONLLU_TEXT)
+
+        self.assertEqual(self.sentences, read_conllu(file_path, compression='gzip'))
+
+    def test_plain_text_with_compressed_extension(self):
+        file_path = os.path.join(self.temp_dir.name, 'corpus.conllu.gz')
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write(CONLLU_TEXT)
+
+        self.assertEqual(self.sentences, read_conllu(file_path, compression=None))
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            read_conllu(self.plain_path, compression='zip')
+        with self.assertRaises(ValueError):
+            iter_conllu(self.plain_path, compression='zip')
+
+    def test_write_by_extension(self):
+        texts = ['Saya makan.', 'Rumahnya besar']
+        for extension, opener in OPENERS.items():
+            with self.subTest(extension=extension):
+                file_path = os.path.join(self.temp_dir.name, 'output.conllu' + extension)
+                write_conllu(texts, self.sentences, file_path)
+
+                with opener(file_path, 'rt', encoding='utf-8') as file:
+                    self.assertTrue(file.read().startswith('# sent_id = 1\n# text = Saya makan.\n'))
+                self.assertEqual(self.sentences, read_conllu(file_path))
+
+    def test_append_to_compressed_file(self):
+        file_path = os.path.join(self.temp_dir.name, 'output.conllu.gz')
+        write_conllu(['Saya makan.'], self.sentences[:1], file_path)
+        write_conllu(['Rumahnya besar'], self.sentences[1:], file_path, write_mode='a')
+
+        self.assertEqual(self.sentences, read_conllu(file_path))
+
+    def test_write_reduce_conllu(self):
+        file_path = os.path.join(self.temp_dir.name, 'output.conllu.xz')
+        _write_reduce_conllu(['Saya makan.'], [[('1', 'Saya', 'PRON')]], file_path)
+
+        with lzma.open(file_path, 'rt', encoding='utf-8') as file:
+            self.assertEqual(
+                '# sent_id = 1\n# text = Saya makan.\n1\tSaya\tPRON\n', file.read()
+            )
+
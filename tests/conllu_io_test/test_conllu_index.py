@@ -0,0 +1,126 @@
+import os
+import tempfile
+import unittest
+
+from aksara.utils.conllu_index import IndexedConllu, build_conllu_index
+from aksara.utils.conllu_io import read_conllu
+
+
+class ConlluIndexTest(unittest.TestCase):
+    """test aksara.utils.conllu_index"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'corpus.conllu')
+        with open(self.file_path, 'w', encoding='utf-8', newline='') as file:
+            for i in range(1, 51):
+                file.write(
+                    f'# sent_id = s{i}\n# text = Kalimat {i}\n'
+                    f'1\tKalimat\tkalimat\tNOUN\t_\t_\t0\troot\t_\t_\n'
+                    f'2\t{i}\t{i}\tNUM\t_\t_\t1\tnummod\t_\t_\n\n'
+                )
+
+        self.sentences = read_conllu(self.file_path)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        return super().tearDown()
+
+    def test_random_access(self):
+        with IndexedConllu(self.file_path) as conllu:
+            self.assertEqual(50, len(conllu))
+            self.assertEqual(self.sentences[0], conllu[0])
+            self.assertEqual(self.sentences[37], conllu[37])
+            self.assertEqual(self.sentences[-1], conllu[-1])
+            with self.assertRaises(IndexError):
+                conllu[50]
+
+    def test_ranges(self):
+        with IndexedConllu(self.file_path) as conllu:
+            self.assertEqual(self.sentences[10:20], conllu.get_range(10, 20))
+            self.assertEqual(self.sentences[45:], conllu[45:])
+            self.assertEqual(self.sentences[::7], conllu[::7])
+            self.assertEqual([], conllu.get_range(5, 5))
+
+    def test_sent_id(self):
+        with IndexedConllu(self.file_path) as conllu:
+            self.assertEqual(self.sentences[11], conllu.get_by_sent_id('s12'))
+            self.assertIsNone(conllu.get_by_sent_id('s51'))
+            self.assertEqual([f's{i}' for i in range(1, 51)], conllu.sent_ids())
+
+    def test_sidecar_is_written_and_reused(self):
+        index_path = build_conllu_index(self.file_path)
+        self.assertEqual(os.path.realpath(self.file_path + '.idx'), index_path)
+
+        modified = os.stat(index_path).st_mtime_ns
+        with IndexedConllu(self.file_path) as conllu:
+            self.assertEqual(self.sentences[3], conllu[3])
+        self.assertEqual(modified, os.stat(index_path).st_mtime_ns)
+
+    def test_stale_index_is_rebuilt(self):
+        index_path = os.path.join(self.temp_dir.name, 'custom.idx')
+        build_conllu_index(self.file_path, index_path)
+
+        with open(self.file_path, 'a', encoding='utf-8') as file:
+            file.write('# sent_id = extra\n1\tHalo\thalo\tINTJ\t_\t_\t0\troot\t_\t_\n')
+
+        with IndexedConllu(self.file_path, index_path) as conllu:
+            self.assertEqual(51, len(conllu))
+            self.assertEqual('Halo', conllu.get_by_sent_id('extra')[0].get_form())
+
+    def test_truncated_index_is_rebuilt(self):
+        index_path = build_conllu_index(self.file_path)
+        with open(index_path, 'rb') as index_file:
+            data = index_file.read()
+
+        for size in [10, 40, 500, len(data) - 3]:
+            with self.subTest(size=size):
+                with open(index_path, 'wb') as index_file:
+                    index_file.write(data[:size])
+
+                with IndexedConllu(self.file_path) as conllu:
+                    self.assertEqual(50, len(conllu))
+                    self.assertEqual(self.sentences[49], conllu.get_by_sent_id('s50'))
+                with open(index_path, 'rb') as index_file:
+                    self.assertEqual(data, index_file.read())
+
+        self.assertEqual(['corpus.conllu', 'corpus.conllu.idx'], sorted(os.listdir(self.temp_dir.name)))
+
+    def test_crlf_and_empty_file(self):
+        crlf_path = os.path.join(self.temp_dir.name, 'crlf.conllu')
+        with open(self.file_path, 'rb') as source, open(crlf_path, 'wb') as target:
+            target.write(source.read().replace(b'\n', b'\r\n'))
+        with IndexedConllu(crlf_path) as conllu:
+            self.assertEqual(self.sentences[5], conllu[5])
+
+        empty_path = os.path.join(self.temp_dir.name, 'empty.conllu')
+        open(empty_path, 'w', encoding='utf-8').close()
+        with IndexedConllu(empty_path) as conllu:
+            self.assertEqual(0, len(conllu))
+            self.assertEqual([], conllu[:])
+
+    def test_unicode_line_separators_inside_columns(self):
+        with open(self.file_path, 'w', encoding='utf-8', newline='') as file:
+            file.write('1\tab\u2028c\tab\x85c\tX\t_\t_\t0\troot\t_\t_\n'
+                       '2\td\x0ce\td\tX\t_\t_\t1\tdep\t_\t_\n')
+
+        with IndexedConllu(self.file_path) as conllu:
+            self.assertEqual(read_conllu(self.file_path), conllu[:])
+            self.assertEqual('ab\u2028c', conllu[0][0].get_form())
+
+    def test_comment_only_blocks(self):
+        with open(self.file_path, 'w', encoding='utf-8', newline='') as file:
+            file.write('# newdoc id = d1\n\n'
+                       '# sent_id = s1\n1\tHalo\thalo\tINTJ\t_\t_\t0\troot\t_\t_\n\n'
+                       '# newdoc id = d2\n# sent_id = s2\n\n'
+                       '1\tSaya\tsaya\tPRON\t_\t_\t0\troot\t_\t_\n\n# end of file\n')
+
+        with IndexedConllu(self.file_path) as conllu:
+            self.assertEqual(read_conllu(self.file_path), conllu[:])
+            self.assertEqual(['s1', 's2'], conllu.sent_ids())
+            self.assertEqual('Saya', conllu.get_by_sent_id('s2')[0].get_form())
+
+    def test_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            IndexedConllu(os.path.join(self.temp_dir.name, 'unknown.conllu'))
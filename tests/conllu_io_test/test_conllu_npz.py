@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+import zipfile
+
+from aksara.conllu import ConlluData, ParsedCorpus
+from aksara.utils.conllu_io import read_conllu, write_conllu
+from aksara.utils.conllu_npz import read_conllu_npz, write_conllu_npz
+
+
+class ConlluNpzTest(unittest.TestCase):
+    """test aksara.utils.conllu_npz"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.conllu_path = os.path.join(self.temp_dir.name, 'corpus.conllu')
+        self.npz_path = os.path.join(self.temp_dir.name, 'corpus.npz')
+        with open(self.conllu_path, 'w', encoding='utf-8', newline='') as file:
+            for i in range(1, 31):
+                if i % 4 == 0:
+                    file.write('1-2\tbukunya\t_\t_\t_\t_\t_\t_\t_\t_\n')
+                file.write(
+                    f'1\tBuku\tbuku\tNOUN\tNSD\tNumber=Sing\t0\troot\t_\t_\n'
+                    f'2\tke-{i}\tke-{i}\tADJ\t_\tNumType=Ord\t1\tamod\t_\t_\n'
+                    f'3\tdéjà\tdéjà\tX\t_\t_\t1\tdep\t_\t_\n\n'
+                )
+
+        self.sentences = read_conllu(self.conllu_path)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        return super().tearDown()
+
+    def test_round_trip(self):
+        write_conllu_npz(self.npz_path, self.sentences)
+        corpus = read_conllu_npz(self.npz_path)
+
+        self.assertIsInstance(corpus, ParsedCorpus)
+        self.assertEqual(self.sentences, list(corpus))
+
+        output_path = os.path.join(self.temp_dir.name, 'output.conllu')
+        write_conllu(['Buku'] * len(corpus), corpus, output_path)
+        self.assertEqual(self.sentences, read_conllu(output_path))
+
+    def test_mmap(self):
+        write_conllu_npz(self.npz_path, read_conllu(self.conllu_path, as_corpus=True))
+        corpus = read_conllu_npz(self.npz_path, mmap=True)
+
+        self.assertEqual(len(self.sentences), len(corpus))
+        self.assertEqual(sum(map(len, self.sentences)), corpus.n_tokens)
+        self.assertEqual(self.sentences[7], corpus[7])
+        self.assertEqual(self.sentences, list(corpus))
+
+        extra = [ConlluData('1', 'Halo', 'halo', 'INTJ', head_id='0', deprel='root')]
+        corpus.append(extra)
+        self.assertEqual(extra, corpus[-1])
+        self.assertEqual(self.sentences[-1], corpus[-2])
+
+    def test_compressed(self):
+        write_conllu_npz(self.npz_path, self.sentences, compressed=True)
+        with zipfile.ZipFile(self.npz_path) as archive:
+            self.assertTrue(all(
+                info.compress_type == zipfile.ZIP_DEFLATED for info in archive.infolist()
+            ))
+
+        self.assertEqual(self.sentences, list(read_conllu_npz(self.npz_path, mmap=True)))
+
+    def test_empty_corpus(self):
+        write_conllu_npz(self.npz_path, [])
+
+        self.assertEqual(0, len(read_conllu_npz(self.npz_path)))
+        self.assertEqual(0, len(read_conllu_npz(self.npz_path, mmap=True)))
+
+    def test_not_a_conllu_npz(self):
+        import numpy as np
+
+        np.savez(self.npz_path, values=np.arange(3))
+        with self.assertRaises(ValueError):
+            read_conllu_npz(self.npz_path)
+
+    def test_from_columns_checks_lengths(self):
+        corpus = read_conllu(self.conllu_path, as_corpus=True)
+        codes = {column: corpus.codes(column) for column in ParsedCorpus.COLUMNS}
+        vocabularies = {column: corpus.vocabulary(column) for column in ParsedCorpus.COLUMNS}
+
+        self.assertEqual(
+            self.sentences,
+            list(ParsedCorpus.from_columns(codes, vocabularies, corpus.sentence_offsets()))
+        )
+
+        codes['form'] = codes['form'][:-1]
+        with self.assertRaises(ValueError):
+            ParsedCorpus.from_columns(codes, vocabularies, corpus.sentence_offsets())
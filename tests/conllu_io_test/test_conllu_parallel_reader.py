@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from aksara.utils import conllu_io
+from aksara.utils.conllu_io import read_conllu
+
+
+class ParallelConlluReaderTest(unittest.TestCase):
+    """test read_conllu with n_jobs > 1"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'corpus.conllu')
+        with open(self.file_path, 'w', encoding='utf-8', newline='') as file:
+            for i in range(1, 201):
+                file.write(f'# sent_id = s{i}\n')
+                if i % 3 == 0:
+                    file.write('1-2\tkalimatnya\t_\t_\t_\t_\t_\t_\t_\t_\n')
+                file.write(
+                    f'1\tKalimat\tkalimat\tNOUN\t_\t_\t0\troot\t_\t_\n'
+                    f'2\t{i}\t{i}\tNUM\t_\tNumType=Card\t1\tnummod\t_\t_\n'
+                )
+                # some sentences are separated by more than one blank line
+                file.write('\n\n' if i % 7 == 0 else '\n')
+
+        # a few KiB per chunk, so the small test file is split
+        self.chunk_size_patcher = patch.object(conllu_io, '_MIN_CHUNK_BYTES', 512)
+        self.chunk_size_patcher.start()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.chunk_size_patcher.stop()
+        self.temp_dir.cleanup()
+        return super().tearDown()
+
+    def test_boundaries_are_blank_lines(self):
+        boundaries = conllu_io._find_sentence_boundaries(self.file_path, 8)
+
+        self.assertEqual(0, boundaries[0])
+        self.assertEqual(os.path.getsize(self.file_path), boundaries[-1])
+        self.assertGreater(len(boundaries), 2)
+        self.assertEqual(sorted(set(boundaries)), boundaries)
+
+        with open(self.file_path, 'rb') as file:
+            data = file.read()
+        for boundary in boundaries[1:-1]:
+            self.assertEqual(b'\n\n', data[boundary - 2:boundary])
+
+    def test_same_sentences_as_serial(self):
+        self.assertEqual(read_conllu(self.file_path), read_conllu(self.file_path, n_jobs=2))
+
+    def test_unicode_line_separators_inside_columns(self):
+        with open(self.file_path, 'w', encoding='utf-8', newline='') as file:
+            for i in range(1, 51):
+                file.write(f'1\tab\u2028c{i}\tab\x85c\tX\t_\t_\t0\troot\t_\t_\n'
+                           f'2\td\x0ce\x1cf\td\tX\t_\t_\t1\tdep\t_\t_\n\n')
+
+        serial = read_conllu(self.file_path)
+
+        self.assertEqual(50, len(serial))
+        self.assertEqual('ab\u2028c1', serial[0][0].get_form())
+        self.assertEqual(serial, read_conllu(self.file_path, n_jobs=2))
+        self.assertEqual(serial, list(read_conllu(self.file_path, as_corpus=True, n_jobs=2)))
+
+    def test_comment_only_blocks(self):
+        with open(self.file_path, 'w', encoding='utf-8', newline='') as file:
+            for i in range(1, 101):
+                if i % 5 == 1:
+                    file.write(f'# newdoc id = d{i}\n\n')
+                file.write(f'1\tKalimat\tkalimat\tNOUN\t_\t_\t0\troot\t_\t_\n'
+                           f'2\t{i}\t{i}\tNUM\t_\t_\t1\tnummod\t_\t_\n\n')
+
+        serial = read_conllu(self.file_path)
+        self.assertEqual(100, len(serial))
+        self.assertEqual(serial, read_conllu(self.file_path, n_jobs=2))
+        self.assertEqual(serial, list(read_conllu(self.file_path, as_corpus=True, n_jobs=2)))
+
+    def test_same_corpus_as_serial(self):
+        serial = read_conllu(self.file_path, as_corpus=True)
+        parallel = read_conllu(self.file_path, as_corpus=True, n_jobs=2)
+
+        self.assertEqual(len(serial), len(parallel))
+        self.assertEqual(list(serial), list(parallel))
+        self.assertEqual(serial.vocabulary('form'), parallel.vocabulary('form'))
+
+    def test_empty_file(self):
+        empty_path = os.path.join(self.temp_dir.name, 'empty.conllu')
+        open(empty_path, 'w', encoding='utf-8').close()
+
+        self.assertEqual([], read_conllu(empty_path, n_jobs=2))
+        self.assertEqual(0, len(read_conllu(empty_path, as_corpus=True, n_jobs=2)))
+
+    def test_invalid_n_jobs(self):
+        with self.assertRaises(ValueError):
+            read_conllu(self.file_path, n_jobs=0)
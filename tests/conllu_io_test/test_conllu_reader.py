@@ -1,8 +1,9 @@
 import unittest
 import os
+import tempfile
 
-from aksara.utils.conllu_io import read_conllu
-from aksara.conllu import ConlluData
+from aksara.utils.conllu_io import iter_conllu, read_conllu
+from aksara.conllu import ConlluData, ParsedCorpus
 
 
 class ConlluReaderTest(unittest.TestCase):
@@ -95,3 +96,91 @@ class ConlluReaderTest(unittest.TestCase):
             read_conllu(self.custom_separator_path,
                         separator=r'\?\?')
         )
+
+    def test_read_as_corpus(self):
+        corpus = read_conllu(self.multiple_conllu_path, as_corpus=True)
+
+        self.assertIsInstance(corpus, ParsedCorpus)
+        self.assertListEqual(self.multiple_sentence_conllu, list(corpus))
+
+    def test_empty_file_as_corpus(self):
+        self.assertEqual(0, len(read_conllu(self.empty_file_path, as_corpus=True)))
+
+    def test_iter_conllu_is_lazy(self):
+        sentences = iter_conllu(self.multiple_conllu_path)
+
+        self.assertListEqual(self.multiple_sentence_conllu[0], next(sentences))
+        self.assertListEqual(self.multiple_sentence_conllu[1:], list(sentences))
+
+    def test_iter_conllu_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            iter_conllu('unknown_file.txt')
+
+    def test_iter_conllu_with_comments(self):
+        comments, sentence = next(iter_conllu(self.single_conllu_path, with_comments=True))
+
+        self.assertEqual({'sent_id': '1', 'text': 'Andi pergi ke pasar'}, comments)
+        self.assertListEqual(self.single_sentence_conllu[0], sentence)
+
+    def test_any_number_of_comments_and_blank_lines(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'generic.conllu')
+            with open(file_path, 'w', encoding='utf-8') as file:
+                file.write(
+                    '# newdoc id = doc1\n# sent_id = 1\n# a free comment\n'
+                    '1\tHalo\thalo\tINTJ\t_\t_\t0\troot\t_\t_\n'
+                    '\n\n'
+                    '1 Saya saya PRON _ _ 0 root _ _\n'
+                )
+
+            result = list(iter_conllu(file_path, with_comments=True))
+
+        self.assertEqual(
+            [({'newdoc id': 'doc1', 'sent_id': '1', 'a free comment': None},
+              [ConlluData('1', 'Halo', 'halo', 'INTJ', '_', '_', '0', 'root')]),
+             ({}, [ConlluData('1', 'Saya', 'saya', 'PRON', '_', '_', '0', 'root')])],
+            result
+        )
+
+    def test_comment_only_block_belongs_to_next_sentence(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'newdoc.conllu')
+            with open(file_path, 'w', encoding='utf-8') as file:
+                file.write(
+                    '# newdoc id = d1\n\n'
+                    '# sent_id = 1\n1\tHalo\thalo\tINTJ\t_\t_\t0\troot\t_\t_\n\n'
+                    '# newpar\n\n\n# newdoc id = d2\n\n'
+                    '1\tSaya\tsaya\tPRON\t_\t_\t0\troot\t_\t_\n\n'
+                    '# end of file\n'
+                )
+
+            result = list(iter_conllu(file_path, with_comments=True))
+            sentences = read_conllu(file_path)
+            corpus = read_conllu(file_path, as_corpus=True)
+
+        self.assertEqual(
+            [({'newdoc id': 'd1', 'sent_id': '1'},
+              [ConlluData('1', 'Halo', 'halo', 'INTJ', '_', '_', '0', 'root')]),
+             ({'newpar': None, 'newdoc id': 'd2'},
+              [ConlluData('1', 'Saya', 'saya', 'PRON', '_', '_', '0', 'root')])],
+            result
+        )
+        self.assertEqual([sentence for _, sentence in result], sentences)
+        self.assertEqual(sentences, list(corpus))
+
+    def test_short_row_as_corpus(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'short.conllu')
+            with open(file_path, 'w', encoding='utf-8') as file:
+                file.write(
+                    '1\tSaya\tsaya\tPRON\t_\t_\t2\tnsubj\t_\t_\n'
+                    '2\tmakan\n'
+                    '\n'
+                    '1\tIa\tia\tPRON\t_\t_\t0\troot\t_\t_\n'
+                )
+
+            sentences = read_conllu(file_path)
+            corpus = read_conllu(file_path, as_corpus=True)
+
+        self.assertEqual(2, len(corpus))
+        self.assertEqual(sentences, list(corpus))
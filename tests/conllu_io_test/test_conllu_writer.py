@@ -1,8 +1,10 @@
 import unittest
 import os
 
-from aksara.utils.conllu_io import read_conllu, write_conllu
-from aksara.conllu import ConlluData
+from aksara.utils.conllu_io import (
+    read_conllu, write_conllu, _resume_conllu, _write_conllu_stream
+)
+from aksara.conllu import ConlluData, ParsedCorpus
 
 
 def get_tmp_dir():
@@ -120,6 +122,16 @@ class ConlluWriterTest(unittest.TestCase):
         self.assertListEqual(self.multiple_sentence_conllu,
                              read_conllu(dest_path))
 
+    def test_parsed_corpus_input(self):
+        dest_path = write_conllu(
+            self.multi_sentence_text.split('.'),
+            ParsedCorpus(self.multiple_sentence_conllu),
+            self.path1
+        )
+
+        self.assertListEqual(self.multiple_sentence_conllu,
+                             read_conllu(dest_path))
+
     def test_all_mode_should_create_new_file_if_not_exists(self):
         not_exists_x = os.path.join(get_tmp_dir(), 'not_exists_x.txt')
         not_exists_w = os.path.join(get_tmp_dir(), 'not_exists_w.txt')
@@ -225,3 +237,52 @@ class ConlluWriterTest(unittest.TestCase):
 
         self.assertListEqual(self.single_sentence_conllu,
                              read_conllu(dest_path))
+
+    def test_stream_writer_consumes_generator(self):
+        sentence_list = self.multi_sentence_text.split('.')
+        dest_path = _write_conllu_stream(
+            zip(iter(sentence_list), iter(self.multiple_sentence_conllu)),
+            self.path1
+        )
+
+        self.assertListEqual(self.multiple_sentence_conllu,
+                             read_conllu(dest_path))
+
+    def test_stream_writer_keeps_completed_sentences_on_error(self):
+        def sentence_with_conllu():
+            yield self.one_sentence_text, self.single_sentence_conllu[0]
+            raise RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            _write_conllu_stream(sentence_with_conllu(), self.path1)
+
+        self.assertListEqual(self.single_sentence_conllu,
+                             read_conllu(self.path1))
+
+    def test_resume_partial_file_cut_anywhere(self):
+        sentences = ['Kalimat satu.', 'Kalimat dua.', 'Kalimat tiga.']
+        list_conllu = self.single_sentence_conllu * 3
+        _write_conllu_stream(zip(sentences, list_conllu), self.path1)
+        with open(self.path1, 'rb') as file:
+            complete = file.read()
+
+        for cut in range(len(complete) + 1):
+            with self.subTest(cut=cut):
+                with open(self.path1, 'wb') as file:
+                    file.write(complete[:cut])
+
+                resume_from = _resume_conllu(self.path1)
+                _write_conllu_stream(
+                    zip(sentences[resume_from:], list_conllu[resume_from:]), self.path1,
+                    resume_from=resume_from
+                )
+
+                with open(self.path1, 'rb') as file:
+                    self.assertEqual(complete, file.read())
+
+    def test_resume_missing_or_compressed_file(self):
+        self.assertEqual(0, _resume_conllu(self.path1))
+        self.assertFalse(os.path.exists(self.path1))
+
+        with self.assertRaises(ValueError):
+            _resume_conllu(self.path1 + '.gz')
@@ -0,0 +1,57 @@
+import os
+from unittest import TestCase
+from unittest.mock import patch, Mock
+
+import aksara.dependency_parser
+from aksara.dependency_parser import DependencyParser
+
+PARSE_ONE_SENTENCE_MODULE_NAME = aksara.dependency_parser.__name__ + \
+                                 '.DependencyParser._parse_one_sentence'
+
+
+class DependencyParserIterParseTest(TestCase):
+    """Test aksara.dependency_parser.DependencyParser.iter_parse"""
+
+    def setUp(self) -> None:
+        self.dependency_parser = DependencyParser()
+        self.file_path = os.path.join(
+            os.path.dirname(__file__), 'sample_reader_input', 'test_dependency.txt'
+        )
+        return super().setUp()
+
+    def test_should_raise_value_error_if_mode_is_not_file_and_text(self):
+        with self.assertRaises(ValueError):
+            self.dependency_parser.iter_parse("sebuah kalimat", input_mode="unknown_mode")
+
+    def test_should_raise_value_error_before_iteration_if_model_is_unknown(self):
+        with self.assertRaises(ValueError):
+            self.dependency_parser.iter_parse("sebuah kalimat", model="unknown_model")
+
+    def test_should_raise_value_error_before_iteration_if_n_jobs_is_invalid(self):
+        with self.assertRaises(ValueError):
+            self.dependency_parser.iter_parse("sebuah kalimat", n_jobs=0)
+
+    def test_should_raise_file_not_found_error(self):
+        with self.assertRaises(FileNotFoundError):
+            self.dependency_parser.iter_parse("unknown_file.txt", input_mode="f")
+
+    @patch(target=PARSE_ONE_SENTENCE_MODULE_NAME)
+    def test_should_parse_one_sentence_per_item(self, mock: Mock):
+        result = self.dependency_parser.iter_parse(self.file_path, input_mode="f")
+        self.assertEqual(0, mock.call_count)
+
+        next(result)
+        self.assertEqual(1, mock.call_count)
+        mock.assert_called_with("Apa yang kamu inginkan?", False, "FR_GSD-ID_CSUI")
+
+        self.assertEqual(2, len(list(result)))
+        self.assertEqual(3, mock.call_count)
+
+    @patch(target=PARSE_ONE_SENTENCE_MODULE_NAME)
+    def test_should_yield_same_result_as_parse(self, mock: Mock):
+        mock.side_effect = lambda sentence, *_: [sentence]
+
+        self.assertEqual(
+            self.dependency_parser.parse(self.file_path, input_mode="f"),
+            list(self.dependency_parser.iter_parse(self.file_path, input_mode="f"))
+        )
@@ -1,19 +1,30 @@
+import os
+import tempfile
 from unittest import TestCase
 from unittest.mock import patch, Mock
 
 import aksara.dependency_parser
 from aksara.dependency_parser import DependencyParser
 from aksara.conllu import ConlluData
+from aksara.utils.conllu_io import write_conllu
 
-MULTI_SENTENCE_MODULE_NAME = aksara.dependency_parser.__name__ + \
-                             '.DependencyParser.parse'
+ONE_SENTENCE_MODULE_NAME = aksara.dependency_parser.__name__ + \
+                           '.DependencyParser._parse_one_sentence'
+
+
+WRITTEN_SENTENCES = []
+
+
+def _consume(sentence_with_conllu, *_args, **_kwargs):
+    """stands in for the streaming writer, which drains the generator"""
+    WRITTEN_SENTENCES[:] = list(sentence_with_conllu)
 
 
 # index 1 (mocks[1])
-@patch(target=MULTI_SENTENCE_MODULE_NAME)
+@patch(target=ONE_SENTENCE_MODULE_NAME)
 # index 0 (mocks[0])
-@patch(target=aksara.dependency_parser.__name__ + '.write_conllu',
-       side_effect=None)
+@patch(target=aksara.dependency_parser.__name__ + '._write_conllu_stream',
+       side_effect=_consume)
 class DependencyParserOutputFileTest(TestCase):
     """class to test aksara.dependency_parser.parse_to_file method"""
 
@@ -74,36 +85,137 @@ class DependencyParserOutputFileTest(TestCase):
         ]
         return super().setUp()
 
-    def test_should_call_multi_sentences_parser_method(self, *mocks: Mock):
-        self.dependency_parser.parse_to_file('sebuah kalimat', 'file1.txt')
-        self.assertEqual(1, mocks[1].call_count)
+    def test_should_call_one_sentence_parser_once_per_sentence(self, *mocks: Mock):
+        self.dependency_parser.parse_to_file('Kalimat satu. Kalimat dua.', 'file1.txt')
+        self.assertEqual(2, mocks[1].call_count)
 
-    def test_should_call_write_conllu(self, *mocks: Mock):
-        # mock main parser
-        mocks[1].return_value = self.multiple_sentence_conllu
+    def test_should_call_write_conllu_stream(self, *mocks: Mock):
+        mocks[1].return_value = self.single_sentence_conllu[0]
         self.dependency_parser.parse_to_file('sebuah kalimat', 'file1.txt')
         self.assertEqual(1, mocks[0].call_count)
 
-    def test_multi_sentences_parser_called_with_correct_args(self, *mocks: Mock):
+    def test_one_sentence_parser_called_with_correct_args(self, *mocks: Mock):
         self.dependency_parser.parse_to_file('sebuah kalimat', 'file1.txt', is_informal=True,
-                                                        sep_regex=r'\?')
-
-        expected_args = ('sebuah kalimat',)
-        expected_kwargs = {'input_mode': "s", 'is_informal': True, 'sep_regex': r'\?',
-                           'model': 'FR_GSD-ID_CSUI'}
+                                             sep_regex=r'\?')
 
+        expected_args = ('sebuah kalimat', True, 'FR_GSD-ID_CSUI')
         self.assertEqual(expected_args, mocks[1].call_args.args)
-        self.assertEqual(expected_kwargs, mocks[1].call_args.kwargs)
 
-    def test_write_conllu_called_with_correct_args(self, *mocks: Mock):
-        mocks[1].return_value = self.multiple_sentence_conllu
+    def test_write_conllu_stream_called_with_correct_args(self, *mocks: Mock):
+        mocks[1].side_effect = self.multiple_sentence_conllu
 
-        self.dependency_parser.parse_to_file('Sebuah kalimat', 'file1.txt',
-                                                        write_mode='w', sep_column=r'\?\?')
+        self.dependency_parser.parse_to_file('Kalimat satu. Kalimat dua.', 'file1.txt',
+                                             write_mode='w', sep_column=r'\?\?')
 
-        expected_args = (['Sebuah kalimat'], self.multiple_sentence_conllu, 'file1.txt',)
-        expected_kwargs = {'write_mode': 'w', 'separator': r'\?\?'}
+        expected_kwargs = {'write_mode': 'w', 'separator': r'\?\?', 'resume_from': None}
 
-        self.assertListEqual(expected_args[0], mocks[0].call_args.args[0])
-        self.assertEqual(expected_args[1], mocks[0].call_args.args[1])
+        self.assertEqual('file1.txt', mocks[0].call_args.args[1])
         self.assertDictEqual(expected_kwargs, mocks[0].call_args.kwargs)
+        self.assertEqual(
+            [('Kalimat satu.', self.multiple_sentence_conllu[0]),
+             ('Kalimat dua.', self.multiple_sentence_conllu[1])],
+            WRITTEN_SENTENCES
+        )
+
+    def test_invalid_model_raises_before_parsing(self, *mocks: Mock):
+        with self.assertRaises(ValueError):
+            self.dependency_parser.parse_to_file('sebuah kalimat', 'file1.txt',
+                                                 model='unknown')
+
+        self.assertEqual(0, mocks[1].call_count)
+        self.assertEqual(0, mocks[0].call_count)
+
+
+@patch(target=ONE_SENTENCE_MODULE_NAME)
+class DependencyParserStreamingOutputFileTest(TestCase):
+    """class to test that aksara.dependency_parser.parse_to_file writes in a single pass"""
+
+    def setUp(self) -> None:
+        self.dependency_parser = DependencyParser()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.temp_dir.name, 'input.txt')
+        self.output_path = os.path.join(self.temp_dir.name, 'output.conllu')
+        self.expected_path = os.path.join(self.temp_dir.name, 'expected.conllu')
+
+        with open(self.input_path, 'w', encoding='utf-8') as input_file:
+            input_file.write('Andi pergi.\nBudi tidur.\n')
+
+        self.parsed = {
+            'Andi pergi.': [
+                ConlluData('1', 'Andi', 'Andi', 'PROPN', '_', '_', '2', 'nsubj'),
+                ConlluData('2', 'pergi', 'pergi', 'VERB', '_', '_', '0', 'root'),
+                ConlluData('3', '.', '.', 'PUNCT', '_', '_', '2', 'punct'),
+            ],
+            'Budi tidur.': [
+                ConlluData('1', 'Budi', 'Budi', 'PROPN', '_', '_', '2', 'nsubj'),
+                ConlluData('2', 'tidur', 'tidur', 'VERB', '_', '_', '0', 'root'),
+                ConlluData('3', '.', '.', 'PUNCT', '_', '_', '2', 'punct'),
+            ],
+        }
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        return super().tearDown()
+
+    def test_output_same_as_write_conllu(self, mock_parse: Mock):
+        mock_parse.side_effect = lambda sentence, *_: self.parsed[sentence]
+
+        written_path = self.dependency_parser.parse_to_file(
+            self.input_path, self.output_path, input_mode='f', write_mode='w'
+        )
+
+        write_conllu(list(self.parsed), list(self.parsed.values()),
+                     self.expected_path, write_mode='w')
+
+        self.assertEqual(os.path.realpath(self.output_path), written_path)
+        with open(self.output_path, encoding='utf-8') as output_file, \
+                open(self.expected_path, encoding='utf-8') as expected_file:
+            self.assertEqual(expected_file.read(), output_file.read())
+
+    def test_completed_sentences_kept_on_failure(self, mock_parse: Mock):
+        mock_parse.side_effect = [self.parsed['Andi pergi.'], RuntimeError]
+
+        with self.assertRaises(RuntimeError):
+            self.dependency_parser.parse_to_file(
+                self.input_path, self.output_path, input_mode='f', write_mode='w'
+            )
+
+        write_conllu(['Andi pergi.'], [self.parsed['Andi pergi.']],
+                     self.expected_path, write_mode='w')
+
+        with open(self.output_path, encoding='utf-8') as output_file, \
+                open(self.expected_path, encoding='utf-8') as expected_file:
+            self.assertEqual(expected_file.read(), output_file.read())
+
+    def test_resume_after_failure(self, mock_parse: Mock):
+        mock_parse.side_effect = [self.parsed['Andi pergi.'], RuntimeError]
+        with self.assertRaises(RuntimeError):
+            self.dependency_parser.parse_to_file(
+                self.input_path, self.output_path, input_mode='f', write_mode='w'
+            )
+
+        mock_parse.reset_mock()
+        mock_parse.side_effect = lambda sentence, *_: self.parsed[sentence]
+        self.dependency_parser.parse_to_file(
+            self.input_path, self.output_path, input_mode='f', resume=True
+        )
+
+        write_conllu(list(self.parsed), list(self.parsed.values()),
+                     self.expected_path, write_mode='w')
+
+        with open(self.output_path, encoding='utf-8') as output_file, \
+                open(self.expected_path, encoding='utf-8') as expected_file:
+            self.assertEqual(expected_file.read(), output_file.read())
+        # the last block of the partial file may be cut, it is written again
+        self.assertEqual(['Andi pergi.', 'Budi tidur.'],
+                         [call.args[0] for call in mock_parse.call_args_list])
+
+    def test_invalid_write_mode_creates_no_file(self, mock_parse: Mock):
+        with self.assertRaises(ValueError):
+            self.dependency_parser.parse_to_file(
+                self.input_path, self.output_path, input_mode='f', write_mode='r'
+            )
+
+        self.assertFalse(os.path.exists(self.output_path))
+        self.assertEqual(0, mock_parse.call_count)
@@ -0,0 +1,99 @@
+import unittest
+import os
+import tempfile
+
+from aksara._nlp_internal.disambiguation.hmmlearn import HMMLearn
+from aksara._nlp_internal.disambiguation.hmmtrain import HMMTrain, train_hmm
+
+
+class HMMTrainTest(unittest.TestCase):
+    """Test streaming HMM training in aksara._nlp_internal.disambiguation.hmmtrain"""
+
+    def setUp(self) -> None:
+        dir_path = os.path.join(os.path.dirname(__file__), 'sample_input')
+        self.word_tag_path = os.path.join(dir_path, 'word_tag.txt')
+        self.conllu_path = os.path.join(dir_path, 'conllu.conllu')
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.model_path = os.path.join(self.temp_dir.name, 'hmm.pkl')
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        return super().tearDown()
+
+    def test_conllu_and_word_tag_give_same_counts(self):
+        word_tag = HMMTrain(trigram=True).update_from_file(self.word_tag_path)
+        conllu = HMMTrain(trigram=True).update_from_file(self.conllu_path)
+
+        self.assertEqual(9, word_tag.N)
+        self.assertEqual(word_tag.word_tag_counts, conllu.word_tag_counts)
+        self.assertEqual(word_tag.transition_counts, conllu.transition_counts)
+
+    def test_trigram_counts(self):
+        trainer = HMMTrain(trigram=True).update_from_file(self.conllu_path)
+
+        self.assertEqual(1, trainer.transition_counts[('END', 'START')]['PRON'])
+        self.assertEqual(1, trainer.transition_counts[('START', 'PROPN')]['VERB'])
+        self.assertEqual(1, trainer.transition_counts[('PUNCT', 'END')]['START'])
+
+    def test_merge_equals_serial_training(self):
+        for trigram in [False, True]:
+            serial = HMMTrain(trigram=trigram)
+            serial.update_from_file(self.conllu_path)
+            serial.update_from_file(self.word_tag_path)
+
+            merged = HMMTrain(trigram=trigram).update_from_file(self.conllu_path)
+            merged.merge(HMMTrain(trigram=trigram).update_from_file(self.word_tag_path))
+
+            self.assertEqual(serial.N, merged.N)
+            self.assertEqual(serial.word_tag_counts, merged.word_tag_counts)
+            self.assertEqual(serial.transition_counts, merged.transition_counts)
+
+    def test_merge_bigram_with_trigram(self):
+        with self.assertRaises(ValueError):
+            HMMTrain(trigram=True).merge(HMMTrain(trigram=False))
+
+    def test_unknown_file_format(self):
+        with self.assertRaises(ValueError):
+            HMMTrain().update_from_file(self.conllu_path, file_format='csv')
+
+    def test_incremental_update(self):
+        base_path = os.path.join(self.temp_dir.name, 'base.pkl')
+        train_hmm(self.conllu_path, base_path)
+        train_hmm(self.conllu_path, self.model_path, base_model=base_path)
+
+        expected = HMMTrain(trigram=True)
+        expected.update_from_file(self.conllu_path)
+        expected.update_from_file(self.conllu_path)
+
+        updated = HMMTrain.load(self.model_path)
+        self.assertEqual(expected.N, updated.N)
+        self.assertEqual(expected.word_tag_counts, updated.word_tag_counts)
+        self.assertEqual(expected.transition_counts, updated.transition_counts)
+
+    def test_parallel_shards(self):
+        train_hmm([self.conllu_path, self.word_tag_path], self.model_path, n_jobs=2)
+
+        expected = HMMTrain(trigram=True)
+        expected.update_from_file(self.conllu_path)
+        expected.update_from_file(self.word_tag_path)
+
+        self.assertEqual(expected.transition_counts,
+                         HMMTrain.load(self.model_path).transition_counts)
+
+    def test_hmmlearn_from_model_file(self):
+        train_hmm(self.conllu_path, self.model_path)
+        from_file = HMMLearn(train_file=self.word_tag_path, trigram=True)
+        from_model = HMMLearn(model_file=self.model_path)
+
+        self.assertTrue(from_model.trigram)
+        self.assertEqual(from_file.N, from_model.N)
+        self.assertEqual(
+            from_file.get_emission_prob('pasar', 'NOUN'),
+            from_model.get_emission_prob('pasar', 'NOUN')
+        )
+        self.assertEqual(
+            from_file.get_transition_prob('VERB', ('START', 'PROPN')),
+            from_model.get_transition_prob('VERB', ('START', 'PROPN'))
+        )
@@ -0,0 +1,115 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import aksara._nlp_internal.core as core
+from aksara.utils.parallel import (
+    _check_n_jobs, _map_analyzed_sentences, _map_sentences, _parallel_map
+)
+
+
+class SentenceWorker:
+    """stands in for the public classes, built once in every worker process"""
+
+    def __init__(self, cache=None):
+        self.cache = cache
+
+    def _analysis_kwargs(self, suffix):
+        return {'analyzer': 'analyzer', 'dependency_parser': None, 'cache': self.cache,
+                'v1': False, 'lemma': False, 'postag': suffix == '.', 'informal': False}
+
+    def _process_one_sentence(self, sentence, suffix):
+        if sentence == 'error':
+            raise ValueError(sentence)
+        return sentence.upper() + suffix, os.getpid()
+
+
+def _get_pid_worker():
+    return lambda _: os.getpid()
+
+
+class ParallelTest(unittest.TestCase):
+    """Test aksara.utils.parallel"""
+
+    def setUp(self) -> None:
+        self.sentences = [f'kalimat {i}' for i in range(50)]
+        self.expected = [sentence.upper() + '.' for sentence in self.sentences]
+        return super().setUp()
+
+    def test_check_n_jobs(self):
+        self.assertEqual(3, _check_n_jobs(3))
+        self.assertEqual(os.cpu_count(), _check_n_jobs(-1))
+
+        for n_jobs in [0, -2, 1.5, True, '2']:
+            with self.assertRaises(ValueError):
+                _check_n_jobs(n_jobs)
+
+    def test_stage_workers_needs_single_process(self):
+        self.assertEqual(1, _check_n_jobs(1, (1, 1, 1)))
+
+        with self.assertRaises(ValueError):
+            _check_n_jobs(2, (1, 1, 1))
+
+    def test_invalid_n_jobs_raises_before_iteration(self):
+        with self.assertRaises(ValueError):
+            _map_sentences(SentenceWorker(), '_process_one_sentence', iter([]), n_jobs=0)
+
+    def test_serial_uses_given_instance(self):
+        result = list(_map_sentences(SentenceWorker(), '_process_one_sentence',
+                                     self.sentences, ('.',)))
+
+        self.assertEqual(self.expected, [sentence for sentence, _ in result])
+        self.assertEqual({os.getpid()}, {pid for _, pid in result})
+
+    def test_parallel_keeps_order(self):
+        result = list(_map_sentences(SentenceWorker(), '_process_one_sentence',
+                                     iter(self.sentences), ('.',), n_jobs=2, chunk_size=3))
+
+        self.assertEqual(self.expected, [sentence for sentence, _ in result])
+        self.assertNotIn(os.getpid(), {pid for _, pid in result})
+
+    def test_parallel_is_lazy(self):
+        pulled = []
+
+        def sentences():
+            for sentence in self.sentences:
+                pulled.append(sentence)
+                yield sentence
+
+        result = _parallel_map(_get_pid_worker, sentences(), n_jobs=2, chunk_size=2)
+        next(result)
+        result.close()
+
+        # at most two chunks per worker in flight
+        self.assertLessEqual(len(pulled), 2 * 2 * 2)
+
+    def test_worker_error_is_raised(self):
+        with self.assertRaises(ValueError):
+            list(_map_sentences(SentenceWorker(), '_process_one_sentence',
+                                ['satu', 'error', 'dua'], ('.',), n_jobs=2, chunk_size=1))
+
+    def test_analyzed_sentences_without_stage_workers_use_method(self):
+        result = list(_map_analyzed_sentences(SentenceWorker(), '_process_one_sentence', list,
+                                              self.sentences, ('.',)))
+
+        self.assertEqual(self.expected, [sentence for sentence, _ in result])
+
+    def test_analyzed_sentences_with_stage_workers_use_analysis_kwargs(self):
+        with patch(target=core.__name__ + '.analyze_sentences',
+                   side_effect=lambda texts, **_: (text.split() for text in texts)) as mock:
+            result = list(_map_analyzed_sentences(
+                SentenceWorker(), '_process_one_sentence', len, iter(self.sentences), ('.',),
+                stage_workers=(1, 1, 1)
+            ))
+
+        self.assertEqual([2] * 50, result)
+        self.assertEqual(
+            {'stage_workers': (1, 1, 1), 'analyzer': 'analyzer', 'dependency_parser': None,
+             'cache': None, 'v1': False, 'lemma': False, 'postag': True, 'informal': False},
+            mock.call_args.kwargs
+        )
+
+    def test_stage_workers_with_n_jobs_raise(self):
+        with self.assertRaises(ValueError):
+            _map_analyzed_sentences(SentenceWorker(), '_process_one_sentence', list,
+                                    iter([]), ('.',), n_jobs=2, stage_workers=(1, 1, 1))
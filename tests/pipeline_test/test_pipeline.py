@@ -0,0 +1,151 @@
+import random
+import threading
+import time
+import unittest
+from unittest.mock import patch, Mock
+
+import aksara._nlp_internal.core as core
+from aksara._nlp_internal.pipeline import check_stage_workers, pipeline_map
+
+
+def _sleepy(function):
+    def wrapper(item):
+        time.sleep(random.uniform(0, 0.005))
+        return function(item)
+    return wrapper
+
+
+class FakeAnalyzer:
+    """stands in for BaseAnalyzer, every token is a noun"""
+
+    def analyze(self, word, *_):
+        return word.lower() + "+NOUN"
+
+
+class FakeDependencyParser:
+    """stands in for the neural parser, attaches every token to the root"""
+
+    def parse_rows(self, rows):
+        time.sleep(0.001)
+        for row in rows:
+            if row.is_word():
+                row.head = "0"
+                row.deprel = "root"
+        return rows
+
+
+class PipelineTest(unittest.TestCase):
+    """Test aksara._nlp_internal.pipeline"""
+
+    def setUp(self) -> None:
+        self.baseline_threads = threading.active_count()
+        return super().setUp()
+
+    def assert_threads_stopped(self):
+        deadline = time.monotonic() + 5
+        while threading.active_count() > self.baseline_threads and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.baseline_threads, threading.active_count())
+
+    def test_check_stage_workers(self):
+        self.assertEqual((4, 1, 2), check_stage_workers([4, 1, 2]))
+
+        for stage_workers in [(1, 1), (1, 1, 1, 1), (0, 1, 1), (1, -1, 1), (1, 1.5, 1), (True, 1, 1)]:
+            with self.assertRaises(ValueError):
+                check_stage_workers(stage_workers)
+
+    def test_keeps_input_order(self):
+        stages = [(_sleepy(lambda x: x + 1), 4), (_sleepy(lambda x: x * 2), 1), (_sleepy(str), 3)]
+
+        self.assertEqual(
+            [str((i + 1) * 2) for i in range(200)],
+            list(pipeline_map(range(200), stages))
+        )
+        self.assert_threads_stopped()
+
+    def test_stages_run_concurrently(self):
+        running = set()
+        overlapped = threading.Event()
+        lock = threading.Lock()
+
+        def stage(name):
+            def run(item):
+                with lock:
+                    running.add(name)
+                    if len(running) > 1:
+                        overlapped.set()
+                time.sleep(0.002)
+                with lock:
+                    running.discard(name)
+                return item
+            return run
+
+        stages = [(stage('analysis'), 1), (stage('disambiguation'), 1), (stage('parsing'), 1)]
+        list(pipeline_map(range(50), stages))
+
+        self.assertTrue(overlapped.is_set())
+
+    def test_input_is_bounded(self):
+        pulled = []
+
+        def items():
+            for i in range(1000):
+                pulled.append(i)
+                yield i
+
+        result = pipeline_map(items(), [(lambda x: x, 2)], max_in_flight=8)
+        next(result)
+        time.sleep(0.1)
+
+        self.assertLessEqual(len(pulled), 8 + 1 + 1)
+        result.close()
+        self.assert_threads_stopped()
+
+    def test_stage_error_raised_in_order(self):
+        def fail_on_three(item):
+            if item == 3:
+                raise ValueError(item)
+            return item
+
+        result = pipeline_map(range(10), [(fail_on_three, 2), (lambda x: x, 1)])
+
+        self.assertEqual([0, 1, 2], [next(result) for _ in range(3)])
+        with self.assertRaises(ValueError):
+            next(result)
+        self.assert_threads_stopped()
+
+    def test_input_error_raised_in_order(self):
+        def items():
+            yield 'a'
+            raise OSError('read error')
+
+        result = pipeline_map(items(), [(str.upper, 1)])
+
+        self.assertEqual('A', next(result))
+        with self.assertRaises(OSError):
+            next(result)
+
+    @patch(target=core.__name__ + '.get_disambiguator')
+    def test_analyze_sentences_same_as_serial(self, mock: Mock):
+        mock.return_value.disambiguate.side_effect = lambda rows: rows
+        sentences = [f'Kalimat nomor {i} , ditulis Andi .' for i in range(30)]
+        flags = {'v1': False, 'lemma': False, 'postag': False, 'informal': False}
+
+        serial = list(core.analyze_sentences(
+            sentences, FakeAnalyzer(), FakeDependencyParser(), **flags
+        ))
+        pipelined = list(core.analyze_sentences(
+            sentences, FakeAnalyzer(), FakeDependencyParser(), (3, 1, 2), **flags
+        ))
+
+        self.assertEqual(
+            [core.analyze_sentence(s, FakeAnalyzer(), FakeDependencyParser(), **flags)
+             for s in sentences],
+            [core.format_tokens(tokens, **flags) for tokens in serial]
+        )
+        self.assertEqual(serial, pipelined)
+
+    def test_analyze_sentences_invalid_stage_workers(self):
+        with self.assertRaises(ValueError):
+            core.analyze_sentences([], FakeAnalyzer(), FakeDependencyParser(), (1, 0, 1),
+                                   v1=False, lemma=False, postag=False, informal=False)
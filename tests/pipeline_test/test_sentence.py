@@ -0,0 +1,41 @@
+import unittest
+
+from aksara._nlp_internal.formatter import (
+    to_conllu_line, to_conllu_line_with_range, to_range_token, to_token
+)
+from aksara._nlp_internal.sentence import Token, to_conllu_lines
+
+
+class TokenTest(unittest.TestCase):
+    """Test the Token passed between the analysis stages"""
+
+    def test_to_token_same_as_conllu_line(self):
+        analysis = "makan+VERB+Voice=Act\\nmakan+NOUN+Number=Sing"
+
+        token = to_token(2, "makan", analysis, space_after=True)
+
+        self.assertEqual(
+            to_conllu_line(2, "makan", analysis, space_after=True), token.to_conllu_line()
+        )
+        self.assertEqual("VERB/NOUN", token.upos)
+        self.assertEqual("_", token.head)
+
+    def test_range_token(self):
+        token = to_range_token(3, "bukunya", 2)
+
+        self.assertEqual(to_conllu_line_with_range(3, "bukunya", 2), token.to_conllu_line())
+        self.assertFalse(token.is_word())
+        self.assertTrue(to_token(3, "buku", "buku+NOUN").is_word())
+
+    def test_fields_round_trip(self):
+        fields = ["1", "Saya", "saya", "PRON", "_", "Person=1", "2", "nsubj", "_", "_"]
+        token = Token.from_fields(fields)
+
+        self.assertEqual(fields, token.fields())
+        self.assertEqual(token, Token.from_fields(list(fields)))
+        self.assertEqual("\t".join(fields) + "\n" + "\t".join(fields),
+                         to_conllu_lines([token, token]))
+
+    def test_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            Token("1", "Saya").extra = None
@@ -0,0 +1,43 @@
+import unittest
+import os
+
+from aksara.pos_tagger import POSTagger
+
+
+class PosTagIterTest(unittest.TestCase):
+    """Test POSTagger.iter_tag"""
+
+    def setUp(self) -> None:
+        self.pos_tagger = POSTagger()
+        self.file_path = os.path.join(
+            os.path.dirname(__file__), "sample_input", "testinput_postag.txt"
+        )
+        return super().setUp()
+
+    def test_iter_tag_file_yields_same_result_as_tag(self):
+        result = self.pos_tagger.iter_tag(self.file_path, input_mode="f")
+
+        self.assertEqual(
+            [("Pengeluaran", "NOUN"), ("baru", "ADJ"), ("ini", "DET"),
+             ("dipasok", "VERB"), ("oleh", "ADP"), ("rekening", "NOUN"),
+             ("bank", "NOUN"), ("gemuk", "ADJ"), ("Clinton", "PROPN"), (".", "PUNCT")],
+            next(result)
+        )
+        self.assertEqual(
+            self.pos_tagger.tag(self.file_path, input_mode="f")[1:],
+            list(result)
+        )
+
+    def test_iter_tag_string(self):
+        self.assertEqual(
+            [[("Saya", "PRON"), ("makan", "VERB")]],
+            list(self.pos_tagger.iter_tag("Saya makan"))
+        )
+
+    def test_iter_tag_invalid_input_mode(self):
+        with self.assertRaises(ValueError):
+            self.pos_tagger.iter_tag("Saya makan", input_mode="x")
+
+    def test_iter_tag_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            self.pos_tagger.iter_tag("unknown_file.txt", input_mode="f")
@@ -0,0 +1,167 @@
+import asyncio
+import pickle
+import tempfile
+import unittest
+from unittest.mock import patch, Mock
+
+import aksara._nlp_internal.core as core
+from aksara._nlp_internal.batching import ParseBatcher
+from aksara._nlp_internal.sentence import Token
+from aksara.utils.sentence_cache import SentenceCache
+
+
+class CountingAnalyzer:
+    """stands in for BaseAnalyzer, counts the foma lookups"""
+
+    def __init__(self):
+        self.n_lookups = 0
+
+    def analyze(self, word, *_):
+        self.n_lookups += 1
+        return word.lower() + "+NOUN"
+
+    async def aanalyze(self, word, *relations):
+        return self.analyze(word, *relations)
+
+
+class FakeDependencyParser:
+    """stands in for the neural parser, attaches every token to the root"""
+
+    model_name = "FAKE"
+
+    def parse_rows(self, rows):
+        for row in rows:
+            if row.is_word():
+                row.head = "0"
+                row.deprel = "root"
+        return rows
+
+
+FLAGS = {'v1': False, 'lemma': False, 'postag': False, 'informal': False}
+
+
+def _tokens(*forms):
+    return [Token(str(i), form, form.lower(), "NOUN") for i, form in enumerate(forms, 1)]
+
+
+class SentenceCacheTest(unittest.TestCase):
+    """Test aksara.utils.sentence_cache"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        return super().tearDown()
+
+    def test_get_returns_new_tokens(self):
+        cache = SentenceCache()
+        key = cache.key('Saya makan', 'FAKE', False, False)
+        self.assertIsNone(cache.get(key))
+
+        tokens = _tokens('Saya', 'makan')
+        cache.put(key, tokens)
+        cached = cache.get(key)
+
+        self.assertEqual(tokens, cached)
+        cached[0].head = '2'
+        self.assertEqual(tokens, cache.get(key))
+        self.assertEqual((2, 1, 0, 100000, 1), tuple(cache.cache_info()))
+
+    def test_key_depends_on_options(self):
+        keys = {
+            SentenceCache.key('Saya makan', 'FAKE', False, False),
+            SentenceCache.key('Saya makan', 'FAKE', True, False),
+            SentenceCache.key('Saya makan', 'FAKE', False, True),
+            SentenceCache.key('Saya makan', 'OTHER', False, False),
+            SentenceCache.key('Saya  makan', 'FAKE', False, False),
+        }
+        self.assertEqual(5, len(keys))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = SentenceCache(max_size=2)
+        for text in ['a', 'b']:
+            cache.put(text, _tokens(text))
+        cache.get('a')
+        cache.put('c', _tokens('c'))
+
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(2, cache.cache_info().currsize)
+
+    def test_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            SentenceCache(max_size=-1)
+
+    def test_persistent_store(self):
+        cache = SentenceCache(directory=self.temp_dir.name)
+        cache.put('key', _tokens('Halo'))
+        cache.close()
+
+        reopened = SentenceCache(max_size=0, directory=self.temp_dir.name)
+        self.assertEqual(_tokens('Halo'), reopened.get('key'))
+        self.assertEqual(1, reopened.cache_info().disk_hits)
+        self.assertEqual(0, reopened.cache_info().currsize)
+
+        reopened.clear()
+        self.assertIsNone(reopened.get('key'))
+        reopened.close()
+
+    def test_pickle_keeps_settings_only(self):
+        cache = SentenceCache(10, self.temp_dir.name)
+        cache.put('key', _tokens('Halo'))
+
+        copy = pickle.loads(pickle.dumps(cache))
+        self.assertEqual((10, self.temp_dir.name), (copy.max_size, copy.directory))
+        self.assertEqual(_tokens('Halo'), copy.get('key'))
+        self.assertEqual(1, copy.cache_info().disk_hits)
+        cache.close()
+        copy.close()
+
+    @patch(target=core.__name__ + '.get_disambiguator')
+    def test_duplicates_are_analyzed_once(self, mock: Mock):
+        mock.return_value.disambiguate.side_effect = lambda rows: rows
+        sentences = ['Saya makan .', 'Dia tidur .', 'Saya makan .'] * 10
+
+        analyzer = CountingAnalyzer()
+        uncached = list(core.analyze_sentences(
+            sentences, analyzer, FakeDependencyParser(), **FLAGS
+        ))
+        n_uncached = analyzer.n_lookups
+
+        for stage_workers in [None, (2, 1, 2)]:
+            with self.subTest(stage_workers=stage_workers):
+                analyzer = CountingAnalyzer()
+                cache = SentenceCache()
+                cached = list(core.analyze_sentences(
+                    sentences, analyzer, FakeDependencyParser(), stage_workers, cache, **FLAGS
+                ))
+
+                self.assertEqual(uncached, cached)
+                self.assertEqual(6, analyzer.n_lookups)
+                self.assertLess(analyzer.n_lookups, n_uncached)
+                self.assertEqual(2, cache.cache_info().misses)
+
+    @patch(target=core.__name__ + '.get_disambiguator')
+    def test_async_uses_cache(self, mock: Mock):
+        mock.return_value.disambiguate.side_effect = lambda rows: rows
+        analyzer = CountingAnalyzer()
+        cache = SentenceCache()
+
+        async def analyze():
+            return await core.aanalyze_sentences(
+                ['Saya makan .'] * 3, analyzer, FakeDependencyParser(), ParseBatcher(),
+                max_concurrency=1, cache=cache, **FLAGS
+            )
+
+        results = asyncio.run(analyze())
+
+        self.assertEqual(results[0], results[2])
+        self.assertIsNot(results[0][0], results[2][0])
+        self.assertEqual(3, analyzer.n_lookups)
+        self.assertEqual((0, 1), cache.cache_info()[:2])
+
+        self.assertEqual(results, asyncio.run(analyze()))
+        self.assertEqual(3, analyzer.n_lookups)
+        self.assertEqual((1, 1), cache.cache_info()[:2])
@@ -1,5 +1,8 @@
-import unittest
+import bz2
+import gzip
 import os
+import tempfile
+import unittest
 
 from aksara.utils.sentence_util import _get_sentence_list
 
@@ -21,3 +24,28 @@ class TestGetSentenceList(unittest.TestCase):
         )
 
         self.assertEqual([], _get_sentence_list(file_path, input_mode='f'))
+
+    def test_input_is_compressed_file(self):
+        file_path = os.path.join(
+            os.path.dirname(__file__),
+            'sample_input',
+            'sentences.txt'
+        )
+        expected = _get_sentence_list(file_path, input_mode='f')
+
+        with open(file_path, 'rb') as file:
+            content = file.read()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gzip_path = os.path.join(temp_dir, 'sentences.txt.gz')
+            with gzip.open(gzip_path, 'wb') as file:
+                file.write(content)
+
+            bz2_path = os.path.join(temp_dir, 'sentences.data')
+            with bz2.open(bz2_path, 'wb') as file:
+                file.write(content)
+
+            self.assertEqual(expected, _get_sentence_list(gzip_path, input_mode='f'))
+            self.assertEqual(
+                expected, _get_sentence_list(bz2_path, input_mode='f', compression='bz2')
+            )
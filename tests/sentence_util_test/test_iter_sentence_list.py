@@ -0,0 +1,47 @@
+import unittest
+import os
+from types import GeneratorType
+
+from aksara.utils.sentence_util import _iter_sentence_list, _sentences_from_file
+
+class TestIterSentenceList(unittest.TestCase):
+    """Test _iter_sentence_list function"""
+
+    def setUp(self) -> None:
+        dir_path = os.path.join(
+            os.path.dirname(__file__),
+            'sample_input'
+        )
+
+        self.empty_path = os.path.join(dir_path, 'empty.txt')
+        self.sentences_path = os.path.join(dir_path, 'sentences.txt')
+        return super().setUp()
+
+    def test_unknown_input_mode(self):
+        with self.assertRaises(ValueError):
+            _iter_sentence_list('abc', input_mode='unknown')
+
+    def test_unknown_file_fails_before_iteration(self):
+        with self.assertRaises(FileNotFoundError):
+            _iter_sentence_list('Unknown_file.txt', input_mode='f')
+
+    def test_input_is_str(self):
+        self.assertEqual(['abc.', 'def'], list(_iter_sentence_list('abc. def')))
+
+    def test_input_is_empty_file(self):
+        self.assertEqual([], list(_iter_sentence_list(self.empty_path, input_mode='f')))
+
+    def test_file_is_read_lazily(self):
+        sentences = _iter_sentence_list(self.sentences_path, input_mode='f')
+
+        self.assertIsInstance(sentences, GeneratorType)
+        self.assertEqual(
+            'Pengeluaran baru ini dipasok oleh rekening bank gemuk Clinton.',
+            next(sentences)
+        )
+
+    def test_same_sentences_as_list_version(self):
+        self.assertEqual(
+            _sentences_from_file(self.sentences_path),
+            list(_iter_sentence_list(self.sentences_path, input_mode='f'))
+        )
@@ -1,6 +1,11 @@
-import unittest
+import gzip
 import os
+import shutil
+import stat
+import tempfile
+import unittest
 
+from aksara._nlp_internal.core import get_num_lines
 from aksara.utils.sentence_util import _sentences_from_file
 
 class TestSentenceFromFile(unittest.TestCase):
@@ -38,3 +43,47 @@ class TestSentenceFromFile(unittest.TestCase):
     def test_unknown_file(self):
         with self.assertRaises(FileNotFoundError):
             _sentences_from_file('Unknown_file.txt')
+
+    def test_progress_callback(self):
+        reports = []
+        sentences = _sentences_from_file(
+            self.sentences_path, progress=lambda done, total: reports.append((done, total))
+        )
+
+        file_size = os.path.getsize(self.sentences_path)
+        self.assertEqual(self.expected_sentences, sentences)
+        self.assertEqual((file_size, file_size), reports[-1])
+
+    def test_progress_of_compressed_file(self):
+        reports = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gzip_path = os.path.join(temp_dir, 'sentences.txt.gz')
+            with open(self.sentences_path, 'rb') as infile, gzip.open(gzip_path, 'wb') as outfile:
+                shutil.copyfileobj(infile, outfile)
+
+            sentences = _sentences_from_file(
+                gzip_path, progress=lambda done, total: reports.append((done, total))
+            )
+            file_size = os.path.getsize(gzip_path)
+
+        self.assertEqual(self.expected_sentences, sentences)
+        self.assertEqual((file_size, file_size), reports[-1])
+
+    def test_progress_hidden(self):
+        self.assertEqual(
+            self.expected_sentences,
+            _sentences_from_file(self.sentences_path, progress=False)
+        )
+
+    def test_invalid_progress(self):
+        with self.assertRaises(ValueError):
+            _sentences_from_file(self.sentences_path, progress='bar')
+
+    def test_read_only_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            read_only_path = os.path.join(temp_dir, 'sentences.txt')
+            shutil.copyfile(self.sentences_path, read_only_path)
+            os.chmod(read_only_path, stat.S_IRUSR)
+
+            self.assertEqual(self.expected_sentences, _sentences_from_file(read_only_path))
+            self.assertEqual(2, get_num_lines(read_only_path))
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import aksara.utils.sentence_util as sentence_util
+from aksara.utils.sentence_util import (
+    _SentenceSegmenter, _iter_sentence_list, _sentences_from_file, _split_chunks, _split_sentence
+)
+
+
+class TestSentenceSegmenter(unittest.TestCase):
+    """Test _SentenceSegmenter and the file readers that use it"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        return super().tearDown()
+
+    def write(self, text):
+        file_path = os.path.join(self.temp_dir.name, 'input.txt')
+        with open(file_path, 'w', encoding='utf-8') as outfile:
+            outfile.write(text)
+        return file_path
+
+    def test_same_sentences_as_split_sentence(self):
+        text = 'kalimat 1. kalimat 2? kalimat3!  kalimat4...   kalimat 5'
+
+        for size in range(1, len(text) + 1):
+            with self.subTest(size=size):
+                chunks = [text[i:i + size] for i in range(0, len(text), size)]
+                self.assertEqual(_split_sentence(text), list(_split_chunks(chunks)))
+
+    def test_feed_returns_closed_sentences_only(self):
+        segmenter = _SentenceSegmenter()
+
+        self.assertEqual([], segmenter.feed('Saya makan'))
+        self.assertEqual([], segmenter.feed(' nasi.'))
+        self.assertEqual(['Saya makan nasi.'], segmenter.feed(' Dia'))
+        self.assertEqual(['Dia tidur.'], segmenter.feed(' tidur.') + segmenter.close())
+        self.assertEqual([], segmenter.close())
+
+    def test_line_ends_sentence(self):
+        file_path = self.write('Saya makan\nDia tidur\nKucing itu lucu.\n')
+        expected = ['Saya makan', 'Dia tidur', 'Kucing itu lucu.']
+
+        self.assertEqual(expected, _sentences_from_file(file_path, progress=False))
+        self.assertEqual(expected, list(_iter_sentence_list(file_path, 'f')))
+        self.assertEqual(expected, _sentences_from_file(file_path, sep_regex=r'(;\s*)',
+                                                        progress=False))
+        self.assertEqual(['Saya makan', 'Dia', 'tidur'],
+                         list(_split_chunks(['Saya ma', 'kan\n', 'Dia\n\n', ' tidur'])))
+
+    def test_sentence_wrapped_over_lines_is_joined(self):
+        self.assertEqual(
+            ['Uang yang hilang pada tahun itu sangat banyak.', 'Namun, tidak semua.'],
+            list(_split_chunks(['Uang yang hilang\n  pada tahun itu\nsangat ', 'banyak.\nNamun,',
+                                ' tidak semua.\n'], join_lines=True))
+        )
+
+    def test_blank_line_ends_joined_sentence(self):
+        self.assertEqual(
+            ['Judul tanpa titik', 'Kalimat pertama.'],
+            list(_split_chunks(['Judul tanpa titik\n', ' \n\nKalimat pertama.'],
+                               join_lines=True))
+        )
+
+    def test_long_unfinished_sentence(self):
+        text = 'kata ' * 5000 + 'akhir. berikutnya'
+        chunks = [text[i:i + 100] for i in range(0, len(text), 100)]
+
+        self.assertEqual(_split_sentence(text), list(_split_chunks(chunks)))
+
+    def test_custom_sep_regex(self):
+        self.assertEqual(
+            ['a;', 'b;', 'c'],
+            list(_split_chunks(['a; b', ';', ' c'], sep_regex=r'(;\s*)'))
+        )
+
+    def test_file_without_line_breaks_is_read_in_chunks(self):
+        file_path = self.write('Saya makan. ' * 50 + 'Dia tidur.')
+
+        with patch.object(sentence_util, '_READ_CHUNK_SIZE', 7):
+            self.assertEqual(['Saya makan.'] * 50 + ['Dia tidur.'],
+                             _sentences_from_file(file_path, progress=False))
+            self.assertEqual(['Saya makan.'] * 50 + ['Dia tidur.'],
+                             list(_iter_sentence_list(file_path, 'f')))
+
+
+if __name__ == '__main__':
+    unittest.main()
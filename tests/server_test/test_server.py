@@ -0,0 +1,152 @@
+import asyncio
+import json
+import threading
+import unittest
+from unittest.mock import patch, Mock
+
+import aksara._nlp_internal.core as core
+import aksara._nlp_internal.server as server
+from aksara._nlp_internal.client import AksaraClient, ServerError, parse_address
+
+
+class FakeAnalyzer:
+    """stands in for BaseAnalyzer, every token is a noun"""
+
+    def analyze(self, word, *_):
+        return word.lower() + "+NOUN"
+
+    async def aanalyze(self, word, *context):
+        return self.analyze(word, *context)
+
+
+class FakeDependencyParser:
+    """stands in for the neural parser, attaches every token to the root"""
+
+    def parse_rows(self, rows):
+        for row in rows:
+            if row.is_word():
+                row.head = "0"
+                row.deprel = "root"
+        return rows
+
+
+FLAGS = {'v1': False, 'lemma': False, 'postag': False, 'informal': False}
+
+
+class ServerTest(unittest.IsolatedAsyncioTestCase):
+    """Test aksara._nlp_internal.server and its client"""
+
+    def setUp(self) -> None:
+        patches = [
+            patch(target=server.__name__ + '.get_text_normalizer'),
+            patch(target=server.__name__ + '.load_dependency_parser',
+                  side_effect=lambda model: FakeDependencyParser()),
+            patch(target=core.__name__ + '.get_disambiguator'),
+        ]
+        for started in patches:
+            mock = started.start()
+            self.addCleanup(started.stop)
+        mock.return_value.disambiguate.side_effect = lambda rows: rows
+
+        self.server = server.AksaraServer('unused.bin', batch_max_wait=0.001)
+        self.server.analyzer = FakeAnalyzer()
+        self.server.warm_up()
+        return super().setUp()
+
+    def test_parse_address(self):
+        self.assertEqual(('localhost', 9000), parse_address('localhost:9000'))
+        self.assertEqual(('127.0.0.1', 9000), parse_address(':9000'))
+        self.assertEqual('/tmp/aksara.sock', parse_address('unix:/tmp/aksara.sock'))
+        with self.assertRaises(ValueError):
+            parse_address('localhost')
+
+    async def test_health(self):
+        response = await self.server.handle({'id': 7, 'op': 'health'})
+
+        self.assertEqual(
+            {'id': 7, 'ok': True, 'result': {'status': 'ok', 'models': ['FR_GSD-ID_CSUI']}},
+            response
+        )
+
+    async def test_unknown_op(self):
+        response = await self.server.handle({'id': 1, 'op': 'translate'})
+
+        self.assertFalse(response['ok'])
+        self.assertIn('translate', response['error'])
+
+    async def test_tag(self):
+        response = await self.server.handle({'op': 'tag', 'text': 'Andi makan. Budi minum.'})
+
+        self.assertEqual(
+            [[['1', 'Andi', 'NOUN'], ['2', 'makan', 'NOUN'], ['3', '.', 'NOUN']],
+             [['1', 'Budi', 'NOUN'], ['2', 'minum', 'NOUN'], ['3', '.', 'NOUN']]],
+            response['result']
+        )
+
+    async def test_tokenize(self):
+        response = await self.server.handle({'op': 'tokenize', 'text': 'Andi makan. Budi minum.'})
+
+        self.assertEqual([['Andi', 'makan', '.'], ['Budi', 'minum', '.']], response['result'])
+
+    async def test_stats(self):
+        await self.server.handle({'op': 'parse', 'text': 'Andi makan.'})
+        await self.server.handle({'op': 'parse', 'text': 42})
+
+        result = (await self.server.handle({'op': 'stats'}))['result']
+
+        self.assertEqual(2, result['ops']['parse']['requests'])
+        self.assertEqual(1, result['ops']['parse']['errors'])
+        self.assertEqual(1, result['parse_batches'])
+
+    async def test_request_too_large_closes_connection(self):
+        listener = await asyncio.start_server(self.server.serve_connection, '127.0.0.1', 0,
+                                              limit=64)
+        self.addAsyncCleanup(listener.wait_closed)
+        self.addCleanup(listener.close)
+
+        reader, writer = await asyncio.open_connection(*listener.sockets[0].getsockname()[:2])
+        writer.write(b'{"op": "health"}\n{"op": "tokenize", "text": "' + b'a' * 200 + b'"}\n')
+        await writer.drain()
+
+        self.assertTrue(json.loads(await reader.readline())['ok'])
+        self.assertEqual({'id': None, 'ok': False, 'error': 'request too large'},
+                         json.loads(await reader.readline()))
+        self.assertEqual(b'', await reader.read())
+        writer.close()
+
+    def test_client_same_as_cli(self):
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        address = []
+
+        def on_ready(bound_address):
+            address.append(bound_address)
+            ready.set()
+
+        serving = loop.create_task(server.run_server(self.server, port=0, ready=on_ready))
+
+        def serve():
+            try:
+                loop.run_until_complete(serving)
+            except asyncio.CancelledError:
+                loop.close()
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        self.assertTrue(ready.wait(5))
+
+        sentences = [f'Kalimat nomor {i} , ditulis Andi .' for i in range(10)]
+        try:
+            with AksaraClient(address[0], timeout=5) as client:
+                results = list(client.iter_analyze(sentences, chunk_size=3, **FLAGS))
+                with self.assertRaises(ServerError):
+                    client.request('translate', text='Andi makan.')
+        finally:
+            loop.call_soon_threadsafe(serving.cancel)
+            thread.join(5)
+
+        self.assertEqual(
+            [core.analyze_sentence(s, FakeAnalyzer(), FakeDependencyParser(), **FLAGS)
+             for s in sentences],
+            results
+        )
@@ -1,6 +1,6 @@
 import unittest
 
-from aksara.conllu import ConlluData
+from aksara.conllu import ConlluData, ParsedCorpus
 
 class ConlluTest(unittest.TestCase):
     """Test Conllu Data"""
@@ -87,3 +87,59 @@ class ConlluTest(unittest.TestCase):
         multi_word_conllu = ConlluData(idx='1-2', head_id='0')
 
         self.assertEqual(multi_word_conllu.get_id(), '1-2')
+
+
+class ParsedCorpusTest(unittest.TestCase):
+    """Test the columnar ParsedCorpus"""
+
+    def setUp(self) -> None:
+        self.sentences = [
+            [
+                ConlluData('1', 'Saya', 'saya', 'PRON', '_', 'Person=1', '2', 'nsubj'),
+                ConlluData('2', 'makan', 'makan', 'VERB', '_', '_', '0', 'root'),
+            ],
+            [],
+            [
+                ConlluData('1-2', 'Makannya'),
+                ConlluData('1', 'Makan', 'makan', 'VERB', '_', '_', '0', 'root'),
+                ConlluData('2', 'nya', 'nya', 'PRON', '_', '_', '1', 'obj'),
+            ],
+        ]
+        self.corpus = ParsedCorpus(self.sentences)
+        return super().setUp()
+
+    def test_behaves_like_list_of_sentences(self):
+        self.assertEqual(3, len(self.corpus))
+        self.assertEqual(5, self.corpus.n_tokens)
+        self.assertEqual(self.sentences, list(self.corpus))
+        self.assertEqual(self.sentences[-1], self.corpus[-1])
+        self.assertEqual(self.sentences[1:], self.corpus[1:])
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            self.corpus[3]
+
+    def test_columns_share_vocabulary(self):
+        self.assertEqual(['saya', 'makan', '_', 'makan', 'nya'], self.corpus.column('lemma'))
+        self.assertEqual(['PRON', 'VERB', '_'], self.corpus.vocabulary('upos'))
+        self.assertEqual([0, 1, 2, 1, 0], list(self.corpus.codes('upos')))
+        self.assertEqual(range(2, 5), self.corpus.sentence_range(2))
+
+    def test_short_rows_get_default_columns(self):
+        corpus = ParsedCorpus()
+        corpus.append_rows([['1', 'Saya', 'saya', 'PRON', '_', '_', '2', 'nsubj'], ['2', 'makan']])
+
+        self.assertEqual(
+            [[ConlluData('1', 'Saya', 'saya', 'PRON', '_', '_', '2', 'nsubj'),
+              ConlluData('2', 'makan')]],
+            list(corpus)
+        )
+        self.assertEqual(2, corpus.n_tokens)
+
+    def test_unknown_column(self):
+        with self.assertRaises(ValueError):
+            self.corpus.column('misc')
+
+    def test_conllu_data_has_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            ConlluData('1').extra = None
@@ -0,0 +1,68 @@
+import unittest
+import subprocess
+import sys
+
+
+class ImportTimeTest(unittest.TestCase):
+    """Guard the lazy top-level exports of aksara against import-time regressions"""
+
+    parser_modules = ['torch', 'nltk', 'igraph', 'plotly', 'matplotlib', 'gdown']
+    heavy_modules = parser_modules + ['symspellpy', 'asyncio']
+
+    # generous bound: lazy `import aksara` takes a few milliseconds,
+    # the old eager import took several seconds
+    max_import_seconds = 1.0
+
+    def _run(self, code: str) -> str:
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True, check=True, text=True
+        )
+        return result.stdout.strip()
+
+    def test_import_aksara_loads_no_heavy_module(self):
+        loaded = self._run(
+            'import sys, aksara\n'
+            f'print(",".join(m for m in {self.heavy_modules!r} if m in sys.modules))'
+        )
+        self.assertEqual('', loaded)
+
+    def test_base_tokenizer_loads_no_heavy_module(self):
+        loaded = self._run(
+            'import sys\n'
+            'from aksara import BaseTokenizer\n'
+            'BaseTokenizer().tokenize("Biarlah saja seperti itu")\n'
+            f'print(",".join(m for m in {self.heavy_modules!r} if m in sys.modules))'
+        )
+        self.assertEqual('', loaded)
+
+    def test_multiword_tokenizer_loads_no_parser(self):
+        loaded = self._run(
+            'import sys\n'
+            'from aksara import MultiwordTokenizer\n'
+            'MultiwordTokenizer()\n'
+            f'print(",".join(m for m in {self.parser_modules!r} if m in sys.modules))'
+        )
+        self.assertEqual('', loaded)
+
+    def test_import_aksara_benchmark(self):
+        elapsed = self._run(
+            'import time\n'
+            'start = time.perf_counter()\n'
+            'import aksara\n'
+            'print(time.perf_counter() - start)'
+        )
+        self.assertLess(float(elapsed), self.max_import_seconds)
+
+    def test_exports_are_resolved_on_access(self):
+        exported = self._run(
+            'import aksara\n'
+            'print(aksara.ConlluData.__name__, aksara.read_conllu.__name__)'
+        )
+        self.assertEqual('ConlluData read_conllu', exported)
+
+    def test_unknown_attribute(self):
+        import aksara
+
+        with self.assertRaises(AttributeError):
+            getattr(aksara, 'UnknownExport')
@@ -50,6 +50,33 @@ class LemmatizationTest(unittest.TestCase):
 
         self.assertEqual(self.lemmatizer.lemmatize_batch(testcase, True), expected)
 
+    def test_pretokenized_lemmatization(self):
+        testcase = ["Pengeluaran", "airnya", "", "Pengeluaran", "gemuk"]
+        expected = [
+            ("Pengeluaran", "keluar"),
+            ("airnya", "_"),
+            ("air", "air"),
+            ("nya", "nya"),
+            ("Pengeluaran", "keluar"),
+            ("gemuk", "gemuk"),
+        ]
+
+        self.assertEqual(self.lemmatizer.lemmatize_batch(testcase, pretokenized=True), expected)
+
+    def test_pretokenized_lemmatization_informal(self):
+        testcase = ["udh", "ngajakin"]
+        expected = [("udh", "sudah"), ("ngajakin", "ajak")]
+
+        self.assertEqual(
+            self.lemmatizer.lemmatize_batch(testcase, True, pretokenized=True), expected
+        )
+
+    def test_pretokenized_word_with_whitespace(self):
+        for testcase in [["makan", "nasi\nregex a"], ["makan nasi"], ["makan\tnasi"]]:
+            with self.subTest(testcase=testcase):
+                with self.assertRaises(ValueError):
+                    self.lemmatizer.lemmatize_batch(testcase, pretokenized=True)
+
     # Word lemmatization
     def test_word_lemmatization_with_affix(self):
         testcase = "Pengeluaran"
@@ -0,0 +1,164 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from symspellpy import SymSpell
+
+from aksara._nlp_internal.text_normalizer import (
+    TextNormalizer, get_context_index, get_index_directory, get_index_path, load_sym_spell
+)
+
+
+class SymSpellIndexTest(unittest.TestCase):
+    """Test the persisted SymSpell index of aksara._nlp_internal.text_normalizer"""
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.index_dir = os.path.join(self.temp_dir.name, 'index')
+
+        self.word_list_path = os.path.join(self.temp_dir.name, 'word_list.txt')
+        shutil.copy(
+            os.path.join(os.path.dirname(__file__), 'sample_input', 'word_list.txt'),
+            self.word_list_path
+        )
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        return super().tearDown()
+
+    def test_index_is_written_on_first_load(self):
+        load_sym_spell(self.word_list_path, self.index_dir)
+        self.assertTrue(os.path.exists(get_index_path(self.word_list_path, self.index_dir)))
+
+    def test_index_is_reused(self):
+        load_sym_spell(self.word_list_path, self.index_dir)
+        index_path = get_index_path(self.word_list_path, self.index_dir)
+        modified_time = os.path.getmtime(index_path)
+
+        sym_spell = load_sym_spell(self.word_list_path, self.index_dir)
+
+        self.assertEqual(modified_time, os.path.getmtime(index_path))
+        self.assertIn('sudah', sym_spell.words)
+
+    def test_index_is_rebuilt_when_word_list_changes(self):
+        load_sym_spell(self.word_list_path, self.index_dir)
+        old_index_path = get_index_path(self.word_list_path, self.index_dir)
+
+        with open(self.word_list_path, 'a', encoding='utf-8') as word_list:
+            word_list.write('tidur\n')
+
+        sym_spell = load_sym_spell(self.word_list_path, self.index_dir)
+
+        self.assertIn('tidur', sym_spell.words)
+        self.assertNotEqual(old_index_path, get_index_path(self.word_list_path, self.index_dir))
+        self.assertFalse(os.path.exists(old_index_path))
+
+    def test_index_directory_is_per_user(self):
+        with patch.dict(os.environ, {'XDG_CACHE_HOME': self.temp_dir.name}):
+            os.environ.pop('AKSARA_CACHE_DIR', None)
+            self.assertEqual(os.path.join(self.temp_dir.name, 'aksara'), get_index_directory())
+
+            load_sym_spell(self.word_list_path)
+            self.assertTrue(os.path.exists(get_index_path(self.word_list_path)))
+
+            os.environ['AKSARA_CACHE_DIR'] = self.index_dir
+            self.assertEqual(self.index_dir, get_index_directory())
+
+    def test_unwritable_index_directory_is_logged(self):
+        not_a_directory = os.path.join(self.temp_dir.name, 'file')
+        open(not_a_directory, 'w', encoding='utf-8').close()
+
+        with self.assertLogs('aksara._nlp_internal.text_normalizer', 'WARNING'):
+            sym_spell = load_sym_spell(self.word_list_path, os.path.join(not_a_directory, 'index'))
+
+        self.assertIn('makan', sym_spell.words)
+
+    def test_corrupted_index_is_rebuilt(self):
+        os.makedirs(self.index_dir)
+        with open(get_index_path(self.word_list_path, self.index_dir), 'wb') as index:
+            index.write(b'not a pickle')
+
+        sym_spell = load_sym_spell(self.word_list_path, self.index_dir)
+        self.assertIn('makan', sym_spell.words)
+
+    def test_normalize_with_loaded_index(self):
+        TextNormalizer(self.word_list_path, self.index_dir)
+        normalizer = TextNormalizer(self.word_list_path, self.index_dir)
+
+        self.assertEqual('sudah', normalizer.normalize_symspell('udh', 'selamat'))
+        self.assertEqual('xyzxyzxyz', normalizer.normalize_symspell('xyzxyzxyz'))
+
+    def test_context_index(self):
+        context_index = get_context_index()
+
+        self.assertEqual(2, context_index[('selamat', 'ulang')])
+        self.assertEqual(1, context_index[('selamat', 'sudah')])
+        self.assertNotIn(('selamat', 'makan'), context_index)
+
+    def test_first_context_match_is_used_by_default(self):
+        normalizer = TextNormalizer(self.word_list_path, self.index_dir)
+
+        # 'sudah' is the closest candidate, 'ulang' occurs more often after 'selamat'
+        self.assertEqual('sudah', normalizer.normalize_symspell('sudahg', 'selamat'))
+
+    def test_rank_by_frequency(self):
+        normalizer = TextNormalizer(self.word_list_path, self.index_dir, escalate=False)
+
+        self.assertEqual(
+            'ulang',
+            normalizer.normalize_symspell('sudahg', 'selamat', rank_by_frequency=True)
+        )
+
+    def test_no_context_match(self):
+        normalizer = TextNormalizer(self.word_list_path, self.index_dir)
+        self.assertEqual('udh', normalizer.normalize_symspell('udh', 'makan', ''))
+
+    def test_escalation_stops_at_closest_confirmed_distance(self):
+        normalizer = TextNormalizer(self.word_list_path, self.index_dir)
+
+        # 'sudah' (distance 1) is confirmed before 'ulang' (distance 3) is looked up
+        self.assertEqual(
+            'sudah',
+            normalizer.normalize_symspell('sudahg', 'selamat', rank_by_frequency=True)
+        )
+
+    def test_escalation_reaches_max_distance(self):
+        normalizer = TextNormalizer(self.word_list_path, self.index_dir)
+        self.assertEqual('ulang', normalizer.normalize_symspell('ulxyz', 'selamat'))
+
+    def test_normalization_is_memoized(self):
+        normalizer = TextNormalizer(self.word_list_path, self.index_dir, cache_size=2)
+
+        normalizer.normalize_symspell('udh', 'selamat')
+        normalizer.normalize_symspell('udh\n', 'selamat')
+        normalizer.normalize_symspell('udh', 'tahun')
+
+        cache_info = normalizer.cache_info()
+        self.assertEqual(1, cache_info.hits)
+        self.assertEqual(2, cache_info.misses)
+        self.assertEqual(2, cache_info.maxsize)
+
+        normalizer.cache_clear()
+        self.assertEqual(0, normalizer.cache_info().currsize)
+
+    def test_suggestions_are_shared_by_contexts(self):
+        normalizer = TextNormalizer(self.word_list_path, self.index_dir)
+
+        with patch.object(SymSpell, 'lookup', autospec=True, side_effect=SymSpell.lookup) as lookup:
+            # 'tahun' only confirms 'ulang', so every distance is looked up
+            self.assertEqual('ulang', normalizer.normalize_symspell('sudahg', 'tahun'))
+            n_lookups = lookup.call_count
+            self.assertEqual('sudah', normalizer.normalize_symspell('sudahg', 'selamat'))
+
+        self.assertEqual(n_lookups, lookup.call_count)
+
+    def test_cache_can_be_disabled(self):
+        normalizer = TextNormalizer(self.word_list_path, self.index_dir, cache_size=0)
+
+        normalizer.normalize_symspell('udh', 'selamat')
+        normalizer.normalize_symspell('udh', 'selamat')
+
+        self.assertEqual(0, normalizer.cache_info().hits)
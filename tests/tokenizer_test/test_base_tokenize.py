@@ -40,3 +40,43 @@ class BaseTokenizerTest(TokenizerTestSetUp):
         expected_multiword_input = [["biarlah", "saja"]]
         result = self.tokenizer.tokenize(self.multiword_input)
         self.assertListEqual(expected_multiword_input, result)
+
+    def test_tokenize_spans_are_offsets_into_original_text(self):
+        text = "  Ani suka apel.\n\tBeni  suka tidur "
+        result = self.tokenizer.tokenize_spans(text)
+
+        self.assertListEqual(self.tokenizer.tokenize(text), [spans.tokens() for spans in result])
+        for spans in result:
+            for i, (start, end) in enumerate(spans):
+                self.assertEqual(spans[i], text[start:end])
+        self.assertEqual((2, 5), list(result[0])[0])
+
+    def test_tokenize_spans_empty_input(self):
+        self.assertListEqual([], self.tokenizer.tokenize_spans("   "))
+
+    def test_tokenize_batch(self):
+        texts = [self.one_sentence, "", self.multiple_sentence]
+
+        self.assertListEqual(
+            [self.expected_one_sentence, [], self.expected_multiple_sentence],
+            self.tokenizer.tokenize_batch(texts)
+        )
+        self.assertListEqual(
+            [self.tokenizer.tokenize_spans(text, ssplit=False) for text in texts],
+            self.tokenizer.tokenize_batch(texts, ssplit=False, spans=True)
+        )
+
+    def test_internal_spans_match_whitespace_normalized_tokens(self):
+        tokenizer = _internal_tokenizer.BaseTokenizer()
+
+        cases = {
+            "Ani suka apel.": (["Ani", "suka", "apel", "."], [False, False, True, False]),
+            " a\t+\nb ": (["a", "b"], [False, False]),
+            "I'm\t\tdi (sini)": (["I", "'m ", "di", "(", "sini", ")"],
+                                 [True, True, False, True, True, False]),
+            "it's": (["it", "'", "s"], [True, True, False]),
+            "": ([], [False]),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(expected, tokenizer.tokenize(text))
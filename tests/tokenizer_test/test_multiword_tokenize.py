@@ -3,7 +3,7 @@ from unittest.mock import patch, Mock
 from tests.tokenizer_test.tokenizer_test_setup import TokenizerTestSetUp
 
 import aksara.tokenizers
-from aksara._nlp_internal.core import analyze_sentence
+from aksara._nlp_internal.core import analyze_tokens
 from aksara.tokenizers import MultiwordTokenizer
 
 
@@ -16,27 +16,27 @@ class MultiWordTokenizerTest(TokenizerTestSetUp):
         self.tokenizer = MultiwordTokenizer()
 
     @patch(
-        target= aksara.tokenizers.multiword_tokenizer.__name__ + "." + analyze_sentence.__name__
+        target= aksara.tokenizers.multiword_tokenizer.__name__ + "." + analyze_tokens.__name__
     )
-    def test_must_not_call_analyze_sentence_for_empty_input(self, mock: Mock):
+    def test_must_not_call_analyze_tokens_for_empty_input(self, mock: Mock):
         word_list = self.tokenizer.tokenize("")
 
         mock.assert_not_called()
         self.assertEqual([], word_list)
 
     @patch(
-        target= aksara.tokenizers.multiword_tokenizer.__name__ + "." + analyze_sentence.__name__
+        target= aksara.tokenizers.multiword_tokenizer.__name__ + "." + analyze_tokens.__name__
     )
-    def test_must_not_call_analyze_sentence_for_whitespace_only_input(self, mock: Mock):
+    def test_must_not_call_analyze_tokens_for_whitespace_only_input(self, mock: Mock):
         word_list = self.tokenizer.tokenize(" ")
 
         mock.assert_not_called()
         self.assertEqual([], word_list)
 
     @patch(
-        target= aksara.tokenizers.multiword_tokenizer.__name__ + "." + analyze_sentence.__name__
+        target= aksara.tokenizers.multiword_tokenizer.__name__ + "." + analyze_tokens.__name__
     )
-    def test_should_call_analyze_sentence_when_input_contains_words(self, mock: Mock):
+    def test_should_call_analyze_tokens_when_input_contains_words(self, mock: Mock):
         self.tokenizer.tokenize("sebuah kata")
 
         mock.assert_called_once()